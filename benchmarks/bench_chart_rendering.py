@@ -0,0 +1,101 @@
+"""Benchmark: pack generation time vs. number of rates, sequential vs. parallel charts.
+
+Builds forecast results from a synthetic dataset, widens them to ``--rates``
+rate columns, and times ``ReporterAgent.package`` (charts + workbook +
+narratives) with charts rendered in-process (``workers=1``) and in the
+chart process pool.  The pool is warmed up first; its one-off start-up
+cost is reported separately.  The chart cache is turned off so every run
+really draws; ``--cached`` instead times repeat packs served from a warm cache.
+
+Usage:
+    python benchmarks/bench_chart_rendering.py --rates 4 8 16 32 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from indirectrates import reporting
+from indirectrates.agents import AnalystAgent, PlannerAgent, ReporterAgent
+from indirectrates.config import default_rate_config
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+from indirectrates.types import ForecastResult
+
+
+def _results(months: int) -> list[ForecastResult]:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        generate_synthetic_dataset(data_dir, SynthSpec(start="2024-01", months=months, projects=5, seed=3))
+        plan = PlannerAgent().plan(None, 12, 3, events_path=data_dir / "Scenario_Events.csv")
+        return AnalystAgent().run(input_dir=data_dir, config=default_rate_config(), plan=plan)
+
+
+def _widen(results: list[ForecastResult], rates: int) -> list[ForecastResult]:
+    """Copies of each result with ``rates`` rate columns (jittered copies of the real ones)."""
+    rng = np.random.default_rng(0)
+    widened = []
+    for res in results:
+        cols = {}
+        ytd_cols = {}
+        for i in range(rates):
+            src = res.rates.columns[i % len(res.rates.columns)]
+            name = f"{src} {i}"
+            cols[name] = res.rates[src] * (1 + rng.normal(0, 0.02))
+            if res.ytd_rates is not None:
+                ytd_cols[name] = res.ytd_rates[src] * (1 + rng.normal(0, 0.02))
+        rates_df = res.rates.assign(**cols)[list(cols)]
+        ytd_df = res.ytd_rates.assign(**ytd_cols)[list(ytd_cols)] if res.ytd_rates is not None else None
+        widened.append(replace(res, rates=rates_df, ytd_rates=ytd_df))
+    return widened
+
+
+def _time_pack(results: list[ForecastResult], chart_workers: int, repeat: int) -> list[float]:
+    os.environ["CHART_WORKERS"] = str(chart_workers)  # read by save_rate_charts on every call
+    timings = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.perf_counter()
+            ReporterAgent().package(out_dir=Path(tmp), results=results)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rates", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cached", action="store_true", help="time repeat packs against a warm chart cache")
+    args = parser.parse_args()
+
+    cache_dir = tempfile.TemporaryDirectory()
+    reporting.chart_cache = reporting.ChartCache(cache_dir.name, max_bytes=(1 << 30) if args.cached else 0)
+
+    base = _results(args.months)
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        reporting.save_rate_charts(tmp, _widen(base, args.workers), workers=args.workers)
+    print(f"scenarios: {len(base)}  chart pool start-up: {time.perf_counter() - started:.2f} s")
+
+    print(f"{'rates':>5}  {'sequential':>12}  {f'{args.workers} workers':>12}  speed-up")
+    for rates in args.rates:
+        results = _widen(base, rates)
+        if args.cached:
+            _time_pack(results, 1, 1)  # fill the cache
+        seq = statistics.median(_time_pack(results, 1, args.repeat))
+        par = statistics.median(_time_pack(results, args.workers, args.repeat))
+        print(f"{rates:5d}  {seq:10.2f} s  {par:10.2f} s  {seq / par:7.2f}x")
+    cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
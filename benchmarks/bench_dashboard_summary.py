@@ -0,0 +1,126 @@
+"""Benchmark: round trips and latency of db.get_dashboard_summary vs. the per-FY loop.
+
+Needs a reachable Postgres (DATABASE_URL / POSTGRES_URL_NON_POOLING).  Seeds
+``--fiscal-years`` fiscal years under a throwaway user, measures both
+implementations, then deletes the seeded rows.
+
+Usage:
+    python benchmarks/bench_dashboard_summary.py --fiscal-years 50 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from typing import Any
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+
+from indirectrates import db
+
+
+class _CountingCursor(psycopg2.extras.RealDictCursor):
+    def execute(self, query: Any, vars: Any = None) -> None:
+        self.connection.round_trips += 1
+        super().execute(query, vars)
+
+
+class _CountingConnection(psycopg2.extensions.connection):
+    round_trips = 0
+
+    def cursor(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("cursor_factory", _CountingCursor)
+        return super().cursor(*args, **kwargs)
+
+
+def _legacy_summary(conn: psycopg2.extensions.connection, user_id: str) -> list[dict[str, Any]]:
+    """The original implementation: ten COUNT(*) queries per fiscal year."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT * FROM fiscal_years WHERE user_id = %s ORDER BY start_month DESC", (user_id,))
+        out = []
+        for fy in cur.fetchall():
+            counts: dict[str, Any] = {"id": fy["id"]}
+            for table in ("rate_groups", "pool_groups", "chart_of_accounts", "scenarios", "revenue_data"):
+                cur.execute(f"SELECT COUNT(*) AS c FROM {table} WHERE fiscal_year_id = %s", (fy["id"],))
+                counts[table] = cur.fetchone()["c"]
+            cur.execute(
+                """SELECT COUNT(*) AS c FROM gl_account_mappings gm
+                   JOIN pools p ON gm.pool_id = p.id
+                   JOIN pool_groups pg ON p.pool_group_id = pg.id
+                   WHERE pg.fiscal_year_id = %s""",
+                (fy["id"],),
+            )
+            counts["gl_mappings"] = cur.fetchone()["c"]
+            cur.execute(
+                "SELECT COUNT(*) AS c, MAX(created_at) AS latest FROM forecast_runs WHERE fiscal_year_id = %s",
+                (fy["id"],),
+            )
+            counts["forecast_runs"] = cur.fetchone()["c"]
+            for rt in ("budget", "provisional", "threshold"):
+                cur.execute(
+                    "SELECT COUNT(*) AS c FROM budget_provisional_rates WHERE fiscal_year_id = %s AND rate_type = %s",
+                    (fy["id"], rt),
+                )
+                counts[rt] = cur.fetchone()["c"]
+            out.append(counts)
+    return out
+
+
+def _seed(conn: psycopg2.extensions.connection, user_id: str, fiscal_years: int) -> None:
+    for i in range(fiscal_years):
+        fy_id = db.create_fiscal_year(conn, f"BENCH-{i:03d}", f"{2000 + i}-01", f"{2000 + i}-12", user_id=user_id)
+        rg_id = db.create_rate_group(conn, fy_id, "Primary")
+        for order, name in enumerate(["Fringe", "Overhead", "G&A"]):
+            pg_id = db.create_pool_group(conn, fy_id, name, display_order=order, rate_group_id=rg_id)
+            db.create_pool(conn, pg_id, f"{name} Pool")
+        db.create_scenario(conn, fy_id, "Base")
+
+
+def _time(fn: Any, conn: _CountingConnection, repeat: int) -> tuple[int, list[float]]:
+    timings = []
+    for _ in range(repeat):
+        conn.round_trips = 0
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return conn.round_trips, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fiscal-years", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    user_id = f"bench-{uuid.uuid4().hex[:12]}"
+    db.init_db()
+    conn = psycopg2.connect(db.database_url(), connection_factory=_CountingConnection)
+    try:
+        _seed(conn, user_id, args.fiscal_years)
+        conn.commit()
+
+        rows = {
+            "single query": _time(lambda: db.get_dashboard_summary(conn, user_id=user_id), conn, args.repeat),
+            "per-FY loop": _time(lambda: _legacy_summary(conn, user_id), conn, args.repeat),
+        }
+        print(f"fiscal years: {args.fiscal_years}  repeat: {args.repeat}")
+        for label, (round_trips, timings) in rows.items():
+            print(
+                f"{label:>13}: {round_trips:5d} round trips  "
+                f"median {statistics.median(timings) * 1000:8.2f} ms  "
+                f"max {max(timings) * 1000:8.2f} ms"
+            )
+    finally:
+        conn.rollback()
+        with db.transaction(conn):
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM fiscal_years WHERE user_id = %s", (user_id,))
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Load test: latency of lightweight endpoints while several forecasts run.
+
+Starts the API in-process under uvicorn, fires ``--forecasts`` concurrent
+upload-mode ``/forecast`` requests built from a synthetic dataset, and polls
+``/healthz`` throughout.  Reports p50/p99/max health-check latency and the
+forecast wall time.  ``--inline`` runs the pipeline on the event loop, as the
+handler did before ``forecast_pool``, for comparison.  No database needed.
+
+Usage:
+    python benchmarks/bench_forecast_concurrency.py --forecasts 4 --months 36 --projects 40
+    python benchmarks/bench_forecast_concurrency.py --forecasts 4 --inline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import uvicorn
+
+from indirectrates import server
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+
+_UPLOADS = {
+    "gl_actuals": "GL_Actuals.csv",
+    "account_map": "Account_Map.csv",
+    "direct_costs": "Direct_Costs_By_Project.csv",
+    "scenario_events": "Scenario_Events.csv",
+}
+
+
+class _InlinePool:
+    """The pre-pool behaviour: the whole pipeline runs on the event loop."""
+
+    max_workers = 0
+
+    async def run(self, fn: Any, *args: Any) -> Any:
+        return fn(*args)
+
+    def shutdown(self, wait: bool = False) -> None:
+        pass
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def _load(
+    base_url: str, data_dir: Path, forecasts: int, interval: float
+) -> tuple[list[float], list[float], list[int]]:
+    uploads = {field: (name, (data_dir / name).read_bytes()) for field, name in _UPLOADS.items()}
+    health: list[float] = []
+    durations: list[float] = []
+    statuses: list[int] = []
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=600) as client:
+
+        async def one_forecast() -> None:
+            started = time.perf_counter()
+            resp = await client.post("/forecast", files=uploads)
+            durations.append(time.perf_counter() - started)
+            statuses.append(resp.status_code)
+
+        async def poll_health(done: asyncio.Event) -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/healthz")
+                health.append(time.perf_counter() - started)
+                await asyncio.sleep(interval)
+
+        done = asyncio.Event()
+        poller = asyncio.create_task(poll_health(done))
+        await asyncio.gather(*(one_forecast() for _ in range(forecasts)))
+        done.set()
+        await poller
+    return health, durations, statuses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--forecasts", type=int, default=4)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between health checks")
+    parser.add_argument("--inline", action="store_true", help="run forecasts on the event loop (old behaviour)")
+    args = parser.parse_args()
+
+    server.limiter.enabled = False
+    if args.inline:
+        server.forecast_pool = _InlinePool()
+
+    port = _free_port()
+    uv = uvicorn.Server(uvicorn.Config(server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=uv.run, daemon=True)
+    thread.start()
+    while not uv.started:
+        time.sleep(0.05)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            spec = SynthSpec(start="2023-01", months=args.months, projects=args.projects, seed=7)
+            generate_synthetic_dataset(data_dir, spec)
+            health, durations, statuses = asyncio.run(
+                _load(f"http://127.0.0.1:{port}", data_dir, args.forecasts, args.interval)
+            )
+    finally:
+        uv.should_exit = True
+        thread.join()
+
+    mode = "inline (event loop)" if args.inline else f"forecast_pool ({server.forecast_pool.max_workers} workers)"
+    print(f"mode: {mode}  forecasts: {args.forecasts}  statuses: {sorted(statuses)}")
+    print(f"forecast wall time: median {statistics.median(durations):6.2f} s  max {max(durations):6.2f} s")
+    print(
+        f"/healthz ({len(health)} requests): "
+        f"p50 {_percentile(health, 50) * 1000:8.2f} ms  "
+        f"p99 {_percentile(health, 99) * 1000:8.2f} ms  "
+        f"max {max(health) * 1000:8.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
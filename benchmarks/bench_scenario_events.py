@@ -0,0 +1,136 @@
+"""Benchmark: vectorized apply_scenario_events vs. the original per-event loop.
+
+Usage:
+    python benchmarks/bench_scenario_events.py --events 10000 --projects 30 --months 48
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from indirectrates.model import Projection, apply_scenario_events, build_baseline_projection
+
+_DIRECT_COLS = [
+    ("DirectLabor$", "DeltaDirectLabor$"),
+    ("DirectLaborHrs", "DeltaDirectLaborHrs"),
+    ("Subk", "DeltaSubk"),
+    ("ODC", "DeltaODC"),
+    ("Travel", "DeltaTravel"),
+]
+
+
+def _baseline(months: int, projects: int, forecast_months: int) -> Projection:
+    rng = np.random.default_rng(0)
+    periods = pd.period_range("2022-01", periods=months, freq="M")
+    pools = pd.DataFrame(
+        {name: rng.uniform(50_000, 150_000, months) for name in ["Fringe", "Overhead", "G&A"]},
+        index=periods,
+    )
+    direct = pd.DataFrame(
+        [
+            {
+                "Period": p,
+                "Project": f"P{j:03d}",
+                "DirectLabor$": rng.uniform(50_000, 150_000),
+                "DirectLaborHrs": rng.uniform(500, 1500),
+                "Subk": rng.uniform(0, 40_000),
+                "ODC": rng.uniform(0, 10_000),
+                "Travel": rng.uniform(0, 5_000),
+            }
+            for p in periods
+            for j in range(projects)
+        ]
+    )
+    by_period = direct.groupby("Period")[["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]].sum()
+    bases = pd.DataFrame(
+        {
+            "DL": by_period["DirectLabor$"],
+            "DLH": by_period["DirectLaborHrs"],
+            "TL": by_period["DirectLabor$"],
+            "TCI": by_period[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1),
+        }
+    )
+    return build_baseline_projection(pools, bases, direct, forecast_months=forecast_months, run_rate_months=3)
+
+
+def _events(n: int, baseline: Projection) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    periods = baseline.pools.index
+    projects = sorted(baseline.direct_by_project["Project"].unique())
+    events = pd.DataFrame(
+        {
+            "Scenario": "Bench",
+            "EffectivePeriod": periods[rng.integers(0, len(periods), n)],
+            "Type": "HIRE",
+            "Project": [projects[i] for i in rng.integers(0, len(projects), n)],
+            "DeltaPoolFringe": rng.normal(0, 1_000, n),
+            "DeltaPoolOverhead": rng.normal(0, 1_000, n),
+            "DeltaPoolGA": rng.normal(0, 1_000, n),
+        }
+    )
+    for _, delta_col in _DIRECT_COLS:
+        events[delta_col] = rng.normal(0, 2_000, n)
+    return events
+
+
+def _loop_apply(projection: Projection, events: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """The original row-by-row event application, kept here as the benchmark baseline."""
+    pools = projection.pools.copy()
+    direct = projection.direct_by_project.copy()
+    pool_delta_map = {
+        c: ("G&A" if c[len("DeltaPool"):] == "GA" else c[len("DeltaPool"):])
+        for c in events.columns
+        if c.startswith("DeltaPool")
+    }
+    for _, event in events.iterrows():
+        eff = event["EffectivePeriod"]
+        applicable_periods = pools.index[pools.index >= eff]
+        if len(applicable_periods) == 0:
+            continue
+        for delta_col, pool_name in pool_delta_map.items():
+            pools.loc[applicable_periods, pool_name] += float(event[delta_col])
+        project = str(event["Project"] or "").strip()
+        if project:
+            mask = (direct["Project"] == project) & (direct["Period"] >= eff)
+            for col, delta_col in _DIRECT_COLS:
+                direct.loc[mask, col] = direct.loc[mask, col].fillna(0.0) + float(event[delta_col])
+    return pools, direct
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--projects", type=int, default=30)
+    parser.add_argument("--months", type=int, default=48)
+    parser.add_argument("--forecast-months", type=int, default=12)
+    parser.add_argument("--skip-loop", action="store_true", help="Only time the vectorized engine.")
+    args = parser.parse_args()
+
+    baseline = _baseline(args.months, args.projects, args.forecast_months)
+    events = _events(args.events, baseline)
+
+    start = time.perf_counter()
+    proj = apply_scenario_events(baseline, events, scenario="Bench")
+    vectorized = time.perf_counter() - start
+    print(f"vectorized: {args.events:>7,} events  {vectorized * 1000:10.1f} ms")
+
+    if args.skip_loop:
+        return
+
+    start = time.perf_counter()
+    exp_pools, exp_direct = _loop_apply(baseline, events)
+    loop = time.perf_counter() - start
+    print(f"loop:       {args.events:>7,} events  {loop * 1000:10.1f} ms")
+    print(f"speedup:    {loop / vectorized:.1f}x")
+
+    pd.testing.assert_frame_equal(proj.pools, exp_pools, check_exact=False, rtol=1e-9, atol=1e-6)
+    pd.testing.assert_frame_equal(proj.direct_by_project, exp_direct, check_exact=False, rtol=1e-9, atol=1e-6)
+    print("results match the per-event loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark: peak memory of N scenarios sharing one baseline projection.
+
+Each scenario count runs in a fresh child process so peak RSS is not carried over
+between measurements.
+
+Usage:
+    python benchmarks/bench_scenario_memory.py --scenarios 1 10 50 --projects 30 --months 48
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_scenario_events import _baseline, _events  # noqa: E402
+
+from indirectrates.config import default_rate_config  # noqa: E402
+from indirectrates.model import apply_scenario_events, compute_rates_and_impacts  # noqa: E402
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _child(scenarios: int, events_per_scenario: int, projects: int, months: int, forecast_months: int) -> None:
+    baseline = _baseline(months, projects, forecast_months)
+    events = pd.concat(
+        [_events(events_per_scenario, baseline).assign(Scenario=f"S{i}") for i in range(scenarios)],
+        ignore_index=True,
+    )
+    config = default_rate_config()
+    rss_before = _peak_rss_mb()
+
+    tracemalloc.start()
+    results = []
+    for i in range(scenarios):
+        proj = apply_scenario_events(baseline, events, scenario=f"S{i}")
+        rates, impacts, _ = compute_rates_and_impacts(proj, config)
+        results.append((proj, rates, impacts))
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    shared = sum(
+        np.shares_memory(proj.direct_by_project["Project"].to_numpy(), baseline.direct_by_project["Project"].to_numpy())
+        for proj, _, _ in results
+    )
+    print(
+        f"{scenarios:>5} scenarios  peak RSS {_peak_rss_mb():8.1f} MB"
+        f"  (+{_peak_rss_mb() - rss_before:6.1f} MB)  traced peak {traced_peak / 2**20:8.1f} MB"
+        f"  Project column shared {shared}/{scenarios}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--events-per-scenario", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=30)
+    parser.add_argument("--months", type=int, default=48)
+    parser.add_argument("--forecast-months", type=int, default=12)
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sizing = [args.events_per_scenario, args.projects, args.months, args.forecast_months]
+    if args.child is not None:
+        _child(args.child, *sizing)
+        return
+
+    for n in args.scenarios:
+        cmd = [sys.executable, __file__, "--child", str(n)]
+        cmd += ["--events-per-scenario", str(sizing[0]), "--projects", str(sizing[1])]
+        cmd += ["--months", str(sizing[2]), "--forecast-months", str(sizing[3])]
+        subprocess.run(cmd, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 import pandas as pd
@@ -8,11 +9,11 @@ import pandas as pd
 from .config import RateConfig
 from .io import load_inputs
 from .mapping import map_accounts_to_pools
-from .model import apply_scenario_events, build_baseline_projection, compute_actual_aggregates, compute_rates_and_impacts
-from .normalize import normalize_inputs
+from .model import Projection, apply_scenario_events, build_baseline_projection, compute_actual_aggregates, compute_rates_and_impacts
+from .normalize import normalize_inputs, normalize_scenario_events
 from .narrative_ai import write_ai_narrative
 from .reporting import save_rate_charts, write_assumptions, write_excel_pack, write_narrative
-from .types import ForecastResult
+from .types import ActualAggregates, ForecastResult, Inputs
 
 
 @dataclass(frozen=True)
@@ -24,14 +25,19 @@ class ScenarioPlan:
 
 
 class PlannerAgent:
-    def plan(self, scenario: str | None, forecast_months: int, run_rate_months: int, events_path: Path) -> ScenarioPlan:
+    def plan(
+        self,
+        scenario: str | None,
+        forecast_months: int,
+        run_rate_months: int,
+        events_path: Path | None = None,
+        events: pd.DataFrame | None = None,
+    ) -> ScenarioPlan:
         scenarios: list[str]
         if scenario:
             scenarios = [scenario]
         else:
-            import pandas as pd
-
-            ev = pd.read_csv(events_path)
+            ev = events if events is not None else pd.read_csv(events_path)
             if "Scenario" in ev.columns:
                 scenarios = sorted({str(x) for x in ev["Scenario"].fillna("Base").unique()})
             else:
@@ -42,12 +48,18 @@ class PlannerAgent:
 class AnalystAgent:
     def run(
         self,
-        input_dir: Path,
+        input_dir: Path | Inputs,
         config: RateConfig,
         plan: ScenarioPlan,
         entity: str | None = None,
+        workers: int = 1,
     ) -> list[ForecastResult]:
-        inputs = load_inputs(input_dir)
+        """Run every scenario in ``plan``; ``workers > 1`` computes scenarios in a process pool.
+
+        ``input_dir`` is either a directory of input CSVs or already-built ``Inputs``
+        (e.g. loaded straight from the database).
+        """
+        inputs = input_dir if isinstance(input_dir, Inputs) else load_inputs(input_dir)
         gl, mp, direct, events, warnings = normalize_inputs(
             inputs.gl_actuals, inputs.account_map, inputs.direct_costs, inputs.scenario_events
         )
@@ -58,11 +70,36 @@ class AnalystAgent:
             gl_mapped, direct, config, entity=entity
         )
         warnings.extend(agg_warnings)
+        actuals = ActualAggregates(actual_pools, actual_bases, direct_by_project, warnings)
+        return self._forecast(actuals, events, config, plan, entity, workers)
+
+    def run_from_actuals(
+        self,
+        actuals: ActualAggregates,
+        scenario_events: pd.DataFrame,
+        config: RateConfig,
+        plan: ScenarioPlan,
+        entity: str | None = None,
+        workers: int = 1,
+    ) -> list[ForecastResult]:
+        """Like ``run``, but starting from already-aggregated actuals (e.g. ``aggregate_store``)."""
+        events, warnings = normalize_scenario_events(scenario_events)
+        actuals = replace(actuals, warnings=warnings + list(actuals.warnings))
+        return self._forecast(actuals, events, config, plan, entity, workers)
 
+    def _forecast(
+        self,
+        actuals: ActualAggregates,
+        events: pd.DataFrame,
+        config: RateConfig,
+        plan: ScenarioPlan,
+        entity: str | None,
+        workers: int,
+    ) -> list[ForecastResult]:
         baseline = build_baseline_projection(
-            actual_pools,
-            actual_bases,
-            direct_by_project,
+            actuals.pools,
+            actuals.bases,
+            actuals.direct_by_project,
             forecast_months=plan.forecast_months,
             run_rate_months=plan.run_rate_months,
         )
@@ -70,30 +107,61 @@ class AnalystAgent:
         # Determine fy_start: explicit from plan, or fallback to earliest actual period
         fy_start = plan.fy_start
         if fy_start is None:
-            fy_start = actual_pools.index.min()
-
-        results: list[ForecastResult] = []
-        for scenario in plan.scenarios:
-            proj = apply_scenario_events(baseline, events, scenario=scenario, config=config)
-            rates, impacts, ytd_rates = compute_rates_and_impacts(proj, config, fy_start=fy_start)
-            assumptions = dict(proj.assumptions)
-            assumptions["fy_start"] = str(fy_start)
-            if entity:
-                assumptions["entity"] = entity
-            results.append(
-                ForecastResult(
-                    scenario=scenario,
-                    periods=rates.index,
-                    pools=proj.pools,
-                    bases=proj.bases,
-                    rates=rates,
-                    project_impacts=impacts,
-                    assumptions=assumptions,
-                    warnings=list(dict.fromkeys(warnings + proj.warnings)),
-                    ytd_rates=ytd_rates,
-                )
-            )
-        return results
+            fy_start = actuals.pools.index.min()
+
+        state = _ScenarioState(baseline, events, config, fy_start, entity, list(actuals.warnings))
+        workers = min(workers, len(plan.scenarios))
+        if workers <= 1:
+            return [_run_scenario(state, scenario) for scenario in plan.scenarios]
+
+        # The baseline is pickled once per worker (via the initializer), not once per scenario.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_scenario_worker, initargs=(state,)) as pool:
+            return list(pool.map(_run_scenario_in_worker, plan.scenarios))
+
+
+@dataclass(frozen=True)
+class _ScenarioState:
+    """Everything a scenario pass needs once the baseline has been built."""
+
+    baseline: Projection
+    events: pd.DataFrame
+    config: RateConfig
+    fy_start: pd.Period
+    entity: str | None
+    warnings: list[str]
+
+
+_WORKER_STATE: _ScenarioState | None = None
+
+
+def _init_scenario_worker(state: _ScenarioState) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _run_scenario_in_worker(scenario: str) -> ForecastResult:
+    assert _WORKER_STATE is not None, "scenario worker was not initialized"
+    return _run_scenario(_WORKER_STATE, scenario)
+
+
+def _run_scenario(state: _ScenarioState, scenario: str) -> ForecastResult:
+    proj = apply_scenario_events(state.baseline, state.events, scenario=scenario, config=state.config)
+    rates, impacts, ytd_rates = compute_rates_and_impacts(proj, state.config, fy_start=state.fy_start)
+    assumptions = dict(proj.assumptions)
+    assumptions["fy_start"] = str(state.fy_start)
+    if state.entity:
+        assumptions["entity"] = state.entity
+    return ForecastResult(
+        scenario=scenario,
+        periods=rates.index,
+        pools=proj.pools,
+        bases=proj.bases,
+        rates=rates,
+        project_impacts=impacts,
+        assumptions=assumptions,
+        warnings=list(dict.fromkeys(state.warnings + proj.warnings)),
+        ytd_rates=ytd_rates,
+    )
 
 
 class ReporterAgent:
@@ -0,0 +1,204 @@
+"""Incrementally maintained actual aggregates for DB-mode forecasts.
+
+Monthly close typically appends one period of GL and direct-cost entries,
+yet a full rebuild re-reads and re-aggregates every row of the fiscal
+year's history.  This store keeps each fiscal year's per-period pools,
+bases and direct-by-project actuals in memory together with a signature of
+the source rows behind every period (``db.entry_period_signatures``: row
+count and latest change).  On each request only the signatures are read;
+periods whose signature changed, appeared or disappeared are re-read from
+the trigger-maintained ``gl_period_totals`` / ``direct_cost_period_totals``
+tables and re-aggregated with ``model.aggregate_period_actuals`` and spliced
+into the stored frames, which then feed ``build_baseline_projection`` directly
+via ``AnalystAgent.run_from_actuals``.
+
+Entries are keyed by ``(user_id, fiscal_year_id, config_version, entity)``:
+any mapping or rate-structure edit bumps ``config_version`` and starts a
+fresh entry.  Stored frames are shared between callers and must be treated
+as read-only.
+
+Configuration (environment):
+  AGGREGATE_STORE_MAX_ENTRIES  fiscal-year/entity combinations kept (default 64)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+import psycopg2.extensions
+
+from . import db
+from .config import RateConfig
+from .io import normalize_period_column
+from .mapping import map_accounts_to_pools, unmapped_rows_warning
+from .model import actual_aggregate_warnings, aggregate_period_actuals
+from .types import ActualAggregates
+
+Signatures = dict[str, tuple[int, Any]]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    gl_signatures: Signatures
+    dc_signatures: Signatures
+    pools: pd.DataFrame  # NaN where a period has no rows for a pool
+    bases: pd.DataFrame
+    direct_by_project: pd.DataFrame
+    unmapped: pd.Series  # Period -> GL entries without an account mapping
+
+
+def _to_periods(texts: list[str]) -> dict[str, pd.Period]:
+    if not texts:
+        return {}
+    periods = pd.to_datetime(pd.Series(texts)).dt.to_period("M")
+    return dict(zip(texts, periods))
+
+
+def _changed(old: Signatures, new: Signatures) -> set[str]:
+    return {text for text in old.keys() | new.keys() if old.get(text) != new.get(text)}
+
+
+def _drop_periods(df: pd.DataFrame, periods: set[pd.Period]) -> pd.DataFrame:
+    return df[~df.index.isin(list(periods))]
+
+
+class AggregateStore:
+    """Thread-safe LRU of per-period actual aggregates, refreshed one changed period at a time."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int, int, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.partial_refreshes = 0
+        self.full_builds = 0
+        self.periods_recomputed = 0
+
+    def get(
+        self,
+        conn: psycopg2.extensions.connection,
+        user_id: str,
+        fy: dict[str, Any],
+        config: RateConfig,
+        account_map: pd.DataFrame,
+        entity: str | None = None,
+    ) -> ActualAggregates | None:
+        """Actuals for the fiscal-year row ``fy``, or ``None`` if it has no GL or direct-cost entries.
+
+        ``config`` and ``account_map`` must be the FY's DB-built configuration
+        for ``fy["config_version"]`` (see ``config_cache``).
+        """
+        fy_id = int(fy["id"])
+        key = (user_id, fy_id, int(fy.get("config_version") or 0), entity or "")
+        gl_sigs = db.entry_period_signatures(conn, "gl_entries", user_id, fy_id)
+        dc_sigs = db.entry_period_signatures(conn, "direct_cost_entries", user_id, fy_id)
+        if not gl_sigs or not dc_sigs:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            entry = self._build(conn, user_id, fy_id, config, account_map, entity, gl_sigs, dc_sigs, None)
+            with self._lock:
+                self.full_builds += 1
+        else:
+            changed = _changed(entry.gl_signatures, gl_sigs) | _changed(entry.dc_signatures, dc_sigs)
+            if not changed:
+                with self._lock:
+                    self.hits += 1
+                return self._actuals(entry, config, entity)
+            # Several period spellings can normalize to one month; recompute whole months.
+            known = _to_periods(sorted(entry.gl_signatures.keys() | entry.dc_signatures.keys() | gl_sigs.keys() | dc_sigs.keys()))
+            months = {known[text] for text in changed}
+            entry = self._build(conn, user_id, fy_id, config, account_map, entity, gl_sigs, dc_sigs, (entry, months, known))
+            with self._lock:
+                self.partial_refreshes += 1
+
+        with self._lock:
+            # Older config versions of this FY/entity can never be requested again.
+            for stale in [k for k in self._entries if k[:2] == key[:2] and k[3] == key[3] and k[2] < key[2]]:
+                del self._entries[stale]
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self._actuals(entry, config, entity)
+
+    def _build(
+        self,
+        conn: psycopg2.extensions.connection,
+        user_id: str,
+        fy_id: int,
+        config: RateConfig,
+        account_map: pd.DataFrame,
+        entity: str | None,
+        gl_sigs: Signatures,
+        dc_sigs: Signatures,
+        previous: tuple[_Entry, set[pd.Period], dict[str, pd.Period]] | None,
+    ) -> _Entry:
+        if previous is None:
+            gl_texts = dc_texts = None
+        else:
+            _, months, known = previous
+            gl_texts = [text for text in gl_sigs if known[text] in months]
+            dc_texts = [text for text in dc_sigs if known[text] in months]
+
+        gl = normalize_period_column(db.read_gl_totals_df(conn, user_id, fy_id, periods=gl_texts), "Period")
+        direct = normalize_period_column(db.read_direct_cost_totals_df(conn, user_id, fy_id, periods=dc_texts), "Period")
+        mp = account_map if "IsUnallowable" in account_map.columns else account_map.assign(IsUnallowable=False)
+
+        gl_mapped, _ = map_accounts_to_pools(gl, mp)
+        is_unmapped = ~gl["Account"].astype(str).isin(set(mp["Account"].astype(str)))
+        unmapped = gl["RowCount"].where(is_unmapped, 0).groupby(gl["Period"]).sum()
+        pools, bases, direct_by_project, _ = aggregate_period_actuals(gl_mapped, direct, config, entity)
+        with self._lock:
+            self.periods_recomputed += len(set(gl["Period"]) | set(direct["Period"]))
+
+        if previous is not None:
+            old, months, _ = previous
+            pools = pd.concat([_drop_periods(old.pools, months), pools])
+            pools = pools.dropna(axis=1, how="all")
+            pools = pools[sorted(pools.columns)].sort_index()
+            bases = pd.concat([_drop_periods(old.bases, months), bases]).sort_index()
+            kept = old.direct_by_project[~old.direct_by_project["Period"].isin(list(months))]
+            direct_by_project = pd.concat([kept, direct_by_project], ignore_index=True)
+            direct_by_project = direct_by_project.sort_values("Period", kind="stable", ignore_index=True)
+            unmapped = pd.concat([_drop_periods(old.unmapped, months), unmapped]).sort_index()
+
+        return _Entry(gl_sigs, dc_sigs, pools, bases, direct_by_project, unmapped)
+
+    @staticmethod
+    def _actuals(entry: _Entry, config: RateConfig, entity: str | None) -> ActualAggregates:
+        pools = entry.pools.fillna(0.0)
+        warnings: list[str] = []
+        missing = int(entry.unmapped.sum())
+        if missing:
+            warnings.append(unmapped_rows_warning(missing))
+        warnings.extend(actual_aggregate_warnings(pools, entry.bases, entry.direct_by_project, config, entity))
+        return ActualAggregates(pools, entry.bases, entry.direct_by_project, warnings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "partial_refreshes": self.partial_refreshes,
+                "full_builds": self.full_builds,
+                "periods_recomputed": self.periods_recomputed,
+            }
+
+
+aggregate_store = AggregateStore(max_entries=int(os.environ.get("AGGREGATE_STORE_MAX_ENTRIES", "64")))
@@ -10,10 +10,12 @@ import io
 import os
 import re
 
-from fastapi import APIRouter, BackgroundTasks, File, HTTPException, Request, UploadFile
+from fastapi import APIRouter, File, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from . import db
+from .entry_import import PERIOD_RE, iter_direct_cost_chunks, iter_gl_chunks, run_import
 
 router = APIRouter(prefix="/api")
 
@@ -210,11 +212,12 @@ def _assert_uploaded_file_access(conn, request: Request, file_id: int) -> int:
     return fy_id
 
 
-def _maybe_auto_forecast(background_tasks: BackgroundTasks, user_id: str | None, fy_id: int | None) -> None:
-    """Queue a background DB-mode forecast if user_id and fy_id are present."""
+def _maybe_auto_forecast(user_id: str | None, fy_id: int | None) -> str | None:
+    """Schedule a debounced DB-mode forecast if user_id and fy_id are present; returns the job id."""
     if user_id and fy_id:
-        from .server import _run_db_forecast
-        background_tasks.add_task(_run_db_forecast, user_id, fy_id)
+        from .scheduler import auto_forecasts
+        return auto_forecasts.trigger(user_id, fy_id)
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -465,6 +468,7 @@ def copy_fy_setup(fy_id: int, body: CopyFYSetup, request: Request):
         target = _check_fy_ownership(conn, fy_id, user_id)
         source = _check_fy_ownership(conn, body.source_fy_id, user_id)
         counts = db.copy_fy_setup(conn, body.source_fy_id, fy_id)
+        db.bump_config_version(conn, fy_id)
         return {"ok": True, "source": source["name"], "target": target["name"], **counts}
     finally:
         conn.close()
@@ -490,6 +494,7 @@ def create_rate_group(fy_id: int, body: RateGroupCreate, request: Request):
     try:
         _assert_fy_access(conn, request, fy_id)
         rg_id = db.create_rate_group(conn, fy_id, body.name, body.display_order)
+        db.bump_config_version(conn, fy_id)
         return {"id": rg_id, "fiscal_year_id": fy_id, **body.model_dump()}
     finally:
         conn.close()
@@ -499,12 +504,13 @@ def create_rate_group(fy_id: int, body: RateGroupCreate, request: Request):
 def update_rate_group(rg_id: int, body: RateGroupUpdate, request: Request):
     conn = _conn()
     try:
-        _assert_rate_group_access(conn, request, rg_id)
+        fy_id = _assert_rate_group_access(conn, request, rg_id)
         updates = {k: v for k, v in body.model_dump().items() if v is not None}
         if not updates:
             raise HTTPException(status_code=400, detail="No fields to update")
         if not db.update_rate_group(conn, rg_id, **updates):
             _404("Rate group")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -514,9 +520,10 @@ def update_rate_group(rg_id: int, body: RateGroupUpdate, request: Request):
 def delete_rate_group(rg_id: int, request: Request):
     conn = _conn()
     try:
-        _assert_rate_group_access(conn, request, rg_id)
+        fy_id = _assert_rate_group_access(conn, request, rg_id)
         if not db.delete_rate_group(conn, rg_id):
             _404("Rate group")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -559,6 +566,7 @@ def create_pool_group(fy_id: int, body: PoolGroupCreate, request: Request):
             conn, fy_id, body.name, body.base, body.display_order,
             rate_group_id=body.rate_group_id, cascade_order=body.cascade_order,
         )
+        db.bump_config_version(conn, fy_id)
         return {"id": pg_id, "fiscal_year_id": fy_id, **body.model_dump()}
     finally:
         conn.close()
@@ -578,6 +586,7 @@ def update_pool_group(pg_id: int, body: PoolGroupUpdate, request: Request):
             raise HTTPException(status_code=400, detail="No fields to update")
         if not db.update_pool_group(conn, pg_id, **updates):
             _404("Pool group")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -587,9 +596,10 @@ def update_pool_group(pg_id: int, body: PoolGroupUpdate, request: Request):
 def delete_pool_group(pg_id: int, request: Request):
     conn = _conn()
     try:
-        _assert_pool_group_access(conn, request, pg_id)
+        fy_id = _assert_pool_group_access(conn, request, pg_id)
         if not db.delete_pool_group(conn, pg_id):
             _404("Pool group")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -613,8 +623,9 @@ def list_pools(pg_id: int, request: Request):
 def create_pool(pg_id: int, body: PoolCreate, request: Request):
     conn = _conn()
     try:
-        _assert_pool_group_access(conn, request, pg_id)
+        fy_id = _assert_pool_group_access(conn, request, pg_id)
         pool_id = db.create_pool(conn, pg_id, body.name, body.display_order)
+        db.bump_config_version(conn, fy_id)
         return {"id": pool_id, "pool_group_id": pg_id, **body.model_dump()}
     finally:
         conn.close()
@@ -624,12 +635,13 @@ def create_pool(pg_id: int, body: PoolCreate, request: Request):
 def update_pool(pool_id: int, body: PoolUpdate, request: Request):
     conn = _conn()
     try:
-        _assert_pool_access(conn, request, pool_id)
+        fy_id = _assert_pool_access(conn, request, pool_id)
         updates = {k: v for k, v in body.model_dump().items() if v is not None}
         if not updates:
             raise HTTPException(status_code=400, detail="No fields to update")
         if not db.update_pool(conn, pool_id, **updates):
             _404("Pool")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -639,9 +651,10 @@ def update_pool(pool_id: int, body: PoolUpdate, request: Request):
 def delete_pool(pool_id: int, request: Request):
     conn = _conn()
     try:
-        _assert_pool_access(conn, request, pool_id)
+        fy_id = _assert_pool_access(conn, request, pool_id)
         if not db.delete_pool(conn, pool_id):
             _404("Pool")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -665,7 +678,7 @@ def list_gl_mappings(pool_id: int, request: Request):
 def create_gl_mapping(pool_id: int, body: GLMappingCreate, request: Request):
     conn = _conn()
     try:
-        _assert_pool_access(conn, request, pool_id)
+        fy_id = _assert_pool_access(conn, request, pool_id)
         conflict = db.check_cost_account_conflict(conn, pool_id, body.account)
         if conflict:
             rg_label = conflict["rate_group"] or "this rate structure"
@@ -679,6 +692,7 @@ def create_gl_mapping(pool_id: int, body: GLMappingCreate, request: Request):
                 ),
             )
         m_id = db.create_gl_mapping(conn, pool_id, body.account, body.is_unallowable, body.notes)
+        db.bump_config_version(conn, fy_id)
         return {"id": m_id, "pool_id": pool_id, **body.model_dump()}
     finally:
         conn.close()
@@ -688,9 +702,10 @@ def create_gl_mapping(pool_id: int, body: GLMappingCreate, request: Request):
 def delete_gl_mapping(mapping_id: int, request: Request):
     conn = _conn()
     try:
-        _assert_gl_mapping_access(conn, request, mapping_id)
+        fy_id = _assert_gl_mapping_access(conn, request, mapping_id)
         if not db.delete_gl_mapping(conn, mapping_id):
             _404("GL mapping")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -862,6 +877,8 @@ def list_forecast_runs(fy_id: int, request: Request):
 
 @router.get("/forecast-runs/{run_id}")
 def get_forecast_run(run_id: int, request: Request):
+    from .artifacts import read_manifest
+
     conn = _conn()
     try:
         _assert_forecast_run_access(conn, request, run_id)
@@ -870,6 +887,12 @@ def get_forecast_run(run_id: int, request: Request):
             _404("Forecast run")
         result = {k: v for k, v in run.items() if k != "output_zip"}
         result["zip_size"] = len(run["output_zip"]) if run.get("output_zip") else 0
+        manifest = read_manifest(run_id)
+        result["artifacts"] = (
+            {"frames": manifest["frames"], "scenarios": [sc["name"] for sc in manifest["scenarios"]]}
+            if manifest
+            else None
+        )
         return result
     finally:
         conn.close()
@@ -893,13 +916,55 @@ def download_forecast_run(run_id: int, request: Request):
         conn.close()
 
 
+@router.get("/forecast-runs/{run_id}/frames/{frame}")
+def get_forecast_run_frame(run_id: int, frame: str, request: Request, scenario: str | None = None):
+    from .artifacts import FRAMES, read_run_frame
+
+    if frame not in FRAMES:
+        raise HTTPException(status_code=400, detail=f"Unknown frame '{frame}'. Known: {', '.join(FRAMES)}")
+    conn = _conn()
+    try:
+        _assert_forecast_run_access(conn, request, run_id)
+    finally:
+        conn.close()
+    df = read_run_frame(run_id, frame, scenario=scenario)
+    if df is None:
+        _404("Forecast run artifacts")
+    if "Period" in df.columns:
+        df["Period"] = df["Period"].astype(str)
+    df = df.astype(object).where(df.notna(), None)
+    return {"columns": list(df.columns), "rows": df.to_dict(orient="records")}
+
+
+def _stored_run_results(fy_id: int, run_id: int) -> list:
+    """Results of a saved run of ``fy_id``, read back from its Parquet artifacts."""
+    from .artifacts import artifacts_enabled, load_run_results
+
+    conn = _conn()
+    try:
+        run_fy_id = _resource_fy_id(
+            conn, "SELECT fiscal_year_id FROM forecast_runs WHERE id = %s", (run_id,), "Forecast run"
+        )
+    finally:
+        conn.close()
+    if run_fy_id != fy_id:
+        _404("Forecast run")
+    results = load_run_results(run_id) if artifacts_enabled() else None
+    if not results:
+        _404("Forecast run artifacts")
+    return results
+
+
 @router.delete("/forecast-runs/{run_id}")
 def delete_forecast_run(run_id: int, request: Request):
+    from .artifacts import delete_run_artifacts
+
     conn = _conn()
     try:
         _assert_forecast_run_access(conn, request, run_id)
         if not db.delete_forecast_run(conn, run_id):
             _404("Forecast run")
+        delete_run_artifacts(run_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -1064,8 +1129,9 @@ def list_base_accounts(pg_id: int, request: Request):
 def create_base_account(pg_id: int, body: BaseAccountCreate, request: Request):
     conn = _conn()
     try:
-        _assert_pool_group_access(conn, request, pg_id)
+        fy_id = _assert_pool_group_access(conn, request, pg_id)
         ba_id = db.create_base_account(conn, pg_id, body.account, body.notes)
+        db.bump_config_version(conn, fy_id)
         return {"id": ba_id, "pool_group_id": pg_id, **body.model_dump()}
     finally:
         conn.close()
@@ -1075,9 +1141,10 @@ def create_base_account(pg_id: int, body: BaseAccountCreate, request: Request):
 def delete_base_account(ba_id: int, request: Request):
     conn = _conn()
     try:
-        _assert_base_account_access(conn, request, ba_id)
+        fy_id = _assert_base_account_access(conn, request, ba_id)
         if not db.delete_base_account(conn, ba_id):
             _404("Base account")
+        db.bump_config_version(conn, fy_id)
         return {"ok": True}
     finally:
         conn.close()
@@ -1122,13 +1189,13 @@ def list_scenarios(fy_id: int, request: Request):
 
 
 @router.post("/fiscal-years/{fy_id}/scenarios", status_code=201)
-def create_scenario(fy_id: int, body: ScenarioCreate, request: Request, background_tasks: BackgroundTasks):
+def create_scenario(fy_id: int, body: ScenarioCreate, request: Request):
     conn = _conn()
     try:
         user_id, _ = _assert_fy_access(conn, request, fy_id)
         sid = db.create_scenario(conn, fy_id, body.name, body.description)
-        _maybe_auto_forecast(background_tasks, user_id, fy_id)
-        return {"id": sid, "fiscal_year_id": fy_id, **body.model_dump(), "forecast_triggered": True}
+        job_id = _maybe_auto_forecast(user_id, fy_id)
+        return {"id": sid, "fiscal_year_id": fy_id, **body.model_dump(), "forecast_triggered": True, "forecast_job_id": job_id}
     finally:
         conn.close()
 
@@ -1147,7 +1214,7 @@ def get_scenario(scenario_id: int, request: Request):
 
 
 @router.put("/scenarios/{scenario_id}")
-def update_scenario(scenario_id: int, body: ScenarioUpdate, request: Request, background_tasks: BackgroundTasks):
+def update_scenario(scenario_id: int, body: ScenarioUpdate, request: Request):
     conn = _conn()
     try:
         user_id = get_current_user(request)
@@ -1157,22 +1224,22 @@ def update_scenario(scenario_id: int, body: ScenarioUpdate, request: Request, ba
             raise HTTPException(status_code=400, detail="No fields to update")
         if not db.update_scenario(conn, scenario_id, **updates):
             _404("Scenario")
-        _maybe_auto_forecast(background_tasks, user_id, fy_id)
-        return {"ok": True, "forecast_triggered": True}
+        job_id = _maybe_auto_forecast(user_id, fy_id)
+        return {"ok": True, "forecast_triggered": True, "forecast_job_id": job_id}
     finally:
         conn.close()
 
 
 @router.delete("/scenarios/{scenario_id}")
-def delete_scenario(scenario_id: int, request: Request, background_tasks: BackgroundTasks):
+def delete_scenario(scenario_id: int, request: Request):
     conn = _conn()
     try:
         user_id = get_current_user(request)
         fy_id = _assert_scenario_access(conn, request, scenario_id)
         if not db.delete_scenario(conn, scenario_id):
             _404("Scenario")
-        _maybe_auto_forecast(background_tasks, user_id, fy_id)
-        return {"ok": True, "forecast_triggered": True}
+        job_id = _maybe_auto_forecast(user_id, fy_id)
+        return {"ok": True, "forecast_triggered": True, "forecast_job_id": job_id}
     finally:
         conn.close()
 
@@ -1294,6 +1361,70 @@ def clear_demo_data(request: Request, data_dir: str = "data_demo"):
         conn.close()
 
 
+# ---------------------------------------------------------------------------
+# Forecast result cache
+# ---------------------------------------------------------------------------
+
+@router.get("/forecast-cache/stats")
+def forecast_cache_stats(request: Request):
+    from .forecast_cache import forecast_cache
+
+    require_auth(request)
+    return forecast_cache.stats()
+
+
+@router.get("/auto-forecast/stats")
+def auto_forecast_stats(request: Request):
+    from .scheduler import auto_forecasts
+
+    require_auth(request)
+    return auto_forecasts.stats()
+
+
+@router.get("/auto-forecast/jobs/{job_id}")
+def get_auto_forecast_job(job_id: str, request: Request):
+    from .scheduler import auto_forecasts
+
+    user_id = require_auth(request)
+    job = auto_forecasts.get(job_id)
+    if job is None or job.user_id != user_id:
+        _404("Auto-forecast job")
+    return job.as_dict()
+
+
+@router.get("/forecast-pool/stats")
+def forecast_pool_stats(request: Request):
+    from .forecast_pool import forecast_pool
+
+    require_auth(request)
+    return forecast_pool.stats()
+
+
+@router.get("/chart-cache/stats")
+def chart_cache_stats(request: Request):
+    from .reporting import chart_cache
+
+    require_auth(request)
+    return chart_cache.stats()
+
+
+@router.get("/aggregate-store/stats")
+def aggregate_store_stats(request: Request):
+    from .aggregate_store import aggregate_store
+
+    require_auth(request)
+    return aggregate_store.stats()
+
+
+@router.get("/db-pool/stats")
+def db_pool_stats(request: Request):
+    from .db_pool import pool_stats
+
+    require_auth(request)
+    stats = pool_stats()
+    return {"enabled": stats is not None, **(stats or {})}
+
+
 # ---------------------------------------------------------------------------
 # Rates Table (comparison view)
 # ---------------------------------------------------------------------------
@@ -1306,20 +1437,20 @@ def get_rates_table(
     forecast_months: int = 12,
     run_rate_months: int = 3,
     input_dir: str | None = None,
+    run_id: int | None = None,
 ):
-    from .agents import AnalystAgent, PlannerAgent
-    from .config import RateConfig, default_rate_config
+    from .agents import PlannerAgent
+    from .config import default_rate_config
+    from .config_cache import fy_config_cache
+    from .forecast_cache import cached_run
     from .ytd import compute_ytd_rates, build_rates_comparison_table
 
     user_id = require_auth(request)
     conn = _conn()
     try:
         fy = _check_fy_ownership(conn, fy_id, user_id)
-        raw_config = db.build_rate_config_from_db(conn, fy_id)
-        if raw_config["rates"]:
-            cfg = RateConfig.from_mapping(raw_config)
-        else:
-            cfg = default_rate_config()
+        fy_config = fy_config_cache.get(conn, fy)
+        cfg = fy_config.rate_config if fy_config.rate_config.rates else default_rate_config()
         ref_rates = db.list_reference_rates(conn, fy_id)
         budget_rates: dict[str, dict[str, float]] = {}
         prov_rates: dict[str, dict[str, float]] = {}
@@ -1333,71 +1464,76 @@ def get_rates_table(
     if not input_dir:
         input_dir = "data_demo" if fy["name"].startswith("DEMO-") else "data"
 
-    input_path = Path(input_dir)
-    if not input_path.exists():
-        raise HTTPException(status_code=400, detail=f"Input directory not found: {input_dir}")
-
     import pandas as pd
     import shutil
     import tempfile
 
     fy_start = pd.Period(fy["start_month"], freq="M")
+    input_path = Path(input_dir)
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_input = Path(tmp) / "inputs"
-        tmp_input.mkdir(parents=True, exist_ok=True)
+    if run_id is not None:
+        results = _stored_run_results(fy_id, run_id)
+    else:
+        if not input_path.exists():
+            raise HTTPException(status_code=400, detail=f"Input directory not found: {input_dir}")
 
-        fy_start_str = fy["start_month"]
-        fy_end_str = fy["end_month"]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_input = Path(tmp) / "inputs"
+            tmp_input.mkdir(parents=True, exist_ok=True)
 
-        conn2 = _conn()
-        try:
-            # Try uploaded files first
-            for file_type, fname in [("gl_actuals", "GL_Actuals.csv"), ("direct_costs", "Direct_Costs_By_Project.csv")]:
-                uf = db.get_latest_uploaded_file(conn2, fy_id, file_type)
-                if uf:
-                    df = pd.read_csv(io.BytesIO(uf["content"]))
-                    if "Period" in df.columns:
-                        df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
-                    df.to_csv(tmp_input / fname, index=False)
-                else:
-                    src = input_path / fname
-                    if src.exists():
-                        df = pd.read_csv(src)
+            fy_start_str = fy["start_month"]
+            fy_end_str = fy["end_month"]
+
+            conn2 = _conn()
+            try:
+                # Try uploaded files first
+                for file_type, fname in [("gl_actuals", "GL_Actuals.csv"), ("direct_costs", "Direct_Costs_By_Project.csv")]:
+                    uf = db.get_latest_uploaded_file(conn2, fy_id, file_type)
+                    if uf:
+                        df = pd.read_csv(io.BytesIO(uf["content"]))
                         if "Period" in df.columns:
                             df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
                         df.to_csv(tmp_input / fname, index=False)
-
-            account_map_df = db.build_account_map_df_from_db(conn2, fy_id)
-            if not account_map_df.empty:
-                account_map_df.to_csv(tmp_input / "Account_Map.csv", index=False)
-            elif (input_path / "Account_Map.csv").exists():
-                shutil.copy2(input_path / "Account_Map.csv", tmp_input / "Account_Map.csv")
-
-            scenario_df = db.build_scenario_events_df_from_db(conn2, fy_id)
-            if not scenario_df.empty:
-                scenario_df.to_csv(tmp_input / "Scenario_Events.csv", index=False)
-            elif (input_path / "Scenario_Events.csv").exists():
-                shutil.copy2(input_path / "Scenario_Events.csv", tmp_input / "Scenario_Events.csv")
-        finally:
-            conn2.close()
-
-        if not (tmp_input / "Scenario_Events.csv").exists():
-            (tmp_input / "Scenario_Events.csv").write_text(
-                "Scenario,EffectivePeriod,Type,Project\nBase,2025-01,ADJUST,\n"
+                    else:
+                        src = input_path / fname
+                        if src.exists():
+                            df = pd.read_csv(src)
+                            if "Period" in df.columns:
+                                df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
+                            df.to_csv(tmp_input / fname, index=False)
+
+                account_map_df = fy_config.account_map
+                if not account_map_df.empty:
+                    account_map_df.to_csv(tmp_input / "Account_Map.csv", index=False)
+                elif (input_path / "Account_Map.csv").exists():
+                    shutil.copy2(input_path / "Account_Map.csv", tmp_input / "Account_Map.csv")
+
+                scenario_df = db.build_scenario_events_df_from_db(conn2, fy_id)
+                if not scenario_df.empty:
+                    scenario_df.to_csv(tmp_input / "Scenario_Events.csv", index=False)
+                elif (input_path / "Scenario_Events.csv").exists():
+                    shutil.copy2(input_path / "Scenario_Events.csv", tmp_input / "Scenario_Events.csv")
+            finally:
+                conn2.close()
+
+            if not (tmp_input / "Scenario_Events.csv").exists():
+                (tmp_input / "Scenario_Events.csv").write_text(
+                    "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
+                    "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
+                    "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
+                )
+
+            plan = PlannerAgent().plan(
+                scenario=scenario,
+                forecast_months=forecast_months,
+                run_rate_months=run_rate_months,
+                events_path=tmp_input / "Scenario_Events.csv",
             )
+            from dataclasses import replace
+            plan = replace(plan, fy_start=fy_start)
 
-        plan = PlannerAgent().plan(
-            scenario=scenario,
-            forecast_months=forecast_months,
-            run_rate_months=run_rate_months,
-            events_path=tmp_input / "Scenario_Events.csv",
-        )
-        from dataclasses import replace
-        plan = replace(plan, fy_start=fy_start)
-
-        results = AnalystAgent().run(input_dir=tmp_input, config=cfg, plan=plan)
-        result = next((r for r in results if r.scenario == scenario), results[0])
+            results = cached_run(tmp_input, cfg, plan)
+    result = next((r for r in results if r.scenario == scenario), results[0])
 
     rate_defs = {name: {"pool": rd.pool, "base": rd.base} for name, rd in cfg.rates.items()}
     ytd = compute_ytd_rates(result.pools, result.bases, rate_defs, fy_start)
@@ -1437,24 +1573,24 @@ def get_psr(
     forecast_months: int = 12,
     run_rate_months: int = 3,
     input_dir: str | None = None,
+    run_id: int | None = None,
 ):
     import shutil
     import tempfile
     import pandas as pd
-    from .agents import AnalystAgent, PlannerAgent
-    from .config import RateConfig, default_rate_config
+    from .agents import PlannerAgent
+    from .config import default_rate_config
+    from .config_cache import fy_config_cache
+    from .forecast_cache import cached_run
     from .psr import build_psr, build_psr_summary
 
     user_id = require_auth(request)
     conn = _conn()
     try:
         fy = _check_fy_ownership(conn, fy_id, user_id)
-        raw_config = db.build_rate_config_from_db(conn, fy_id)
-        if raw_config["rates"]:
-            cfg = RateConfig.from_mapping(raw_config)
-        else:
-            cfg = default_rate_config()
-        account_map_df = db.build_account_map_df_from_db(conn, fy_id)
+        fy_config = fy_config_cache.get(conn, fy)
+        cfg = fy_config.rate_config if fy_config.rate_config.rates else default_rate_config()
+        account_map_df = fy_config.account_map
         scenario_df = db.build_scenario_events_df_from_db(conn, fy_id)
         revenue_data = db.list_revenue(conn, fy_id)
     finally:
@@ -1464,64 +1600,68 @@ def get_psr(
         input_dir = "data_demo" if fy["name"].startswith("DEMO-") else "data"
 
     disk_dir = Path(input_dir)
-    if not disk_dir.exists():
-        raise HTTPException(status_code=400, detail=f"Input directory not found: {input_dir}")
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_input = Path(tmp) / "inputs"
-        tmp_input.mkdir(parents=True, exist_ok=True)
+    if run_id is not None:
+        results = _stored_run_results(fy_id, run_id)
+    else:
+        if not disk_dir.exists():
+            raise HTTPException(status_code=400, detail=f"Input directory not found: {input_dir}")
 
-        fy_start_str = fy["start_month"]
-        fy_end_str = fy["end_month"]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_input = Path(tmp) / "inputs"
+            tmp_input.mkdir(parents=True, exist_ok=True)
 
-        conn2 = _conn()
-        try:
-            for file_type, fname in [("gl_actuals", "GL_Actuals.csv"), ("direct_costs", "Direct_Costs_By_Project.csv")]:
-                uf = db.get_latest_uploaded_file(conn2, fy_id, file_type)
-                if uf:
-                    df = pd.read_csv(io.BytesIO(uf["content"]))
-                    if "Period" in df.columns:
-                        df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
-                    df.to_csv(tmp_input / fname, index=False)
-                else:
-                    src = disk_dir / fname
-                    if src.exists():
-                        df = pd.read_csv(src)
+            fy_start_str = fy["start_month"]
+            fy_end_str = fy["end_month"]
+
+            conn2 = _conn()
+            try:
+                for file_type, fname in [("gl_actuals", "GL_Actuals.csv"), ("direct_costs", "Direct_Costs_By_Project.csv")]:
+                    uf = db.get_latest_uploaded_file(conn2, fy_id, file_type)
+                    if uf:
+                        df = pd.read_csv(io.BytesIO(uf["content"]))
                         if "Period" in df.columns:
                             df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
                         df.to_csv(tmp_input / fname, index=False)
-        finally:
-            conn2.close()
-
-        if not account_map_df.empty:
-            account_map_df.to_csv(tmp_input / "Account_Map.csv", index=False)
-        elif (disk_dir / "Account_Map.csv").exists():
-            shutil.copy2(disk_dir / "Account_Map.csv", tmp_input / "Account_Map.csv")
-
-        if not scenario_df.empty:
-            scenario_df.to_csv(tmp_input / "Scenario_Events.csv", index=False)
-        elif (disk_dir / "Scenario_Events.csv").exists():
-            shutil.copy2(disk_dir / "Scenario_Events.csv", tmp_input / "Scenario_Events.csv")
-
-        if not (tmp_input / "Scenario_Events.csv").exists():
-            (tmp_input / "Scenario_Events.csv").write_text(
-                "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
-                "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
-                "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
-            )
+                    else:
+                        src = disk_dir / fname
+                        if src.exists():
+                            df = pd.read_csv(src)
+                            if "Period" in df.columns:
+                                df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
+                            df.to_csv(tmp_input / fname, index=False)
+            finally:
+                conn2.close()
 
-        plan = PlannerAgent().plan(
-            scenario=scenario,
-            forecast_months=forecast_months,
-            run_rate_months=run_rate_months,
-            events_path=tmp_input / "Scenario_Events.csv",
-        )
+            if not account_map_df.empty:
+                account_map_df.to_csv(tmp_input / "Account_Map.csv", index=False)
+            elif (disk_dir / "Account_Map.csv").exists():
+                shutil.copy2(disk_dir / "Account_Map.csv", tmp_input / "Account_Map.csv")
 
-        from dataclasses import replace
-        plan = replace(plan, fy_start=pd.Period(fy["start_month"], freq="M"))
+            if not scenario_df.empty:
+                scenario_df.to_csv(tmp_input / "Scenario_Events.csv", index=False)
+            elif (disk_dir / "Scenario_Events.csv").exists():
+                shutil.copy2(disk_dir / "Scenario_Events.csv", tmp_input / "Scenario_Events.csv")
+
+            if not (tmp_input / "Scenario_Events.csv").exists():
+                (tmp_input / "Scenario_Events.csv").write_text(
+                    "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
+                    "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
+                    "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
+                )
+
+            plan = PlannerAgent().plan(
+                scenario=scenario,
+                forecast_months=forecast_months,
+                run_rate_months=run_rate_months,
+                events_path=tmp_input / "Scenario_Events.csv",
+            )
 
-        results = AnalystAgent().run(input_dir=tmp_input, config=cfg, plan=plan)
-        result = next((r for r in results if r.scenario == scenario), results[0])
+            from dataclasses import replace
+            plan = replace(plan, fy_start=pd.Period(fy["start_month"], freq="M"))
+
+            results = cached_run(tmp_input, cfg, plan)
+    result = next((r for r in results if r.scenario == scenario), results[0])
 
     dc_path = disk_dir / "Direct_Costs_By_Project.csv"
     allowed_projects = None
@@ -1586,24 +1726,24 @@ def get_pst(
     forecast_months: int = 12,
     run_rate_months: int = 3,
     input_dir: str | None = None,
+    run_id: int | None = None,
 ):
     import shutil
     import tempfile
     import pandas as pd
-    from .agents import AnalystAgent, PlannerAgent
-    from .config import RateConfig, default_rate_config
+    from .agents import PlannerAgent
+    from .config import default_rate_config
+    from .config_cache import fy_config_cache
+    from .forecast_cache import cached_run
     from .pst import build_pst_report
 
     user_id = require_auth(request)
     conn = _conn()
     try:
         fy = _check_fy_ownership(conn, fy_id, user_id)
-        raw_config = db.build_rate_config_from_db(conn, fy_id)
-        if raw_config["rates"]:
-            cfg = RateConfig.from_mapping(raw_config)
-        else:
-            cfg = default_rate_config()
-        account_map_df = db.build_account_map_df_from_db(conn, fy_id)
+        fy_config = fy_config_cache.get(conn, fy)
+        cfg = fy_config.rate_config if fy_config.rate_config.rates else default_rate_config()
+        account_map_df = fy_config.account_map
         scenario_df = db.build_scenario_events_df_from_db(conn, fy_id)
         ref_rates = db.list_reference_rates(conn, fy_id, rate_type="budget")
     finally:
@@ -1613,68 +1753,71 @@ def get_pst(
         input_dir = "data_demo" if fy["name"].startswith("DEMO-") else "data"
 
     disk_dir = Path(input_dir)
-    if not disk_dir.exists():
-        raise HTTPException(status_code=400, detail=f"Input directory not found: {input_dir}")
+    fy_start_str = fy["start_month"]
+    fy_end_str = fy["end_month"]
 
     # Build budget rates dict
     budget_rates: dict[str, dict[str, float]] = {}
     for rr in ref_rates:
         budget_rates.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_input = Path(tmp) / "inputs"
-        tmp_input.mkdir(parents=True, exist_ok=True)
+    if run_id is not None:
+        results = _stored_run_results(fy_id, run_id)
+    else:
+        if not disk_dir.exists():
+            raise HTTPException(status_code=400, detail=f"Input directory not found: {input_dir}")
 
-        fy_start_str = fy["start_month"]
-        fy_end_str = fy["end_month"]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_input = Path(tmp) / "inputs"
+            tmp_input.mkdir(parents=True, exist_ok=True)
 
-        conn2 = _conn()
-        try:
-            for file_type, fname in [("gl_actuals", "GL_Actuals.csv"), ("direct_costs", "Direct_Costs_By_Project.csv")]:
-                uf = db.get_latest_uploaded_file(conn2, fy_id, file_type)
-                if uf:
-                    df = pd.read_csv(io.BytesIO(uf["content"]))
-                    if "Period" in df.columns:
-                        df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
-                    df.to_csv(tmp_input / fname, index=False)
-                else:
-                    src = disk_dir / fname
-                    if src.exists():
-                        df = pd.read_csv(src)
+            conn2 = _conn()
+            try:
+                for file_type, fname in [("gl_actuals", "GL_Actuals.csv"), ("direct_costs", "Direct_Costs_By_Project.csv")]:
+                    uf = db.get_latest_uploaded_file(conn2, fy_id, file_type)
+                    if uf:
+                        df = pd.read_csv(io.BytesIO(uf["content"]))
                         if "Period" in df.columns:
                             df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
                         df.to_csv(tmp_input / fname, index=False)
-        finally:
-            conn2.close()
-
-        if not account_map_df.empty:
-            account_map_df.to_csv(tmp_input / "Account_Map.csv", index=False)
-        elif (disk_dir / "Account_Map.csv").exists():
-            shutil.copy2(disk_dir / "Account_Map.csv", tmp_input / "Account_Map.csv")
-
-        if not scenario_df.empty:
-            scenario_df.to_csv(tmp_input / "Scenario_Events.csv", index=False)
-        elif (disk_dir / "Scenario_Events.csv").exists():
-            shutil.copy2(disk_dir / "Scenario_Events.csv", tmp_input / "Scenario_Events.csv")
-
-        if not (tmp_input / "Scenario_Events.csv").exists():
-            (tmp_input / "Scenario_Events.csv").write_text(
-                "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
-                "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
-                "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
-            )
+                    else:
+                        src = disk_dir / fname
+                        if src.exists():
+                            df = pd.read_csv(src)
+                            if "Period" in df.columns:
+                                df = df[(df["Period"] >= fy_start_str) & (df["Period"] <= fy_end_str)]
+                            df.to_csv(tmp_input / fname, index=False)
+            finally:
+                conn2.close()
 
-        plan = PlannerAgent().plan(
-            scenario=scenario,
-            forecast_months=forecast_months,
-            run_rate_months=run_rate_months,
-            events_path=tmp_input / "Scenario_Events.csv",
-        )
-        from dataclasses import replace
-        plan = replace(plan, fy_start=pd.Period(fy_start_str, freq="M"))
+            if not account_map_df.empty:
+                account_map_df.to_csv(tmp_input / "Account_Map.csv", index=False)
+            elif (disk_dir / "Account_Map.csv").exists():
+                shutil.copy2(disk_dir / "Account_Map.csv", tmp_input / "Account_Map.csv")
 
-        results = AnalystAgent().run(input_dir=tmp_input, config=cfg, plan=plan)
-        result = next((r for r in results if r.scenario == scenario), results[0])
+            if not scenario_df.empty:
+                scenario_df.to_csv(tmp_input / "Scenario_Events.csv", index=False)
+            elif (disk_dir / "Scenario_Events.csv").exists():
+                shutil.copy2(disk_dir / "Scenario_Events.csv", tmp_input / "Scenario_Events.csv")
+
+            if not (tmp_input / "Scenario_Events.csv").exists():
+                (tmp_input / "Scenario_Events.csv").write_text(
+                    "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
+                    "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
+                    "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
+                )
+
+            plan = PlannerAgent().plan(
+                scenario=scenario,
+                forecast_months=forecast_months,
+                run_rate_months=run_rate_months,
+                events_path=tmp_input / "Scenario_Events.csv",
+            )
+            from dataclasses import replace
+            plan = replace(plan, fy_start=pd.Period(fy_start_str, freq="M"))
+
+            results = cached_run(tmp_input, cfg, plan)
+    result = next((r for r in results if r.scenario == scenario), results[0])
 
     # Determine selected_period default (last actual period in FY range)
     if not selected_period:
@@ -1716,7 +1859,6 @@ def get_pst(
 async def upload_file(
     fy_id: int,
     request: Request,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     file_type: str = "gl_actuals",
 ):
@@ -1736,8 +1878,8 @@ async def upload_file(
             )
 
         file_id = db.save_uploaded_file(conn, fy_id, file_type, file.filename or file_type, content)
-        _maybe_auto_forecast(background_tasks, user_id, fy_id)
-        return {"id": file_id, "file_type": file_type, "file_name": file.filename, "size_bytes": len(content), "forecast_triggered": True}
+        job_id = _maybe_auto_forecast(user_id, fy_id)
+        return {"id": file_id, "file_type": file_type, "file_name": file.filename, "size_bytes": len(content), "forecast_triggered": True, "forecast_job_id": job_id}
     finally:
         conn.close()
 
@@ -1819,16 +1961,15 @@ def forecast_from_db(
     input_dir: str | None = None,
 ):
     from .agents import AnalystAgent, PlannerAgent, ReporterAgent
-    from .config import RateConfig
+    from .config_cache import fy_config_cache
 
     user_id = require_auth(request)
     conn = _conn()
     try:
         fy = _check_fy_ownership(conn, fy_id, user_id)
-        raw_config = db.build_rate_config_from_db(conn, fy_id)
-        if not raw_config["rates"]:
+        cfg = fy_config_cache.get(conn, fy).rate_config
+        if not cfg.rates:
             raise HTTPException(status_code=400, detail="No pool groups configured for this fiscal year")
-        cfg = RateConfig.from_mapping(raw_config)
     finally:
         conn.close()
 
@@ -1873,9 +2014,6 @@ def forecast_from_db(
 # GL Entries
 # ---------------------------------------------------------------------------
 
-_PERIOD_GL_RE = re.compile(r"^\d{4}-(?:0[1-9]|1[0-2])$")
-
-
 @router.get("/fiscal-years/{fy_id}/gl-entries")
 def list_gl_entries(
     fy_id: int,
@@ -1913,7 +2051,7 @@ def count_gl_entries(
 @router.post("/fiscal-years/{fy_id}/gl-entries", status_code=201)
 def create_gl_entry(fy_id: int, body: GLEntryCreate, request: Request):
     user_id = require_auth(request)
-    if not _PERIOD_GL_RE.match(body.period):
+    if not PERIOD_RE.match(body.period):
         raise HTTPException(status_code=422, detail="period must be YYYY-MM")
     conn = _conn()
     try:
@@ -1930,48 +2068,22 @@ def create_gl_entry(fy_id: int, body: GLEntryCreate, request: Request):
 
 
 @router.post("/fiscal-years/{fy_id}/gl-entries/import")
-async def import_gl_entries(fy_id: int, request: Request, background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+async def import_gl_entries(fy_id: int, request: Request, file: UploadFile = File(...)):
     user_id = require_auth(request)
-    content = await file.read()
-    try:
-        text = content.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        text = content.decode("latin-1")
 
-    reader = csv.DictReader(io.StringIO(text))
-    rows: list[dict] = []
-    errors: list[str] = []
-    line_num = 1
-    for row in reader:
-        line_num += 1
-        period = (row.get("Period") or "").strip()
-        account = (row.get("Account") or "").strip()
-        amount_raw = (row.get("Amount") or "").strip()
-        entity = (row.get("Entity") or "").strip()
-        if not period or not account or not amount_raw:
-            errors.append(f"Line {line_num}: missing Period, Account, or Amount")
-            continue
-        if not _PERIOD_GL_RE.match(period):
-            errors.append(f"Line {line_num}: invalid period '{period}' (expected YYYY-MM)")
-            continue
-        try:
-            amount = float(amount_raw)
-        except ValueError:
-            errors.append(f"Line {line_num}: non-numeric amount '{amount_raw}'")
-            continue
-        rows.append({"period": period, "account": account, "amount": amount, "entity": entity})
-
-    imported = 0
-    if rows:
+    def _import():
         conn = _conn()
         try:
             _check_fy_ownership(conn, fy_id, user_id)
-            imported = db.bulk_insert_gl_entries(conn, user_id, fy_id, rows)
+            return run_import(
+                file.file, iter_gl_chunks, lambda chunks: db.copy_gl_entries(conn, user_id, fy_id, chunks)
+            )
         finally:
             conn.close()
 
-    _maybe_auto_forecast(background_tasks, user_id, fy_id)
-    return {"imported": imported, "errors": errors, "forecast_triggered": True}
+    report = await run_in_threadpool(_import)
+    job_id = _maybe_auto_forecast(user_id, fy_id)
+    return {**report.as_dict(), "forecast_triggered": True, "forecast_job_id": job_id}
 
 
 @router.get("/fiscal-years/{fy_id}/gl-entries/export")
@@ -1981,18 +2093,17 @@ def export_gl_entries(fy_id: int, request: Request):
     conn = _conn()
     try:
         _check_fy_ownership(conn, fy_id, user_id)
-        csv_str = db.get_gl_entries_as_csv(conn, user_id, fy_id)
     finally:
         conn.close()
     return StreamingResponse(
-        io.StringIO(csv_str),
+        db.iter_gl_entries_csv(user_id, fy_id),
         media_type="text/csv",
         headers={"Content-Disposition": 'attachment; filename="GL_Actuals.csv"'},
     )
 
 
 @router.delete("/fiscal-years/{fy_id}/gl-entries")
-def delete_all_gl_entries(fy_id: int, request: Request, background_tasks: BackgroundTasks, confirm: bool = False):
+def delete_all_gl_entries(fy_id: int, request: Request, confirm: bool = False):
     if not confirm:
         raise HTTPException(status_code=400, detail="Pass confirm=true to delete all GL entries for this fiscal year")
     user_id = require_auth(request)
@@ -2000,8 +2111,8 @@ def delete_all_gl_entries(fy_id: int, request: Request, background_tasks: Backgr
     try:
         _check_fy_ownership(conn, fy_id, user_id)
         deleted = db.delete_gl_entries_for_fy(conn, user_id, fy_id)
-        _maybe_auto_forecast(background_tasks, user_id, fy_id)
-        return {"deleted": deleted, "forecast_triggered": True}
+        job_id = _maybe_auto_forecast(user_id, fy_id)
+        return {"deleted": deleted, "forecast_triggered": True, "forecast_job_id": job_id}
     finally:
         conn.close()
 
@@ -2009,7 +2120,7 @@ def delete_all_gl_entries(fy_id: int, request: Request, background_tasks: Backgr
 @router.put("/gl-entries/{entry_id}")
 def update_gl_entry(entry_id: int, body: GLEntryUpdate, request: Request):
     user_id = require_auth(request)
-    if not _PERIOD_GL_RE.match(body.period):
+    if not PERIOD_RE.match(body.period):
         raise HTTPException(status_code=422, detail="period must be YYYY-MM")
     conn = _conn()
     try:
@@ -2076,7 +2187,7 @@ def count_direct_cost_entries(
 @router.post("/fiscal-years/{fy_id}/direct-cost-entries", status_code=201)
 def create_direct_cost_entry(fy_id: int, body: DirectCostEntryCreate, request: Request):
     user_id = require_auth(request)
-    if not _PERIOD_GL_RE.match(body.period):
+    if not PERIOD_RE.match(body.period):
         raise HTTPException(status_code=422, detail="period must be YYYY-MM")
     conn = _conn()
     try:
@@ -2100,54 +2211,19 @@ def create_direct_cost_entry(fy_id: int, body: DirectCostEntryCreate, request: R
 @router.post("/fiscal-years/{fy_id}/direct-cost-entries/import")
 async def import_direct_cost_entries(fy_id: int, request: Request, file: UploadFile = File(...)):
     user_id = require_auth(request)
-    content = await file.read()
-    try:
-        text = content.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        text = content.decode("latin-1")
-
-    reader = csv.DictReader(io.StringIO(text))
-    rows: list[dict] = []
-    errors: list[str] = []
-    line_num = 1
-    for row in reader:
-        line_num += 1
-        period = (row.get("Period") or "").strip()
-        project = (row.get("Project") or "").strip()
-        if not period:
-            errors.append(f"Line {line_num}: missing Period")
-            continue
-        if not _PERIOD_GL_RE.match(period):
-            errors.append(f"Line {line_num}: invalid period '{period}' (expected YYYY-MM)")
-            continue
-
-        def _f(key: str) -> float:
-            raw = (row.get(key) or "0").strip()
-            try:
-                return float(raw)
-            except ValueError:
-                return 0.0
-
-        rows.append({
-            "period": period,
-            "project": project,
-            "direct_labor": _f("DirectLabor$"),
-            "direct_labor_hrs": _f("DirectLaborHrs"),
-            "subk": _f("Subk"),
-            "odc": _f("ODC"),
-            "travel": _f("Travel"),
-        })
 
-    imported = 0
-    if rows:
+    def _import():
         conn = _conn()
         try:
             _check_fy_ownership(conn, fy_id, user_id)
-            imported = db.bulk_insert_direct_cost_entries(conn, user_id, fy_id, rows)
+            return run_import(
+                file.file, iter_direct_cost_chunks, lambda chunks: db.copy_direct_cost_entries(conn, user_id, fy_id, chunks)
+            )
         finally:
             conn.close()
 
-    return {"imported": imported, "errors": errors}
+    report = await run_in_threadpool(_import)
+    return report.as_dict()
 
 
 @router.get("/fiscal-years/{fy_id}/direct-cost-entries/export")
@@ -2157,11 +2233,10 @@ def export_direct_cost_entries(fy_id: int, request: Request):
     conn = _conn()
     try:
         _check_fy_ownership(conn, fy_id, user_id)
-        csv_str = db.get_direct_cost_entries_as_csv(conn, user_id, fy_id)
     finally:
         conn.close()
     return StreamingResponse(
-        io.StringIO(csv_str),
+        db.iter_direct_cost_entries_csv(user_id, fy_id),
         media_type="text/csv",
         headers={"Content-Disposition": 'attachment; filename="Direct_Costs_By_Project.csv"'},
     )
@@ -2184,7 +2259,7 @@ def delete_all_direct_cost_entries(fy_id: int, request: Request, confirm: bool =
 @router.put("/direct-cost-entries/{entry_id}")
 def update_direct_cost_entry(entry_id: int, body: DirectCostEntryUpdate, request: Request):
     user_id = require_auth(request)
-    if not _PERIOD_GL_RE.match(body.period):
+    if not PERIOD_RE.match(body.period):
         raise HTTPException(status_code=422, detail="period must be YYYY-MM")
     conn = _conn()
     try:
@@ -2215,3 +2290,42 @@ def delete_direct_cost_entry(entry_id: int, request: Request):
         return {"ok": True}
     finally:
         conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Entry Totals (materialized period aggregates)
+# ---------------------------------------------------------------------------
+
+@router.get("/fiscal-years/{fy_id}/period-pool-totals")
+def list_period_pool_totals(fy_id: int, request: Request, entity: str | None = None):
+    user_id = require_auth(request)
+    conn = _conn()
+    try:
+        _check_fy_ownership(conn, fy_id, user_id)
+        return db.list_period_pool_totals(conn, user_id, fy_id, entity=entity)
+    finally:
+        conn.close()
+
+
+@router.get("/fiscal-years/{fy_id}/entry-totals/check")
+def check_entry_totals(fy_id: int, request: Request):
+    user_id = require_auth(request)
+    conn = _conn()
+    try:
+        _check_fy_ownership(conn, fy_id, user_id)
+        mismatches = db.check_entry_totals(conn, user_id=user_id, fy_id=fy_id)
+        return {"consistent": not mismatches, "mismatches": mismatches}
+    finally:
+        conn.close()
+
+
+@router.post("/fiscal-years/{fy_id}/entry-totals/rebuild")
+def rebuild_entry_totals(fy_id: int, request: Request):
+    user_id = require_auth(request)
+    conn = _conn()
+    try:
+        _check_fy_ownership(conn, fy_id, user_id)
+        db.rebuild_entry_totals(conn, user_id=user_id, fy_id=fy_id)
+        return {"ok": True}
+    finally:
+        conn.close()
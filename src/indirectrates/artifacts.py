@@ -0,0 +1,161 @@
+"""On-disk Parquet store for the frames of persisted forecast runs.
+
+``forecast_runs`` keeps the zipped management pack, which is opaque to
+queries.  Alongside it, each run's ``rates``, ``ytd_rates``, ``pools``,
+``bases`` and ``project_impacts`` are written as one Parquet file per frame
+(all scenarios stacked, keyed by a ``Scenario`` column) under
+``<FORECAST_ARTIFACT_DIR>/<run_id>/``, plus a ``manifest.json`` carrying each
+scenario's assumptions and warnings.  Reads are memory-mapped, so report views
+and run comparisons can load prior results without recomputing.
+
+Requires ``pyarrow`` (``pip install -e ".[artifacts]"``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from .types import ForecastResult
+
+# Period-indexed frames are stored with the index as a "Period" column.
+INDEXED_FRAMES = ("rates", "ytd_rates", "pools", "bases")
+FRAMES = INDEXED_FRAMES + ("project_impacts",)
+# Frames a ForecastResult cannot be rebuilt without; ``ytd_rates`` is optional.
+REQUIRED_FRAMES = ("rates", "pools", "bases", "project_impacts")
+MANIFEST = "manifest.json"
+
+
+def artifact_root() -> Path:
+    return Path(os.environ.get("FORECAST_ARTIFACT_DIR", "forecast_artifacts"))
+
+
+def artifacts_enabled() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def run_dir(run_id: int, root: Path | None = None) -> Path:
+    return (root or artifact_root()) / str(int(run_id))
+
+
+def _stack(results: list[ForecastResult], name: str) -> pd.DataFrame | None:
+    parts = []
+    for res in results:
+        df = getattr(res, name)
+        if df is None:
+            continue
+        df = df.reset_index().rename(columns={"index": "Period"}) if name in INDEXED_FRAMES else df.copy()
+        if "Period" in df.columns:
+            df["Period"] = df["Period"].astype(str)
+        df.insert(0, "Scenario", res.scenario)
+        parts.append(df)
+    if not parts:
+        return None
+    return pd.concat(parts, ignore_index=True)
+
+
+def write_run_artifacts(run_id: int, results: list[ForecastResult], root: Path | None = None) -> Path:
+    """Write every frame of ``results`` for ``run_id`` and return the run directory."""
+    target = run_dir(run_id, root)
+    tmp = target.with_name(f".{target.name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    frames: list[str] = []
+    for name in FRAMES:
+        df = _stack(results, name)
+        if df is None:
+            continue
+        df.to_parquet(tmp / f"{name}.parquet", index=False)
+        frames.append(name)
+
+    manifest = {
+        "run_id": int(run_id),
+        "frames": frames,
+        "scenarios": [
+            {"name": res.scenario, "assumptions": res.assumptions, "warnings": res.warnings} for res in results
+        ],
+    }
+    (tmp / MANIFEST).write_text(json.dumps(manifest, default=str, indent=2), encoding="utf-8")
+
+    # Swap in the finished directory so readers never see a partially written run.
+    shutil.rmtree(target, ignore_errors=True)
+    tmp.rename(target)
+    return target
+
+
+def read_manifest(run_id: int, root: Path | None = None) -> dict[str, Any] | None:
+    path = run_dir(run_id, root) / MANIFEST
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def read_run_frame(run_id: int, name: str, scenario: str | None = None, root: Path | None = None) -> pd.DataFrame | None:
+    """Load one stored frame (optionally a single scenario); ``None`` if it was not stored."""
+    if name not in FRAMES:
+        raise ValueError(f"Unknown artifact frame '{name}'. Known: {list(FRAMES)}")
+    path = run_dir(run_id, root) / f"{name}.parquet"
+    if not path.exists():
+        return None
+    filters = [("Scenario", "==", scenario)] if scenario is not None else None
+    df = pd.read_parquet(path, filters=filters, memory_map=True)
+    if "Period" in df.columns:
+        df["Period"] = pd.PeriodIndex(df["Period"], freq="M")
+    return df
+
+
+def load_run_results(run_id: int, root: Path | None = None) -> list[ForecastResult] | None:
+    """Rebuild the ``ForecastResult`` list of a stored run.
+
+    Returns ``None`` if the run has no artifacts, or if any of
+    ``REQUIRED_FRAMES`` is missing from its manifest or from disk.
+    """
+    manifest = read_manifest(run_id, root)
+    if manifest is None or not set(REQUIRED_FRAMES) <= set(manifest.get("frames", ())):
+        return None
+    frames = {name: read_run_frame(run_id, name, root=root) for name in manifest["frames"] if name in FRAMES}
+    if any(frames[name] is None for name in REQUIRED_FRAMES):
+        return None
+
+    def _scenario_frame(name: str, scenario: str) -> pd.DataFrame | None:
+        df = frames.get(name)
+        if df is None:
+            return None
+        df = df[df["Scenario"] == scenario].drop(columns="Scenario")
+        if name in INDEXED_FRAMES:
+            df = df.set_index("Period")
+            df.index.name = None
+        return df.reset_index(drop=True) if name not in INDEXED_FRAMES else df
+
+    results: list[ForecastResult] = []
+    for entry in manifest["scenarios"]:
+        scenario = entry["name"]
+        rates = _scenario_frame("rates", scenario)
+        results.append(
+            ForecastResult(
+                scenario=scenario,
+                periods=rates.index,
+                pools=_scenario_frame("pools", scenario),
+                bases=_scenario_frame("bases", scenario),
+                rates=rates,
+                project_impacts=_scenario_frame("project_impacts", scenario),
+                assumptions=entry["assumptions"],
+                warnings=entry["warnings"],
+                ytd_rates=_scenario_frame("ytd_rates", scenario),
+            )
+        )
+    return results
+
+
+def delete_run_artifacts(run_id: int, root: Path | None = None) -> None:
+    shutil.rmtree(run_dir(run_id, root), ignore_errors=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -36,10 +37,11 @@ def run(
     config: Optional[Path] = typer.Option(None, help="Rate config YAML (default uses packaged config)."),
     forecast_months: int = typer.Option(12, min=1, help="Months beyond last actual to project."),
     run_rate_months: int = typer.Option(3, min=1, help="Months to average for run-rate projection."),
+    workers: int = typer.Option(1, min=1, help="Worker processes for computing scenarios in parallel."),
 ):
     cfg = RateConfig.from_yaml(config) if config else default_rate_config()
     plan = PlannerAgent().plan(scenario, forecast_months, run_rate_months, events_path=input / "Scenario_Events.csv")
-    results = AnalystAgent().run(input_dir=input, config=cfg, plan=plan)
+    results = AnalystAgent().run(input_dir=input, config=cfg, plan=plan, workers=workers)
     ReporterAgent().package(out_dir=out, results=results)
     console.print(f"Wrote management pack to {out}")
 
@@ -51,6 +53,33 @@ def init_db_cmd():
     console.print("Database initialized.")
 
 
+@app.command(name="check-totals")
+def check_totals_cmd(
+    fiscal_year_id: Optional[int] = typer.Option(None, "--fy", help="Only check this fiscal year."),
+    repair: bool = typer.Option(False, help="Rebuild the totals from raw entries when they disagree."),
+):
+    """Compare the materialized GL / direct-cost totals with the raw entries."""
+    conn = db.get_connection()
+    try:
+        mismatches = db.check_entry_totals(conn, fy_id=fiscal_year_id)
+        for m in mismatches:
+            console.print(
+                f"{m['source']} fy={m['fiscal_year_id']} user={m['user_id']} {m['period']} {m['key']}: "
+                f"expected {m['expected_amount']:,.2f} ({m['expected_rows']} rows), "
+                f"found {m['actual_amount']:,.2f} ({m['actual_rows']} rows)"
+            )
+        if not mismatches:
+            console.print("Entry totals are consistent.")
+            return
+        if not repair:
+            console.print(f"[red]{len(mismatches)} mismatched totals.[/red] Re-run with --repair to rebuild.")
+            raise typer.Exit(code=1)
+        db.rebuild_entry_totals(conn, fy_id=fiscal_year_id)
+        console.print(f"Rebuilt totals; {len(db.check_entry_totals(conn, fy_id=fiscal_year_id))} mismatches remain.")
+    finally:
+        conn.close()
+
+
 @app.command()
 def demo(
     out: Path = typer.Option("data_demo", help="Output directory for demo CSVs."),
@@ -100,6 +129,10 @@ def _find_available_port(host: str, preferred: int) -> int:
 def serve(
     host: str = typer.Option("127.0.0.1", help="Host to bind (use 0.0.0.0 for LAN)."),
     port: int = typer.Option(8000, help="Port to serve the API on."),
+    job_workers: int = typer.Option(
+        int(os.environ.get("FORECAST_JOB_WORKERS", "1")),
+        help="Background processes that run queued forecast jobs (0 to run none here).",
+    ),
 ):
     """Start the forecast API server (for the Next.js UI)."""
     try:
@@ -110,4 +143,9 @@ def serve(
     actual_port = _find_available_port(host, port)
     if actual_port != port:
         console.print(f"Port {port} is in use, using port {actual_port} instead.")
+    if job_workers > 0:
+        from .jobs import start_worker_processes
+
+        start_worker_processes(job_workers)
+        console.print(f"Started {job_workers} forecast job worker(s).")
     uvicorn.run("indirectrates.server:app", host=host, port=actual_port, reload=False)
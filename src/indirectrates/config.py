@@ -44,6 +44,18 @@ class RateConfig:
             base_account_map=base_account_map,
         )
 
+    def to_mapping(self) -> dict[str, Any]:
+        """Plain-data form accepted by ``from_mapping`` (JSON/YAML serializable)."""
+        return {
+            "base_definitions": dict(self.base_definitions),
+            "rates": {
+                name: {"pool": list(r.pool), "base": r.base, "cascade_order": r.cascade_order}
+                for name, r in self.rates.items()
+            },
+            "unallowable_pool_names": sorted(self.unallowable_pool_names),
+            "base_account_map": {k: list(v) for k, v in self.base_account_map.items()},
+        }
+
     @staticmethod
     def from_yaml(path: str | Path) -> "RateConfig":
         path = Path(path)
@@ -0,0 +1,81 @@
+"""Per-fiscal-year cache of the built rate configuration and account map.
+
+Entries are keyed by ``(fiscal_year_id, config_version)``.  ``config_version``
+lives on the ``fiscal_years`` row and is bumped by every API handler that
+writes rate groups, pool groups, pools, GL mappings or base accounts, so a
+stale entry can never be served: the next request simply carries a newer
+version.  Because callers already load the fiscal-year row for ownership
+checks, a cache hit costs no extra queries.  Cached objects are shared between
+callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+import psycopg2.extensions
+
+from . import db
+from .config import RateConfig
+
+
+@dataclass(frozen=True)
+class FYConfig:
+    rate_config: RateConfig
+    account_map: pd.DataFrame
+
+
+class FYConfigCache:
+    """Thread-safe LRU of ``FYConfig`` keyed by ``(fy_id, config_version)``."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, int], FYConfig] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, conn: psycopg2.extensions.connection, fy: dict[str, Any]) -> FYConfig:
+        """Config for the fiscal-year row ``fy`` (as returned by ``db.get_fiscal_year``)."""
+        key = (int(fy["id"]), int(fy.get("config_version") or 0))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = FYConfig(
+            rate_config=RateConfig.from_mapping(db.build_rate_config_from_db(conn, key[0])),
+            account_map=db.build_account_map_df_from_db(conn, key[0]),
+        )
+        with self._lock:
+            # Older versions of this FY can never be requested again.
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1] < key[1]]:
+                del self._entries[stale]
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+fy_config_cache = FYConfigCache(max_entries=int(os.environ.get("FY_CONFIG_CACHE_MAX_ENTRIES", "256")))
@@ -0,0 +1,288 @@
+"""Thread-safe pool of psycopg2 connections behind ``db.get_connection``.
+
+Callers keep the existing ``conn = get_connection() ... finally: conn.close()``
+pattern: ``get_connection`` checks a connection out of the process-wide pool
+and ``close()`` on the returned ``PooledConnection`` hands it back instead of
+tearing down the TLS session.  Checkout runs a ``SELECT 1`` health check on
+connections that have sat idle for a while, and check-in rolls back any open
+transaction so the next borrower starts clean.
+
+Configuration (environment):
+  DB_POOL_MIN                  connections opened up front by ``warm()`` (default 1)
+  DB_POOL_MAX                  hard cap on open connections; 0 disables pooling (default 10)
+  DB_POOL_TIMEOUT_SECONDS      how long checkout waits for a free connection (default 30)
+  DB_POOL_HEALTHCHECK_SECONDS  idle time after which checkout pings the connection (default 30)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+import psycopg2
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    """No connection became available within the checkout timeout."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+class PooledConnection:
+    """Proxy for a pooled connection; ``close()`` returns it to the pool."""
+
+    __slots__ = ("_pool", "_conn")
+
+    def __init__(self, pool: ConnectionPool, conn: psycopg2.extensions.connection) -> None:
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_conn", conn)
+
+    @property
+    def raw(self) -> psycopg2.extensions.connection:
+        if self._conn is None:
+            raise psycopg2.InterfaceError("connection already returned to the pool")
+        return self._conn
+
+    @property
+    def closed(self) -> int:
+        return 1 if self._conn is None else self._conn.closed
+
+    def close(self) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        object.__setattr__(self, "_conn", None)
+        self._pool.release(conn)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.raw, name, value)
+
+    def __enter__(self) -> PooledConnection:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Bounded pool of connections produced by ``connect``, with checkout metrics."""
+
+    def __init__(
+        self,
+        connect: Callable[[], psycopg2.extensions.connection],
+        minconn: int = 1,
+        maxconn: int = 10,
+        timeout: float = 30.0,
+        health_check_after: float = 30.0,
+    ) -> None:
+        if maxconn < 1:
+            raise ValueError("maxconn must be >= 1")
+        self._connect = connect
+        self.minconn = max(0, min(minconn, maxconn))
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self._idle: deque[tuple[psycopg2.extensions.connection, float]] = deque()
+        self._open = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+        self._health_check_failures = 0
+        self._peak_in_use = 0
+
+    def warm(self) -> None:
+        """Open connections until ``minconn`` are idle or open."""
+        while True:
+            with self._cond:
+                if self._open >= self.minconn:
+                    return
+                self._open += 1
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    def acquire(self) -> PooledConnection:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    break
+                if self._open < self.maxconn:
+                    conn, idle_since = None, 0.0
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(f"no database connection available within {self.timeout:g}s")
+                waited = True
+                self._cond.wait(remaining)
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+
+        try:
+            conn = self._checkout(conn, idle_since)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+        wait = time.monotonic() - started
+        with self._cond:
+            self._checkouts += 1
+            self._wait_seconds += wait
+            self._max_wait_seconds = max(self._max_wait_seconds, wait)
+            if waited:
+                self._waits += 1
+        return PooledConnection(self, conn)
+
+    def _checkout(self, conn: psycopg2.extensions.connection | None, idle_since: float) -> psycopg2.extensions.connection:
+        if conn is not None and not conn.closed:
+            if time.monotonic() - idle_since < self.health_check_after or self._ping(conn):
+                return conn
+            with self._cond:
+                self._health_check_failures += 1
+        if conn is not None:
+            self._discard(conn)
+        return self._connect()
+
+    @staticmethod
+    def _ping(conn: psycopg2.extensions.connection) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _discard(conn: psycopg2.extensions.connection) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _reset(self, conn: psycopg2.extensions.connection) -> bool:
+        """Return ``conn`` to a clean, idle state; ``False`` if it is unusable."""
+        if conn.closed:
+            return False
+        try:
+            status = conn.get_transaction_status()
+            if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                return False
+            if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            if conn.autocommit:
+                conn.autocommit = False
+        except Exception:
+            return False
+        return True
+
+    def release(self, conn: psycopg2.extensions.connection) -> None:
+        usable = self._reset(conn)
+        if not usable:
+            self._discard(conn)
+        with self._cond:
+            self._in_use -= 1
+            if usable:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._open -= 1
+            self._cond.notify()
+
+    def close_all(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "min": self.minconn,
+                "max": self.maxconn,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "peak_in_use": self._peak_in_use,
+                "utilization": round(self._in_use / self.maxconn, 4),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "health_check_failures": self._health_check_failures,
+                "avg_wait_ms": round(1000 * self._wait_seconds / self._checkouts, 3) if self._checkouts else 0.0,
+                "max_wait_ms": round(1000 * self._max_wait_seconds, 3),
+            }
+
+
+_pool: ConnectionPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(connect: Callable[[], psycopg2.extensions.connection]) -> ConnectionPool | None:
+    """The process-wide pool (created on first use), or ``None`` when ``DB_POOL_MAX`` is 0."""
+    global _pool, _pool_pid
+    maxconn = _env_int("DB_POOL_MAX", 10)
+    if maxconn < 1:
+        return None
+    with _pool_lock:
+        # A forked child must not share the parent's sockets; start a fresh pool.
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ConnectionPool(
+                connect,
+                minconn=_env_int("DB_POOL_MIN", 1),
+                maxconn=maxconn,
+                timeout=_env_float("DB_POOL_TIMEOUT_SECONDS", 30.0),
+                health_check_after=_env_float("DB_POOL_HEALTHCHECK_SECONDS", 30.0),
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def pool_stats() -> dict[str, Any] | None:
+    """Metrics of the current process's pool, or ``None`` if none has been created."""
+    pool = _pool if _pool_pid == os.getpid() else None
+    return pool.stats() if pool is not None else None
@@ -0,0 +1,146 @@
+"""Streaming CSV validation for GL and direct-cost entry imports.
+
+Uploads are decoded and validated incrementally and handed to the database
+loader in fixed-size chunks of row tuples (see ``db.copy_gl_entries`` and
+``db.copy_direct_cost_entries``), so memory stays bounded by the chunk size
+rather than the file size.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Iterable, Iterator
+
+PERIOD_RE = re.compile(r"^\d{4}-(?:0[1-9]|1[0-2])$")
+
+CHUNK_ROWS = 50_000
+MAX_REPORTED_ERRORS = 1_000
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    errors: list[str] = field(default_factory=list)
+    error_count: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    elapsed_seconds: float = 0.0
+
+    def error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.imported / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "imported": self.imported,
+            "errors": self.errors,
+            "error_count": self.error_count,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+        }
+
+
+def _chunked(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    chunk: list[tuple] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _gl_rows(text: IO[str], report: ImportReport) -> Iterator[tuple]:
+    for line_num, row in enumerate(csv.DictReader(text), start=2):
+        period = (row.get("Period") or "").strip()
+        account = (row.get("Account") or "").strip()
+        amount_raw = (row.get("Amount") or "").strip()
+        entity = (row.get("Entity") or "").strip()
+        if not period or not account or not amount_raw:
+            report.error(f"Line {line_num}: missing Period, Account, or Amount")
+            continue
+        if not PERIOD_RE.match(period):
+            report.error(f"Line {line_num}: invalid period '{period}' (expected YYYY-MM)")
+            continue
+        try:
+            amount = float(amount_raw)
+        except ValueError:
+            amount = math.nan
+        if not math.isfinite(amount):
+            report.error(f"Line {line_num}: non-numeric amount '{amount_raw}'")
+            continue
+        yield (period, account, amount, entity)
+
+
+def _direct_cost_rows(text: IO[str], report: ImportReport) -> Iterator[tuple]:
+    def _f(row: dict[str, str | None], key: str) -> float:
+        raw = (row.get(key) or "0").strip()
+        try:
+            value = float(raw)
+        except ValueError:
+            return 0.0
+        return value if math.isfinite(value) else 0.0
+
+    for line_num, row in enumerate(csv.DictReader(text), start=2):
+        period = (row.get("Period") or "").strip()
+        project = (row.get("Project") or "").strip()
+        if not period:
+            report.error(f"Line {line_num}: missing Period")
+            continue
+        if not PERIOD_RE.match(period):
+            report.error(f"Line {line_num}: invalid period '{period}' (expected YYYY-MM)")
+            continue
+        yield (
+            period,
+            project,
+            _f(row, "DirectLabor$"),
+            _f(row, "DirectLaborHrs"),
+            _f(row, "Subk"),
+            _f(row, "ODC"),
+            _f(row, "Travel"),
+        )
+
+
+def iter_gl_chunks(text: IO[str], report: ImportReport, chunk_rows: int = CHUNK_ROWS) -> Iterator[list[tuple]]:
+    """Validated ``(period, account, amount, entity)`` tuples in chunks of ``chunk_rows``."""
+    return _chunked(_gl_rows(text, report), chunk_rows)
+
+
+def iter_direct_cost_chunks(text: IO[str], report: ImportReport, chunk_rows: int = CHUNK_ROWS) -> Iterator[list[tuple]]:
+    """Validated ``(period, project, direct_labor, direct_labor_hrs, subk, odc, travel)`` tuples in chunks."""
+    return _chunked(_direct_cost_rows(text, report), chunk_rows)
+
+
+def run_import(
+    binary: IO[bytes],
+    parse: Callable[[IO[str], ImportReport], Iterable[list[tuple]]],
+    load: Callable[[Iterable[list[tuple]]], int],
+) -> ImportReport:
+    """Decode ``binary`` as UTF-8 (falling back to Latin-1), validate it and stream it into ``load``.
+
+    ``load`` must be transactional: a UTF-8 decode error part-way through the
+    file aborts the load and the whole file is replayed as Latin-1.
+    """
+    for encoding in ("utf-8-sig", "latin-1"):
+        binary.seek(0)
+        report = ImportReport()
+        text = io.TextIOWrapper(binary, encoding=encoding, newline="")
+        try:
+            report.imported = load(parse(text, report))
+        except UnicodeDecodeError:
+            continue
+        finally:
+            text.detach()
+        report.elapsed_seconds = time.perf_counter() - report.started
+        return report
+    raise AssertionError("latin-1 decoding cannot fail")
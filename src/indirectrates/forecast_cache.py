@@ -0,0 +1,124 @@
+"""Process-level LRU cache of forecast results keyed by an input fingerprint.
+
+The report endpoints (rates table, PSR, PST) all render views of the same
+``AnalystAgent.run`` output.  ``cached_run`` fingerprints the staged input
+CSVs together with the rate config and plan, and reuses a previous result
+when nothing has changed.  Cached results are shared between callers and must
+be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .agents import AnalystAgent
+from .config import RateConfig
+from .io import INPUT_FILES
+from .types import ForecastResult
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(v) for v in value)
+    return str(value)
+
+
+def input_fingerprint(input_dir: str | Path, config: RateConfig, plan: Any, entity: str | None = None) -> str:
+    """SHA-256 over the input CSV bytes, the rate config and the plan parameters."""
+    input_dir = Path(input_dir)
+    digest = hashlib.sha256()
+    for name in INPUT_FILES:
+        path = input_dir / name
+        digest.update(name.encode())
+        if path.exists():
+            with path.open("rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    digest.update(chunk)
+        else:
+            digest.update(b"<missing>")
+    params = {
+        "config": dataclasses.asdict(config),
+        "plan": dataclasses.asdict(plan),
+        "entity": entity,
+    }
+    digest.update(json.dumps(params, sort_keys=True, default=_json_default).encode())
+    return digest.hexdigest()
+
+
+def _result_nbytes(results: list[ForecastResult]) -> int:
+    total = 0
+    for res in results:
+        for df in (res.pools, res.bases, res.rates, res.project_impacts, res.ytd_rates):
+            if df is not None:
+                total += int(df.memory_usage(deep=True).sum())
+    return total
+
+
+class ForecastCache:
+    """Thread-safe LRU of ``list[ForecastResult]`` bounded by approximate DataFrame bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[list[ForecastResult], int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> list[ForecastResult] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, results: list[ForecastResult]) -> None:
+        nbytes = _result_nbytes(results)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            self._entries[key] = (results, nbytes)
+            self._entries.move_to_end(key)
+            while self.current_bytes() > self.max_bytes:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def current_bytes(self) -> int:
+        return sum(nbytes for _, nbytes in self._entries.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes(),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+forecast_cache = ForecastCache(max_bytes=int(float(os.environ.get("FORECAST_CACHE_MAX_MB", "256")) * 1024 * 1024))
+
+
+def cached_run(input_dir: str | Path, config: RateConfig, plan: Any, entity: str | None = None) -> list[ForecastResult]:
+    """``AnalystAgent().run`` memoized on :func:`input_fingerprint`."""
+    key = input_fingerprint(input_dir, config, plan, entity)
+    results = forecast_cache.get(key)
+    if results is None:
+        results = AnalystAgent().run(input_dir=Path(input_dir), config=config, plan=plan, entity=entity)
+        forecast_cache.put(key, results)
+    return results
@@ -0,0 +1,170 @@
+"""Process pool for the CPU-bound part of ``/forecast``.
+
+Scenario projection, chart rendering (matplotlib), the Excel workbook
+(openpyxl) and zipping hold the GIL for seconds on large packs.  Run inline
+in the ``async`` handler they stall the uvicorn event loop, so every other
+request on that worker, ``/healthz`` included, waits for the forecast.
+``ForecastPool.run`` hands the work to a dedicated process pool and awaits
+the result, leaving the event loop free; ``ForecastPool.call`` is the
+blocking equivalent for background threads (the auto-forecast scheduler).
+
+Admission is bounded: at most ``max_workers`` jobs run and ``max_queue``
+more wait; beyond that ``run`` raises ``ForecastPoolBusy`` at once instead
+of letting requests pile up.  A job that has not finished within
+``timeout_seconds`` raises ``ForecastTimeout``; if it had not started yet it
+is cancelled, otherwise it keeps its slot until its worker finishes (a
+running worker process cannot be interrupted without killing its
+neighbours).
+
+Configuration (environment):
+  FORECAST_POOL_WORKERS      worker processes; 0 runs jobs on a thread instead (default 2)
+  FORECAST_POOL_MAX_QUEUE    jobs allowed to wait for a worker (default 8)
+  FORECAST_TIMEOUT_SECONDS   per-job timeout (default 300)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+
+class ForecastPoolBusy(RuntimeError):
+    """Every worker is busy and the wait queue is full."""
+
+
+class ForecastTimeout(TimeoutError):
+    """A job did not finish within the pool's timeout."""
+
+
+class ForecastPool:
+    """Bounded process pool whose jobs are awaited from async request handlers."""
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 8, timeout_seconds: float = 300.0) -> None:
+        self.max_workers = max(0, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self._durations: deque[float] = deque(maxlen=100)
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool and return its result.
+
+        ``fn`` and its arguments must be picklable (module-level function,
+        dataclasses/DataFrames).  Exceptions raised by ``fn`` propagate.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        future = self._submit(fn, *args)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._timed_out += 1
+            raise ForecastTimeout(f"forecast did not finish within {self.timeout_seconds:g}s") from None
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        with self._lock:
+            self._completed += 1
+            self._durations.append(loop.time() - started)
+        return result
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Blocking ``run`` for worker threads: the calling thread only waits, the work runs in the pool."""
+        started = time.monotonic()
+        future = self._submit(fn, *args)
+        try:
+            result = future.result(self.timeout_seconds)
+        except FutureTimeout:
+            future.cancel()
+            with self._lock:
+                self._timed_out += 1
+            raise ForecastTimeout(f"forecast did not finish within {self.timeout_seconds:g}s") from None
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        with self._lock:
+            self._completed += 1
+            self._durations.append(time.monotonic() - started)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            durations = list(self._durations)
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "timeout_seconds": self.timeout_seconds,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - max(1, self.max_workers)),
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_run_seconds": round(sum(durations) / len(durations), 3) if durations else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # -- internals ----------------------------------------------------------
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            if self._in_flight >= max(1, self.max_workers) + self.max_queue:
+                self._rejected += 1
+                raise ForecastPoolBusy(
+                    f"{self._in_flight} forecasts already running or queued; try again shortly"
+                )
+            try:
+                future = self._ensure_executor().submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); start a fresh pool for this and later jobs.
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                future = self._ensure_executor().submit(fn, *args)
+            self._in_flight += 1
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _ensure_executor(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers == 0:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forecast")
+            else:
+                # spawn: never fork a process that is running the event loop and DB pool threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+        return self._executor
+
+
+forecast_pool = ForecastPool(
+    max_workers=int(os.environ.get("FORECAST_POOL_WORKERS", "2")),
+    max_queue=int(os.environ.get("FORECAST_POOL_MAX_QUEUE", "8")),
+    timeout_seconds=float(os.environ.get("FORECAST_TIMEOUT_SECONDS", "300")),
+)
@@ -1,26 +1,72 @@
 from __future__ import annotations
 
+import io
+import zipfile
 from pathlib import Path
+from typing import IO
 
 import pandas as pd
 
 from .types import Inputs
 
+INPUT_FILES = ("GL_Actuals.csv", "Account_Map.csv", "Direct_Costs_By_Project.csv", "Scenario_Events.csv")
+
+
+def read_input_csv(source: str | Path | bytes | IO[bytes]) -> pd.DataFrame:
+    """Parse one input CSV from a path, raw bytes, or a binary buffer."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    # Force Account column to string so codes like "7100.10" aren't truncated to 7100.1
+    return pd.read_csv(source, dtype={"Account": str})
+
 
 def _read_csv(path: Path) -> pd.DataFrame:
     if not path.exists():
         raise FileNotFoundError(f"Missing required input: {path}")
-    # Force Account column to string so codes like "7100.10" aren't truncated to 7100.1
-    return pd.read_csv(path, dtype={"Account": str})
+    return read_input_csv(path)
+
+
+def read_zip_frames(source: str | Path | IO[bytes]) -> dict[str, pd.DataFrame]:
+    """Parse the ``INPUT_FILES`` present in a ZIP archive (path or seekable binary stream).
+
+    Members are parsed straight from the archive stream; nothing is extracted
+    to disk and no member is read into memory whole.
+    """
+    frames: dict[str, pd.DataFrame] = {}
+    with zipfile.ZipFile(source, "r") as zf:
+        members = set(zf.namelist())
+        for name in INPUT_FILES:
+            if name in members:
+                with zf.open(name) as member:
+                    frames[name] = read_input_csv(member)
+    return frames
+
+
+def load_inputs(source: str | Path | IO[bytes]) -> Inputs:
+    """Load the four input CSVs from a directory, a ZIP file, or a binary ZIP stream."""
+    if isinstance(source, (str, Path)) and Path(source).is_dir():
+        input_dir = Path(source)
+        return Inputs(
+            gl_actuals=_read_csv(input_dir / "GL_Actuals.csv"),
+            account_map=_read_csv(input_dir / "Account_Map.csv"),
+            direct_costs=_read_csv(input_dir / "Direct_Costs_By_Project.csv"),
+            scenario_events=_read_csv(input_dir / "Scenario_Events.csv"),
+        )
+    if isinstance(source, (str, Path)) and not Path(source).exists():
+        raise FileNotFoundError(f"Missing required input: {source}")
+    return inputs_from_frames(read_zip_frames(source))
 
 
-def load_inputs(input_dir: str | Path) -> Inputs:
-    input_dir = Path(input_dir)
+def inputs_from_frames(frames: dict[str, pd.DataFrame]) -> Inputs:
+    """Build ``Inputs`` from frames keyed by input file name (see ``INPUT_FILES``)."""
+    missing = [name for name in INPUT_FILES if name not in frames]
+    if missing:
+        raise FileNotFoundError(f"Missing required inputs: {', '.join(missing)}")
     return Inputs(
-        gl_actuals=_read_csv(input_dir / "GL_Actuals.csv"),
-        account_map=_read_csv(input_dir / "Account_Map.csv"),
-        direct_costs=_read_csv(input_dir / "Direct_Costs_By_Project.csv"),
-        scenario_events=_read_csv(input_dir / "Scenario_Events.csv"),
+        gl_actuals=frames["GL_Actuals.csv"],
+        account_map=frames["Account_Map.csv"],
+        direct_costs=frames["Direct_Costs_By_Project.csv"],
+        scenario_events=frames["Scenario_Events.csv"],
     )
 
 
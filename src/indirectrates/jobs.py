@@ -0,0 +1,234 @@
+"""Durable forecast job queue backed by the ``forecast_jobs`` table.
+
+``POST /forecast`` with ``async_job=true`` resolves inputs and config exactly
+like a synchronous request, snapshots them into a job row and returns its id
+immediately.  Worker processes (started by ``indirectrates serve
+--job-workers N``) claim queued rows with ``SELECT ... FOR UPDATE SKIP
+LOCKED``, so any number of workers across hosts can share one queue without
+double-running a job.  Workers heartbeat from a background thread while a
+job runs, and only the worker still holding a claim may record its outcome.
+A job whose heartbeat goes stale (worker crashed or was killed) is requeued,
+or failed once it has used up its attempts.  Queued jobs survive API restarts.
+
+Configuration (environment):
+  FORECAST_JOB_WORKERS        worker processes started by ``serve`` (default 1)
+  FORECAST_JOB_POLL_SECONDS   idle sleep between claim attempts (default 1)
+  FORECAST_JOB_STALE_SECONDS  heartbeat age after which a running job is recovered (default 600)
+  FORECAST_JOB_MAX_ATTEMPTS   claims before a repeatedly stalled job is failed (default 3)
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import uuid
+import zipfile
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Iterator
+
+import pandas as pd
+
+from . import db
+from .agents import AnalystAgent, PlannerAgent
+from .config import RateConfig
+from .io import INPUT_FILES, load_inputs
+from .types import Inputs
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+def pack_inputs(inputs: Inputs) -> bytes:
+    """Zip ``inputs`` as the standard input CSVs."""
+    frames = dict(zip(INPUT_FILES, (inputs.gl_actuals, inputs.account_map, inputs.direct_costs, inputs.scenario_events)))
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, df in frames.items():
+            zf.writestr(name, df.to_csv(index=False))
+    return buf.getvalue()
+
+
+def unpack_inputs(data: bytes) -> Inputs:
+    return load_inputs(io.BytesIO(data))
+
+
+def submit_forecast_job(
+    user_id: str,
+    fiscal_year_id: int | None,
+    inputs: Inputs,
+    config: RateConfig,
+    scenario: str | None,
+    forecast_months: int,
+    run_rate_months: int,
+    fy_start: str | None = None,
+    entity: str | None = None,
+) -> str:
+    """Queue a forecast over already-resolved inputs and return the job id."""
+    params = {
+        "scenario": scenario,
+        "forecast_months": forecast_months,
+        "run_rate_months": run_rate_months,
+        "fy_start": fy_start,
+        "entity": entity,
+    }
+    conn = db.get_connection()
+    try:
+        return db.enqueue_forecast_job(
+            conn,
+            job_id=uuid.uuid4().hex,
+            user_id=user_id,
+            fiscal_year_id=fiscal_year_id,
+            params_json=json.dumps(params),
+            config_json=json.dumps(config.to_mapping()),
+            inputs_zip=pack_inputs(inputs),
+        )
+    finally:
+        conn.close()
+
+
+class _ClaimLost(Exception):
+    """The job was requeued and possibly re-claimed by another worker."""
+
+
+@contextmanager
+def _heartbeat(job_id: str, worker: str, interval: float) -> Iterator[None]:
+    """Refresh the job's heartbeat every ``interval`` seconds on a separate connection."""
+    stop = threading.Event()
+
+    def _beat() -> None:
+        while not stop.wait(interval):
+            try:
+                conn = db.get_connection()
+                try:
+                    if not db.heartbeat_forecast_job(conn, job_id, worker):
+                        logger.warning("forecast job %s: %s no longer holds the claim", job_id, worker)
+                        return
+                finally:
+                    conn.close()
+            except Exception:
+                logger.exception("forecast job %s: heartbeat failed", job_id)
+
+    thread = threading.Thread(target=_beat, name=f"forecast-job-heartbeat-{job_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def execute_job(conn: Any, job: dict[str, Any]) -> None:
+    """Run one claimed job to completion, recording progress, result or error on its row.
+
+    A background thread heartbeats the row for the whole run (every quarter of
+    ``FORECAST_JOB_STALE_SECONDS``), so long compute or packaging steps are not
+    mistaken for a dead worker.
+    """
+    from .server import _package_results
+
+    job_id = job["id"]
+    worker = job["worker"]
+
+    def _progress(step: str) -> None:
+        if not db.update_forecast_job_progress(conn, job_id, worker, step):
+            raise _ClaimLost(step)
+
+    interval = max(_env_float("FORECAST_JOB_STALE_SECONDS", 600.0) / 4, 0.05)
+    with _heartbeat(job_id, worker, interval):
+        try:
+            params = json.loads(job["params_json"] or "{}")
+            _progress("loading inputs")
+            inputs = unpack_inputs(job["inputs_zip"])
+            cfg = RateConfig.from_mapping(json.loads(job["config_json"] or "{}"))
+            plan = PlannerAgent().plan(
+                scenario=params.get("scenario"),
+                forecast_months=int(params["forecast_months"]),
+                run_rate_months=int(params["run_rate_months"]),
+                events=inputs.scenario_events,
+            )
+            if params.get("fy_start"):
+                plan = replace(plan, fy_start=pd.Period(params["fy_start"], freq="M"))
+
+            _progress("computing")
+            results = AnalystAgent().run(input_dir=inputs, config=cfg, plan=plan, entity=params.get("entity"))
+
+            _progress("packaging")
+            payload, run_id = _package_results(
+                results,
+                fiscal_year_id=job["fiscal_year_id"],
+                scenario=params.get("scenario"),
+                forecast_months=plan.forecast_months,
+                run_rate_months=plan.run_rate_months,
+                trigger="job",
+            )
+            if db.finish_forecast_job(conn, job_id, worker, payload, run_id=run_id):
+                logger.info("forecast job %s succeeded run_id=%s", job_id, run_id)
+            else:
+                logger.warning("forecast job %s: %s lost the claim; result run_id=%s not recorded", job_id, worker, run_id)
+        except _ClaimLost as exc:
+            logger.warning("forecast job %s: %s lost the claim before %s; abandoning", job_id, worker, exc)
+        except Exception as exc:
+            logger.exception("forecast job %s failed", job_id)
+            conn.rollback()
+            if not db.fail_forecast_job(conn, job_id, worker, f"{exc.__class__.__name__}: {exc}"):
+                logger.warning("forecast job %s: %s lost the claim; failure not recorded", job_id, worker)
+
+
+def run_worker(stop: threading.Event | None = None, poll_seconds: float | None = None) -> None:
+    """Claim and execute jobs until ``stop`` is set (forever when ``None``)."""
+    stop = stop or threading.Event()
+    poll = poll_seconds if poll_seconds is not None else _env_float("FORECAST_JOB_POLL_SECONDS", 1.0)
+    stale_seconds = _env_float("FORECAST_JOB_STALE_SECONDS", 600.0)
+    max_attempts = int(_env_float("FORECAST_JOB_MAX_ATTEMPTS", 3))
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    backoff = poll
+    logger.info("forecast job worker %s started", worker)
+    while not stop.is_set():
+        try:
+            conn = db.get_connection()
+            try:
+                recovered = db.requeue_stale_forecast_jobs(conn, stale_seconds, max_attempts)
+                if recovered:
+                    logger.warning("recovered %d stale forecast job(s)", recovered)
+                job = db.claim_forecast_job(conn, worker)
+                if job is not None:
+                    execute_job(conn, job)
+            finally:
+                conn.close()
+            backoff = poll
+        except Exception:
+            logger.exception("forecast job worker %s: database error, retrying in %.1fs", worker, backoff)
+            stop.wait(backoff)
+            backoff = min(backoff * 2, 60.0)
+            continue
+        if job is None:
+            stop.wait(poll)
+
+
+def _worker_main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    db.init_db()
+    run_worker()
+
+
+def start_worker_processes(count: int) -> list[multiprocessing.process.BaseProcess]:
+    """Start ``count`` daemon worker processes; they exit with the parent."""
+    ctx = multiprocessing.get_context("spawn")
+    procs = []
+    for i in range(count):
+        proc = ctx.Process(target=_worker_main, name=f"forecast-job-worker-{i}", daemon=True)
+        proc.start()
+        procs.append(proc)
+    return procs
@@ -15,10 +15,14 @@ def map_accounts_to_pools(gl_actuals: pd.DataFrame, account_map: pd.DataFrame) -
 
     missing = int(merged["Pool"].isna().sum())
     if missing:
-        warnings.append(f"{missing} GL rows have no Account_Map match; treated as Unmapped (excluded from pools).")
+        warnings.append(unmapped_rows_warning(missing))
         merged["Pool"] = merged["Pool"].fillna("Unmapped")
         merged["IsUnallowable"] = merged["IsUnallowable"].fillna(True)
 
     merged["IsUnallowable"] = merged["IsUnallowable"].fillna(False).astype(bool)
     merged["Amount"] = pd.to_numeric(merged["Amount"], errors="coerce").fillna(0.0)
     return merged, warnings
+
+
+def unmapped_rows_warning(count: int) -> str:
+    return f"{count} GL rows have no Account_Map match; treated as Unmapped (excluded from pools)."
@@ -11,11 +11,39 @@ from .config import RateConfig
 
 @dataclass(frozen=True)
 class Projection:
+    """Projected pools, bases and direct costs over the forecast horizon.
+
+    Scenario projections are copy-on-write views of the baseline: frames and
+    columns a scenario does not change are shared with the baseline rather
+    than copied, so treat these frames as read-only.
+    """
+
     pools: pd.DataFrame  # Period x PoolName
     bases: pd.DataFrame  # Period x BaseKey
     direct_by_project: pd.DataFrame  # Period, Project, direct cost columns
     assumptions: dict[str, Any]
     warnings: list[str]
+    # Cached Period x direct cost column totals of direct_by_project
+    direct_by_period: pd.DataFrame | None = None
+
+
+_DIRECT_COST_COLUMNS = ["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]
+
+
+def _shallow(df: pd.DataFrame) -> pd.DataFrame:
+    """New frame sharing column data with ``df``; replacing a column leaves ``df`` untouched."""
+    return df.copy(deep=False)
+
+
+def _fill_zero(df: pd.DataFrame) -> pd.DataFrame:
+    """fillna(0.0) that only materializes the columns actually containing NaN."""
+    missing = [col for col in df.columns if df[col].isna().any()]
+    if not missing:
+        return df
+    df = _shallow(df)
+    for col in missing:
+        df[col] = df[col].fillna(0.0)
+    return df
 
 
 def _month_range(start: pd.Period, end: pd.Period) -> pd.PeriodIndex:
@@ -27,6 +55,11 @@ def _safe_div(num: pd.Series, den: pd.Series) -> pd.Series:
     return (num / den).fillna(0.0)
 
 
+def _direct_by_period(direct_by_project: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate direct-by-project rows to Period x direct cost column totals."""
+    return direct_by_project.groupby("Period", as_index=True)[_DIRECT_COST_COLUMNS].sum().sort_index()
+
+
 def _bases_from_direct_costs(by_period: pd.DataFrame) -> pd.DataFrame:
     """Compute base DataFrame from aggregated direct costs by period."""
     bases = pd.DataFrame(index=by_period.index)
@@ -43,6 +76,27 @@ def compute_actual_aggregates(
     config: RateConfig,
     entity: str | None = None,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str]]:
+    pools, bases, direct_by_project, warnings = aggregate_period_actuals(gl_mapped, direct_costs, config, entity)
+    pools = pools.fillna(0.0)
+    warnings.extend(actual_aggregate_warnings(pools, bases, direct_by_project, config, entity))
+    return pools, bases, direct_by_project, warnings
+
+
+def aggregate_period_actuals(
+    gl_mapped: pd.DataFrame,
+    direct_costs: pd.DataFrame,
+    config: RateConfig,
+    entity: str | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str]]:
+    """Pools, bases and direct-by-project actuals, computed period by period.
+
+    Every output row depends only on source rows of the same period, so the
+    result for a set of periods can be recomputed from just those periods'
+    rows and concatenated with the others (see ``aggregate_store``).  ``pools``
+    is NaN where a period has no GL rows for a pool, so concatenated parts
+    keep exactly the pool columns a single pass would produce.  Checks that
+    need the whole history live in ``actual_aggregate_warnings``.
+    """
     warnings: list[str] = []
 
     gl_valid = gl_mapped[~gl_mapped["IsUnallowable"]].copy()
@@ -52,8 +106,6 @@ def compute_actual_aggregates(
     if entity:
         if "Entity" in gl_valid.columns:
             gl_valid = gl_valid[gl_valid["Entity"].astype(str) == entity]
-            if gl_valid.empty:
-                warnings.append(f"No GL data found for entity '{entity}'.")
         else:
             warnings.append("Entity filter requested but GL_Actuals has no Entity column.")
         if "Entity" in direct_costs.columns:
@@ -63,7 +115,6 @@ def compute_actual_aggregates(
         gl_valid.groupby(["Period", "Pool"], as_index=False)["Amount"]
         .sum()
         .pivot(index="Period", columns="Pool", values="Amount")
-        .fillna(0.0)
         .sort_index()
     )
 
@@ -78,36 +129,67 @@ def compute_actual_aggregates(
         if col != "Project":
             direct[col] = pd.to_numeric(direct[col], errors="coerce").fillna(0.0)
 
-    by_period = direct.groupby("Period", as_index=True)[
-        ["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]
-    ].sum()
-
-    dc_bases = _bases_from_direct_costs(by_period)
+    direct_by_project = direct[["Period", "Project", "DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]].copy()
 
+    base_totals = None
     if config.base_account_map:
         # GL-primary: compute bases from GL trial balance accounts
         all_gl = gl_mapped.copy()
         all_gl["Amount"] = pd.to_numeric(all_gl["Amount"], errors="coerce").fillna(0.0)
+        base_totals = {
+            base_key: all_gl[all_gl["Account"].isin(accounts)].groupby("Period")["Amount"].sum()
+            for base_key, accounts in config.base_account_map.items()
+        }
+    bases = actual_bases(direct_by_project, pools.index, base_totals)
+    return pools, bases, direct_by_project, warnings
+
 
-        gl_bases = pd.DataFrame(index=pools.index)
-        for base_key, accounts in config.base_account_map.items():
-            mask = all_gl["Account"].isin(accounts)
-            agg = all_gl[mask].groupby("Period")["Amount"].sum().reindex(pools.index, fill_value=0.0)
-            gl_bases[base_key] = agg
+def actual_bases(
+    direct_by_project: pd.DataFrame,
+    periods: pd.Index,
+    base_totals: dict[str, pd.Series] | None = None,
+) -> pd.DataFrame:
+    """Actual bases by period.
 
-        # Ensure standard derived keys exist
-        if "DL" in gl_bases.columns and "TL" not in gl_bases.columns:
-            gl_bases["TL"] = gl_bases["DL"]
+    With ``base_totals`` (GL totals by period for each ``base_account_map`` key)
+    the bases are GL-primary over ``periods``; otherwise they come from the
+    direct-cost ledger (legacy CSV-only mode).  DLH always comes from direct
+    costs, since GL holds dollar amounts only.
+    """
+    dc_bases = _bases_from_direct_costs(_direct_by_period(direct_by_project))
+    if base_totals is None:
+        return dc_bases
 
-        # DLH can't come from GL (dollar amounts only) — always use Direct_Costs
-        gl_bases["DLH"] = dc_bases["DLH"].reindex(gl_bases.index, fill_value=0.0)
+    gl_bases = pd.DataFrame(index=periods)
+    for base_key, totals in base_totals.items():
+        gl_bases[base_key] = totals.reindex(periods, fill_value=0.0)
 
-        bases = gl_bases
+    # Ensure standard derived keys exist
+    if "DL" in gl_bases.columns and "TL" not in gl_bases.columns:
+        gl_bases["TL"] = gl_bases["DL"]
+
+    gl_bases["DLH"] = dc_bases["DLH"].reindex(gl_bases.index, fill_value=0.0)
+    return gl_bases
+
+
+def actual_aggregate_warnings(
+    pools: pd.DataFrame,
+    bases: pd.DataFrame,
+    direct_by_project: pd.DataFrame,
+    config: RateConfig,
+    entity: str | None = None,
+) -> list[str]:
+    """Whole-history checks on the output of ``aggregate_period_actuals``."""
+    warnings: list[str] = []
+    if entity and pools.empty:
+        warnings.append(f"No GL data found for entity '{entity}'.")
 
+    if config.base_account_map:
         # Reconciliation warning: compare GL-derived vs Direct_Costs-derived bases
+        dc_bases = _bases_from_direct_costs(_direct_by_period(direct_by_project))
         for key in ["DL", "TCI"]:
-            if key in gl_bases.columns and key in dc_bases.columns:
-                gl_total = gl_bases[key].sum()
+            if key in bases.columns and key in dc_bases.columns:
+                gl_total = bases[key].sum()
                 dc_total = dc_bases[key].sum()
                 if dc_total > 0:
                     pct_diff = abs(gl_total - dc_total) / dc_total
@@ -117,12 +199,7 @@ def compute_actual_aggregates(
                             f"project ledger (${dc_total:,.0f}) by {pct_diff:.1%}. "
                             f"Reconcile GL direct accounts with project direct costs."
                         )
-    else:
-        # Fallback: bases from Direct_Costs_By_Project (legacy CSV-only mode)
-        bases = dc_bases
-
-    direct_by_project = direct[["Period", "Project", "DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]].copy()
-    return pools, bases, direct_by_project, warnings
+    return warnings
 
 
 def build_baseline_projection(
@@ -173,6 +250,7 @@ def build_baseline_projection(
         direct_by_project=direct_proj,
         assumptions=assumptions,
         warnings=warnings,
+        direct_by_period=_direct_by_period(direct_proj),
     )
 
 
@@ -195,13 +273,45 @@ def _project_direct_costs_run_rate(
     return existing.reset_index()
 
 
+# (direct cost column, scenario event delta column)
+_DIRECT_DELTA_COLUMNS: list[tuple[str, str]] = [
+    ("DirectLabor$", "DeltaDirectLabor$"),
+    ("DirectLaborHrs", "DeltaDirectLaborHrs"),
+    ("Subk", "DeltaSubk"),
+    ("ODC", "DeltaODC"),
+    ("Travel", "DeltaTravel"),
+]
+
+
+def _cumulative_step_deltas(
+    grid: np.ndarray,
+    effective: np.ndarray,
+    groups: np.ndarray,
+    n_groups: int,
+    deltas: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build the period x group x column step function for a batch of events.
+
+    ``grid`` holds sorted period ordinals. Each event adds its row of ``deltas``
+    to its group from its effective period onward. Returns the cumulative deltas
+    and the number of events in effect at each (period, group).
+    """
+    pos = np.searchsorted(grid, effective, side="left")
+    keep = pos < len(grid)
+    steps = np.zeros((len(grid), n_groups, deltas.shape[1]))
+    counts = np.zeros((len(grid), n_groups), dtype=np.int64)
+    np.add.at(steps, (pos[keep], groups[keep]), deltas[keep])
+    np.add.at(counts, (pos[keep], groups[keep]), 1)
+    return steps.cumsum(axis=0), counts.cumsum(axis=0)
+
+
 def apply_scenario_events(
     projection: Projection,
     scenario_events: pd.DataFrame,
     scenario: str,
     config: RateConfig | None = None,
 ) -> Projection:
-    events = scenario_events.copy()
+    events = scenario_events
     if len(events.index) == 0 or "EffectivePeriod" not in events.columns:
         return projection
 
@@ -211,8 +321,9 @@ def apply_scenario_events(
     if len(events.index) == 0:
         return projection
 
-    pools = projection.pools.copy()
-    direct = projection.direct_by_project.copy()
+    # Copy-on-write: start from the baseline frames and only replace what this scenario changes.
+    pools = projection.pools
+    direct = projection.direct_by_project
 
     def _num(col: str) -> pd.Series:
         if col not in events.columns:
@@ -223,14 +334,7 @@ def apply_scenario_events(
     events["Project"] = events.get("Project", "").fillna("").astype(str)
 
     # Direct cost delta columns (fixed)
-    direct_delta_cols = [
-        "DeltaDirectLabor$",
-        "DeltaDirectLaborHrs",
-        "DeltaSubk",
-        "DeltaODC",
-        "DeltaTravel",
-    ]
-    for col in direct_delta_cols:
+    for _, col in _DIRECT_DELTA_COLUMNS:
         events[col] = _num(col)
 
     # Auto-detect pool delta columns: DeltaPool<Name> → pool <Name>
@@ -245,90 +349,137 @@ def apply_scenario_events(
             pool_delta_map[col] = pool_name
             events[col] = _num(col)
 
-    for _, event in events.iterrows():
-        eff: pd.Period = event["EffectivePeriod"]
-        applicable_periods = pools.index[pools.index >= eff]
-        if len(applicable_periods) == 0:
-            continue
+    eff_ordinals = pd.PeriodIndex(events["EffectivePeriod"], freq="M").asi8
+    pool_ordinals = projection.pools.index.asi8
+    # An event only applies if at least one projected period falls on or after it.
+    applicable = (eff_ordinals != pd.NaT.value) & (eff_ordinals <= pool_ordinals.max(initial=pd.NaT.value))
+    applied = events[applicable]
+    applied_effs = eff_ordinals[applicable]
 
-        for delta_col, pool_name in pool_delta_map.items():
+    if len(applied.index) > 0 and pool_delta_map:
+        pools = _shallow(pools)
+        for pool_name in pool_delta_map.values():
             if pool_name not in pools.columns:
                 pools[pool_name] = 0.0
-            pools.loc[applicable_periods, pool_name] += float(event[delta_col])
-
-        project = str(event["Project"] or "").strip()
-        if project:
-            mask = (direct["Project"] == project) & (direct["Period"] >= eff)
-            for col, delta_col in [
-                ("DirectLabor$", "DeltaDirectLabor$"),
-                ("DirectLaborHrs", "DeltaDirectLaborHrs"),
-                ("Subk", "DeltaSubk"),
-                ("ODC", "DeltaODC"),
-                ("Travel", "DeltaTravel"),
-            ]:
-                direct.loc[mask, col] = pd.to_numeric(direct.loc[mask, col], errors="coerce").fillna(0.0) + float(
-                    event[delta_col]
-                )
+        # Several DeltaPool columns may resolve to the same pool (e.g. "GA" and "G&A").
+        pool_names = list(dict.fromkeys(pool_delta_map.values()))
+        pool_deltas = np.zeros((len(applied.index), len(pool_names)))
+        for delta_col, pool_name in pool_delta_map.items():
+            pool_deltas[:, pool_names.index(pool_name)] += applied[delta_col].to_numpy(dtype=float)
+
+        grid = np.unique(pool_ordinals)
+        steps, _ = _cumulative_step_deltas(
+            grid, applied_effs, np.zeros(len(applied.index), dtype=np.int64), 1, pool_deltas
+        )
+        row_pos = np.searchsorted(grid, pool_ordinals)
+        for j, pool_name in enumerate(pool_names):
+            pools[pool_name] = pools[pool_name].to_numpy(dtype=float) + steps[row_pos, 0, j]
+
+    # Per-period totals of this scenario's direct cost deltas, aligned to the cached baseline aggregate.
+    baseline_by_period = projection.direct_by_period
+    if baseline_by_period is None:
+        baseline_by_period = _direct_by_period(projection.direct_by_project)
+    period_deltas = pd.DataFrame(0.0, index=baseline_by_period.index, columns=_DIRECT_COST_COLUMNS)
+
+    projects = applied["Project"].str.strip()
+    project_events = projects != ""
+    if project_events.any() and len(direct.index) > 0:
+        event_projects = pd.Index(projects[project_events].unique())
+        event_groups = event_projects.get_indexer(projects[project_events])
+        direct_deltas = applied.loc[project_events, [delta for _, delta in _DIRECT_DELTA_COLUMNS]].to_numpy(dtype=float)
+
+        direct_ordinals = pd.PeriodIndex(direct["Period"], freq="M").asi8
+        grid = np.unique(direct_ordinals)
+        steps, counts = _cumulative_step_deltas(
+            grid, applied_effs[project_events.to_numpy()], event_groups, len(event_projects), direct_deltas
+        )
+
+        row_groups = event_projects.get_indexer(direct["Project"])
+        row_pos = np.searchsorted(grid, direct_ordinals)
+        touched = np.flatnonzero((row_groups >= 0) & (counts[row_pos, np.maximum(row_groups, 0)] > 0))
+        if len(touched) > 0:
+            row_steps = steps[row_pos[touched], row_groups[touched], :]
+            direct = _shallow(direct)
+            for j, (col, _) in enumerate(_DIRECT_DELTA_COLUMNS):
+                updated = direct[col].copy()
+                current = pd.to_numeric(updated.iloc[touched], errors="coerce").fillna(0.0).to_numpy()
+                updated.iloc[touched] = current + row_steps[:, j]
+                direct[col] = updated
+
+            grid_deltas = np.zeros((len(grid), len(_DIRECT_DELTA_COLUMNS)))
+            np.add.at(grid_deltas, row_pos[touched], row_steps)
+            period_deltas = (
+                pd.DataFrame(grid_deltas, index=pd.PeriodIndex.from_ordinals(grid, freq="M"), columns=_DIRECT_COST_COLUMNS)
+                .reindex(baseline_by_period.index, fill_value=0.0)
+            )
 
     # Recompute bases so impacts and rates reconcile.
     use_gl_bases = config is not None and bool(config.base_account_map)
+    bases = _shallow(projection.bases)
+    by_period = baseline_by_period + period_deltas
 
     if use_gl_bases:
         # GL-primary mode: apply aggregate direct cost deltas to the GL-derived bases
         # rather than recomputing entirely from direct_by_project.
-        bases = projection.bases.copy()
-        orig_by_period = (
-            projection.direct_by_project.groupby("Period", as_index=True)[
-                ["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]
-            ].sum().sort_index()
-        )
-        new_by_period = (
-            direct.groupby("Period", as_index=True)[
-                ["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]
-            ].sum().sort_index()
-        )
-        for idx in bases.index:
-            if idx in new_by_period.index and idx in orig_by_period.index:
-                dl_delta = new_by_period.loc[idx, "DirectLabor$"] - orig_by_period.loc[idx, "DirectLabor$"]
-                hrs_delta = new_by_period.loc[idx, "DirectLaborHrs"] - orig_by_period.loc[idx, "DirectLaborHrs"]
-                subk_delta = new_by_period.loc[idx, "Subk"] - orig_by_period.loc[idx, "Subk"]
-                odc_delta = new_by_period.loc[idx, "ODC"] - orig_by_period.loc[idx, "ODC"]
-                travel_delta = new_by_period.loc[idx, "Travel"] - orig_by_period.loc[idx, "Travel"]
-                if "DL" in bases.columns:
-                    bases.loc[idx, "DL"] += dl_delta
-                if "TL" in bases.columns:
-                    bases.loc[idx, "TL"] += dl_delta
-                if "DLH" in bases.columns:
-                    bases.loc[idx, "DLH"] += hrs_delta
-                if "TCI" in bases.columns:
-                    bases.loc[idx, "TCI"] += dl_delta + subk_delta + odc_delta + travel_delta
+        deltas = period_deltas.reindex(bases.index, fill_value=0.0)
+        dl_delta = deltas["DirectLabor$"]
+        if "DL" in bases.columns:
+            bases["DL"] = bases["DL"] + dl_delta
+        if "TL" in bases.columns:
+            bases["TL"] = bases["TL"] + dl_delta
+        if "DLH" in bases.columns:
+            bases["DLH"] = bases["DLH"] + deltas["DirectLaborHrs"]
+        if "TCI" in bases.columns:
+            bases["TCI"] = bases["TCI"] + dl_delta + deltas["Subk"] + deltas["ODC"] + deltas["Travel"]
     else:
         # Fallback: recompute bases entirely from direct-by-project
-        by_period = (
-            direct.groupby("Period", as_index=True)[
-                ["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]
-            ].sum().sort_index()
-        )
-        bases = projection.bases.copy()
-        for idx in bases.index:
-            if idx in by_period.index:
-                bases.loc[idx, "DL"] = by_period.loc[idx, "DirectLabor$"]
-                bases.loc[idx, "DLH"] = by_period.loc[idx, "DirectLaborHrs"]
-                bases.loc[idx, "TL"] = by_period.loc[idx, "DirectLabor$"]
-                bases.loc[idx, "TCI"] = by_period.loc[idx, ["DirectLabor$", "Subk", "ODC", "Travel"]].sum()
+        in_direct = bases.index.isin(by_period.index)
+        recomputed = by_period.reindex(bases.index)
+        for key, values in [
+            ("DL", recomputed["DirectLabor$"]),
+            ("DLH", recomputed["DirectLaborHrs"]),
+            ("TL", recomputed["DirectLabor$"]),
+            ("TCI", recomputed[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1)),
+        ]:
+            current = bases[key] if key in bases.columns else pd.Series(np.nan, index=bases.index)
+            bases[key] = values.where(in_direct, current)
 
     assumptions = dict(projection.assumptions)
     assumptions["scenario"] = scenario
     assumptions["events_applied"] = int(len(events.index))
     return Projection(
-        pools=pools.fillna(0.0),
-        bases=bases.fillna(0.0),
+        pools=_fill_zero(pools),
+        bases=_fill_zero(bases),
         direct_by_project=direct,
         assumptions=assumptions,
         warnings=projection.warnings,
+        direct_by_period=by_period,
     )
 
 
+def _cascade_allocation(base: np.ndarray, rates: np.ndarray, cascade_orders: list[int]) -> np.ndarray:
+    """Indirect $ per row and rate, applying rates in cascade order.
+
+    ``base`` and ``rates`` are rows x rates arrays whose columns are sorted by
+    ``cascade_orders``. Tier 0 applies to the raw direct base; later tiers apply to
+    the base plus all indirect $ from strictly lower tiers, tracked in a running
+    accumulator (NaN dollars contribute nothing to later tiers).
+    """
+    dollars = np.empty_like(base, dtype=float)
+    prior = np.zeros(base.shape[0])
+    tier_total = np.zeros(base.shape[0])
+    current_tier: int | None = None
+    for j, order in enumerate(cascade_orders):
+        if order != current_tier:
+            prior += tier_total
+            tier_total = np.zeros(base.shape[0])
+            current_tier = order
+        apply_to = base[:, j] if order == 0 else base[:, j] + prior
+        dollars[:, j] = apply_to * rates[:, j]
+        tier_total += np.nan_to_num(dollars[:, j], nan=0.0, posinf=np.inf, neginf=-np.inf)
+    return dollars
+
+
 def compute_rates_and_impacts(
     projection: Projection,
     config: RateConfig,
@@ -342,9 +493,9 @@ def compute_rates_and_impacts(
         base = projection.bases[rate_def.base]
         rates[rate_name] = _safe_div(pool_total, base)
 
-    direct = projection.direct_by_project.copy()
-    direct["TCI"] = direct[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1)
-    direct = direct.merge(rates.reset_index().rename(columns={"index": "Period"}), on="Period", how="left")
+    direct = projection.direct_by_project
+    tci = direct[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1).to_numpy(dtype=float)
+    period_index = pd.Index(direct["Period"])
 
     # Dynamically compute loaded costs from config rate definitions
     _base_column_map = {
@@ -356,39 +507,23 @@ def compute_rates_and_impacts(
 
     # Sort rates by cascade_order for cascaded application
     sorted_rates = sorted(config.rates.items(), key=lambda x: x[1].cascade_order)
+    rate_names = [rate_name for rate_name, _ in sorted_rates]
+    cascade_orders = [rate_def.cascade_order for _, rate_def in sorted_rates]
 
-    indirect_dollar_cols: list[str] = []
-    # Track which indirect $ cols belong to each cascade tier
-    cols_by_tier: dict[int, list[str]] = {}
-
-    for rate_name, rate_def in sorted_rates:
+    # Rows x tiers matrix of the direct cost each rate applies to, shared by the monthly and YTD passes
+    base_matrix = np.empty((len(direct.index), len(sorted_rates)))
+    for j, (_, rate_def) in enumerate(sorted_rates):
         base_col = _base_column_map.get(rate_def.base, rate_def.base)
-        dollar_col = f"{rate_name}$"
+        base_matrix[:, j] = tci if base_col == "TCI" else direct[base_col].to_numpy(dtype=float)
 
-        if rate_def.cascade_order == 0:
-            # First tier: use raw direct cost column
-            apply_to = direct[base_col]
-        else:
-            # Later tiers: base includes raw directs + all prior-tier indirect $
-            prior_cols = []
-            for tier, tier_cols in cols_by_tier.items():
-                if tier < rate_def.cascade_order:
-                    prior_cols.extend(tier_cols)
-            if prior_cols:
-                prior_indirect = direct[prior_cols].sum(axis=1)
-                apply_to = direct[base_col] + prior_indirect
-            else:
-                apply_to = direct[base_col]
-
-        direct[dollar_col] = apply_to * direct.get(rate_name, 0.0)
-        indirect_dollar_cols.append(dollar_col)
-        cols_by_tier.setdefault(rate_def.cascade_order, []).append(dollar_col)
-
-    direct["LoadedCost$"] = direct["TCI"] + direct[indirect_dollar_cols].sum(axis=1)
+    monthly_rates = rates.reindex(index=period_index, columns=rate_names).to_numpy(dtype=float)
+    indirect_dollars = _cascade_allocation(base_matrix, monthly_rates, cascade_orders)
+    indirect_dollar_cols = [f"{rate_name}$" for rate_name in rate_names]
+    value_blocks = [indirect_dollars, np.nansum(indirect_dollars, axis=1, keepdims=True) + tci[:, None]]
+    value_cols = indirect_dollar_cols + ["LoadedCost$"]
 
     # --- YTD-based allocation ---
     ytd_rates_df: pd.DataFrame | None = None
-    ytd_indirect_dollar_cols: list[str] = []
 
     if fy_start is not None:
         from .ytd import compute_ytd_rates
@@ -397,50 +532,21 @@ def compute_rates_and_impacts(
         ytd_rates_df = compute_ytd_rates(projection.pools, projection.bases, rate_defs, fy_start)
 
         if not ytd_rates_df.empty:
-            # Merge YTD rates into direct (suffix _ytd_rate to avoid collision with monthly)
-            ytd_for_merge = ytd_rates_df.copy()
-            ytd_for_merge.columns = [f"{c}_ytd_rate" for c in ytd_for_merge.columns]
-            direct = direct.merge(
-                ytd_for_merge.reset_index().rename(columns={"index": "Period"}),
-                on="Period", how="left",
-            )
-
-            # Apply cascading with YTD rates
-            ytd_cols_by_tier: dict[int, list[str]] = {}
-            for rate_name, rate_def in sorted_rates:
-                base_col = _base_column_map.get(rate_def.base, rate_def.base)
-                ytd_dollar_col = f"{rate_name}$_ytd"
-                ytd_rate_col = f"{rate_name}_ytd_rate"
-
-                if ytd_rate_col not in direct.columns:
-                    direct[ytd_dollar_col] = 0.0
-                else:
-                    if rate_def.cascade_order == 0:
-                        apply_to = direct[base_col]
-                    else:
-                        prior_cols = []
-                        for tier, tier_cols in ytd_cols_by_tier.items():
-                            if tier < rate_def.cascade_order:
-                                prior_cols.extend(tier_cols)
-                        if prior_cols:
-                            prior_indirect = direct[prior_cols].sum(axis=1)
-                            apply_to = direct[base_col] + prior_indirect
-                        else:
-                            apply_to = direct[base_col]
-
-                    direct[ytd_dollar_col] = apply_to * direct[ytd_rate_col].fillna(0.0)
-
-                ytd_indirect_dollar_cols.append(ytd_dollar_col)
-                ytd_cols_by_tier.setdefault(rate_def.cascade_order, []).append(ytd_dollar_col)
-
-            direct["LoadedCost$_ytd"] = direct["TCI"] + direct[ytd_indirect_dollar_cols].sum(axis=1)
+            ytd_rates = ytd_rates_df.reindex(index=period_index, columns=rate_names).fillna(0.0).to_numpy(dtype=float)
+            ytd_dollars = _cascade_allocation(base_matrix, ytd_rates, cascade_orders)
+            value_blocks += [ytd_dollars, np.nansum(ytd_dollars, axis=1, keepdims=True) + tci[:, None]]
+            value_cols += [f"{rate_name}$_ytd" for rate_name in rate_names] + ["LoadedCost$_ytd"]
 
     base_direct_cols = ["DirectLabor$", "Subk", "ODC", "Travel"]
-    impact_cols = base_direct_cols + indirect_dollar_cols + ["LoadedCost$"]
-    if ytd_indirect_dollar_cols:
-        impact_cols = impact_cols + ytd_indirect_dollar_cols + ["LoadedCost$_ytd"]
+    impact_rows = pd.concat(
+        [
+            direct[["Period", "Project"] + base_direct_cols],
+            pd.DataFrame(np.hstack(value_blocks), columns=value_cols, index=direct.index),
+        ],
+        axis=1,
+    )
     impacts = (
-        direct.groupby(["Period", "Project"], as_index=False)[impact_cols]
+        impact_rows.groupby(["Period", "Project"], as_index=False)[base_direct_cols + value_cols]
         .sum()
         .sort_values(["Period", "Project"])
     )
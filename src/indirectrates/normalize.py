@@ -11,18 +11,10 @@ def normalize_inputs(
     direct_costs: pd.DataFrame,
     scenario_events: pd.DataFrame,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str]]:
-    warnings: list[str] = []
-
     gl_actuals = normalize_period_column(gl_actuals, "Period")
     direct_costs = normalize_period_column(direct_costs, "Period")
 
-    scenario_events = scenario_events.copy()
-    if "EffectivePeriod" in scenario_events.columns:
-        scenario_events["EffectivePeriod"] = pd.PeriodIndex(
-            pd.to_datetime(scenario_events["EffectivePeriod"]).dt.to_period("M"), freq="M"
-        )
-    else:
-        warnings.append("Scenario_Events.csv missing EffectivePeriod; no events will apply.")
+    scenario_events, warnings = normalize_scenario_events(scenario_events)
 
     account_map = account_map.copy()
     if "IsUnallowable" not in account_map.columns:
@@ -36,3 +28,15 @@ def normalize_inputs(
             raise ValueError(f"GL_Actuals.csv missing required column: {required}")
 
     return gl_actuals, account_map, direct_costs, scenario_events, warnings
+
+
+def normalize_scenario_events(scenario_events: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    warnings: list[str] = []
+    scenario_events = scenario_events.copy()
+    if "EffectivePeriod" in scenario_events.columns:
+        scenario_events["EffectivePeriod"] = pd.PeriodIndex(
+            pd.to_datetime(scenario_events["EffectivePeriod"]).dt.to_period("M"), freq="M"
+        )
+    else:
+        warnings.append("Scenario_Events.csv missing EffectivePeriod; no events will apply.")
+    return scenario_events, warnings
@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.ticker as mtick
+import numpy as np
 import pandas as pd
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 
 from .types import ForecastResult
 
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SUBPLOTPARS = {
+    key: rcParams[f"figure.subplot.{key}"] for key in ("left", "bottom", "right", "top", "wspace", "hspace")
+}
+
 
 def write_assumptions(path: str | Path, assumptions: dict[str, Any]) -> None:
     path = Path(path)
@@ -56,50 +75,288 @@ def write_narrative(path: str | Path, result: ForecastResult) -> None:
     path.write_text("\n".join(lines), encoding="utf-8")
 
 
-def save_rate_charts(out_dir: str | Path, results: list[ForecastResult]) -> list[Path]:
-    out_dir = Path(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    paths: list[Path] = []
+@dataclass(frozen=True)
+class _ChartLine:
+    label: str
+    x: np.ndarray  # datetime64
+    y: np.ndarray
+    ytd: bool  # dashed, in the colour of the MTD line before it
 
-    if not results:
-        return paths
 
+@dataclass(frozen=True)
+class _ChartSpec:
+    """Everything one rate chart plots; picklable, so it can be rendered in a worker."""
+
+    rate_name: str
+    lines: tuple[_ChartLine, ...]
+    cutoff: pd.Timestamp | None  # actuals | forecast marker
+
+
+def _chart_specs(results: list[ForecastResult]) -> list[_ChartSpec]:
     # Determine actuals cutoff for vertical marker
     last_actual_str = results[0].assumptions.get("last_actual_period")
     last_actual_ts = pd.Period(last_actual_str, freq="M").to_timestamp() if last_actual_str else None
 
-    rate_names = list(results[0].rates.columns)
-    for rate_name in rate_names:
-        plt.figure(figsize=(10, 4))
+    specs = []
+    for rate_name in results[0].rates.columns:
+        lines = []
         for res in results:
-            series = res.rates[rate_name].copy()
-            x = series.index.to_timestamp()
-            color = plt.plot(x, series.values, label=f"{res.scenario} (MTD)")[0].get_color()
+            series = res.rates[rate_name]
+            x = series.index.to_timestamp().values
+            lines.append(_ChartLine(f"{res.scenario} (MTD)", x, series.to_numpy(), ytd=False))
             # Overlay YTD as dashed line in same color
             if res.ytd_rates is not None and rate_name in res.ytd_rates.columns:
-                ytd_series = res.ytd_rates[rate_name].copy()
-                ytd_x = ytd_series.index.to_timestamp()
-                plt.plot(ytd_x, ytd_series.values, color=color, linestyle="--", alpha=0.7, label=f"{res.scenario} (YTD)")
-        # Actuals vs Forecast cutoff line
-        if last_actual_ts is not None:
-            plt.axvline(x=last_actual_ts, color="gray", linestyle=":", linewidth=1, alpha=0.6)
-            ymin, ymax = plt.ylim()
-            plt.text(
-                last_actual_ts, ymax, "  Actuals | Forecast  ",
-                fontsize=7, color="gray", alpha=0.8, ha="center", va="top",
-                bbox=dict(boxstyle="round,pad=0.2", facecolor="white", alpha=0.7, edgecolor="gray"),
-            )
-        plt.title(f"{rate_name} Rate Forecast")
-        plt.ylabel("Rate")
-        plt.gca().yaxis.set_major_formatter(mtick.PercentFormatter(xmax=1.0, decimals=1))
-        plt.grid(True, alpha=0.25)
-        plt.legend()
-        p = out_dir / f"rate_{_safe_filename(rate_name)}.png"
-        plt.tight_layout()
-        plt.savefig(p, dpi=160)
-        plt.close()
-        paths.append(p)
-    return paths
+                ytd_series = res.ytd_rates[rate_name]
+                ytd_x = ytd_series.index.to_timestamp().values
+                lines.append(_ChartLine(f"{res.scenario} (YTD)", ytd_x, ytd_series.to_numpy(), ytd=True))
+        specs.append(_ChartSpec(rate_name, tuple(lines), last_actual_ts))
+    return specs
+
+
+# One figure per worker thread/process, cleared and redrawn for every chart
+# (Agg canvas, no pyplot global state).
+_template = threading.local()
+
+
+def _render_chart(spec: _ChartSpec, path: Path) -> Path:
+    fig = getattr(_template, "figure", None)
+    if fig is None:
+        fig = _template.figure = Figure(figsize=(10, 4))
+        FigureCanvasAgg(fig)
+    fig.clear()
+    fig.subplotpars.update(**_DEFAULT_SUBPLOTPARS)
+    ax = fig.add_subplot()
+
+    color = None
+    for line in spec.lines:
+        if line.ytd:
+            ax.plot(line.x, line.y, color=color, linestyle="--", alpha=0.7, label=line.label)
+        else:
+            color = ax.plot(line.x, line.y, label=line.label)[0].get_color()
+    # Actuals vs Forecast cutoff line
+    if spec.cutoff is not None:
+        ax.axvline(x=spec.cutoff, color="gray", linestyle=":", linewidth=1, alpha=0.6)
+        ymin, ymax = ax.get_ylim()
+        ax.text(
+            spec.cutoff, ymax, "  Actuals | Forecast  ",
+            fontsize=7, color="gray", alpha=0.8, ha="center", va="top",
+            bbox=dict(boxstyle="round,pad=0.2", facecolor="white", alpha=0.7, edgecolor="gray"),
+        )
+    ax.set_title(f"{spec.rate_name} Rate Forecast")
+    ax.set_ylabel("Rate")
+    ax.yaxis.set_major_formatter(mtick.PercentFormatter(xmax=1.0, decimals=1))
+    ax.grid(True, alpha=0.25)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path, dpi=160)
+    return path
+
+
+def _render_chart_args(args: tuple[_ChartSpec, Path]) -> Path:
+    return _render_chart(*args)
+
+
+# Bump when _render_chart's styling changes, so older cached PNGs are never reused.
+_CHART_STYLE_VERSION = "1"
+
+
+def chart_key(spec: _ChartSpec) -> str:
+    """SHA-256 of exactly what a chart plots: title, series, scenario labels and cutoff marker."""
+    digest = hashlib.sha256(f"{_CHART_STYLE_VERSION}|{matplotlib.__version__}|{spec.rate_name}".encode())
+    for line in spec.lines:
+        digest.update(f"|{line.label}|{line.ytd}|{len(line.x)}|".encode())
+        digest.update(np.ascontiguousarray(line.x, dtype="datetime64[ns]").tobytes())
+        digest.update(np.ascontiguousarray(line.y, dtype=np.float64).tobytes())
+    digest.update(f"|{spec.cutoff.isoformat() if spec.cutoff is not None else ''}".encode())
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """Content-addressed on-disk cache of rendered chart PNGs, pruned least-recently-used first.
+
+    PNGs are stored as ``<root>/<key[:2]>/<key>.png``; a hit refreshes the
+    file's mtime, which is what pruning orders by.  Safe to share between
+    processes: entries are written atomically and pruning tolerates files
+    that disappear underneath it.  Filesystem errors never fail a render: a
+    cache that cannot be read misses, one that cannot be written is skipped.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.png"
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """Copy the cached PNG for ``key`` to ``dest``; ``False`` on a miss or an unreadable cache."""
+        src = self._path(key)
+        try:
+            shutil.copyfile(src, dest)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return False
+        try:
+            os.utime(src)
+        except OSError:
+            pass  # still a hit; the entry just ages as if unused
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key: str, src: Path) -> None:
+        """Add ``src`` as the PNG for ``key``; an unwritable cache is logged and skipped."""
+        dest = self._path(key)
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dest)
+        except OSError as exc:
+            logger.warning("could not store chart in cache at %s: %s", self.root, exc)
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        try:
+            paths = list(self.root.glob("*/*.png"))
+        except OSError:
+            return entries
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def prune(self) -> None:
+        """Delete least-recently-used PNGs until the cache fits in ``max_bytes``; undeletable files are skipped."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            total -= size
+
+    def stats(self) -> dict[str, Any]:
+        """Disk usage, plus hit/miss counts for charts rendered in this process."""
+        entries = self._entries()
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "max_bytes": self.max_bytes,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _default_chart_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "indirectrates" / "charts"
+
+
+chart_cache = ChartCache(
+    os.environ.get("CHART_CACHE_DIR") or _default_chart_cache_dir(),
+    max_bytes=int(os.environ.get("CHART_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+)
+
+
+def _chart_workers() -> int:
+    try:
+        return int(os.environ.get("CHART_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+    except ValueError:
+        return 1
+
+
+_chart_pool: ProcessPoolExecutor | None = None
+_chart_pool_workers = 0
+_chart_pool_lock = threading.Lock()
+
+
+def _get_chart_pool(workers: int) -> ProcessPoolExecutor:
+    """Long-lived chart pool, so worker start-up and matplotlib import are paid once per process."""
+    global _chart_pool, _chart_pool_workers
+    with _chart_pool_lock:
+        if _chart_pool is None or _chart_pool_workers != workers:
+            if _chart_pool is not None:
+                _chart_pool.shutdown(wait=False)
+            _chart_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _chart_pool_workers = workers
+        return _chart_pool
+
+
+def _discard_chart_pool() -> None:
+    global _chart_pool
+    with _chart_pool_lock:
+        if _chart_pool is not None:
+            _chart_pool.shutdown(wait=False)
+        _chart_pool = None
+
+
+def save_rate_charts(out_dir: str | Path, results: list[ForecastResult], workers: int | None = None) -> list[Path]:
+    """Write one PNG per rate, comparing every scenario (MTD solid, YTD dashed).
+
+    Charts whose plotted content is unchanged are copied from ``chart_cache``
+    without touching matplotlib.  The rest are rendered, in parallel worker
+    processes when ``workers > 1`` (default ``CHART_WORKERS``, else up to 4
+    CPUs), and added to the cache.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if not results:
+        return []
+
+    jobs = [(spec, out_dir / f"rate_{_safe_filename(spec.rate_name)}.png") for spec in _chart_specs(results)]
+    cache = chart_cache if chart_cache.enabled else None
+    keys = [chart_key(spec) for spec, _ in jobs] if cache else []
+    missing = [i for i, (_, path) in enumerate(jobs) if cache is None or not cache.fetch(keys[i], path)]
+    _render_charts([jobs[i] for i in missing], workers)
+
+    if cache and missing:
+        for i in missing:
+            cache.store(keys[i], jobs[i][1])
+        cache.prune()
+    return [path for _, path in jobs]
+
+
+def _render_charts(jobs: list[tuple[_ChartSpec, Path]], workers: int | None) -> None:
+    workers = min(_chart_workers() if workers is None else workers, len(jobs))
+    if multiprocessing.current_process().daemon:
+        # Daemonic processes (e.g. forecast job workers) are not allowed to have children.
+        workers = 1
+    if workers > 1:
+        try:
+            # map submits every job up front, which is when the pool starts its workers.
+            rendered = _get_chart_pool(workers).map(_render_chart_args, jobs)
+        except Exception:
+            logger.warning("could not start chart workers; rendering in-process", exc_info=True)
+            _discard_chart_pool()
+        else:
+            try:
+                list(rendered)
+                return
+            except BrokenProcessPool:
+                # A chart worker died; drop the pool and render in-process this time.
+                _discard_chart_pool()
+    for spec, path in jobs:
+        _render_chart(spec, path)
 
 
 def write_excel_pack(path: str | Path, results: list[ForecastResult]) -> None:
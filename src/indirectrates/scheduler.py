@@ -0,0 +1,202 @@
+"""Debounced scheduler for automatic DB-mode forecasts.
+
+Scenario edits, uploads and GL imports each call ``trigger(user_id, fy_id)``.
+Triggers for the same fiscal year are coalesced into one pending job whose
+start is pushed back by the debounce window on every new trigger, so a burst
+of edits produces a single forecast once the user pauses.  A trigger that
+arrives while that FY's forecast is already running queues exactly one
+follow-up job, which starts after the running one finishes.  Jobs are
+dispatched from a bounded thread pool, never from request threads; each
+thread hands its forecast to a ``forecast_pool`` worker process and only
+waits for it, so a running forecast never holds the API process's GIL.
+
+Configuration (environment):
+  AUTO_FORECAST_DEBOUNCE_SECONDS  quiet period before a pending job starts (default 5)
+  AUTO_FORECAST_WORKERS           concurrent forecasts per process (default 2)
+  AUTO_FORECAST_IN_PROCESS        1 runs forecasts on the dispatch threads themselves
+                                  (single-process deployments and debugging; default 0)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+RunForecast = Callable[[str, int], "int | None"]
+
+MAX_FINISHED_JOBS = 500
+
+
+@dataclass
+class AutoForecastJob:
+    id: str
+    user_id: str
+    fiscal_year_id: int
+    status: str = "pending"  # pending | running | succeeded | failed
+    triggers: int = 1
+    created_at: float = 0.0
+    due_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+    run_id: int | None = None
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ForecastScheduler:
+    """Coalesces auto-forecast triggers per fiscal year and runs them on a bounded pool."""
+
+    def __init__(self, run: RunForecast, debounce_seconds: float = 5.0, max_workers: int = 2) -> None:
+        self._run = run
+        self.debounce_seconds = debounce_seconds
+        self.max_workers = max(1, max_workers)
+        self._cond = threading.Condition()
+        self._pending: dict[int, AutoForecastJob] = {}
+        self._running: dict[int, AutoForecastJob] = {}
+        self._finished: OrderedDict[str, AutoForecastJob] = OrderedDict()
+        self._durations: deque[float] = deque(maxlen=100)
+        self._coalesced = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._dispatcher: threading.Thread | None = None
+        self._stopped = False
+
+    # -- public API ---------------------------------------------------------
+
+    def trigger(self, user_id: str, fy_id: int) -> str:
+        """Schedule (or push back) the FY's pending forecast and return its job id."""
+        now = time.time()
+        with self._cond:
+            self._ensure_started()
+            job = self._pending.get(fy_id)
+            if job is None:
+                job = AutoForecastJob(id=uuid.uuid4().hex, user_id=user_id, fiscal_year_id=fy_id, created_at=now)
+                self._pending[fy_id] = job
+            else:
+                job.triggers += 1
+                job.user_id = user_id
+                self._coalesced += 1
+            job.due_at = now + self.debounce_seconds
+            self._cond.notify_all()
+            return job.id
+
+    def get(self, job_id: str) -> AutoForecastJob | None:
+        with self._cond:
+            for job in (*self._pending.values(), *self._running.values()):
+                if job.id == job_id:
+                    return job
+            return self._finished.get(job_id)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            durations = list(self._durations)
+            return {
+                "queue_depth": len(self._pending),
+                "running": len(self._running),
+                "workers": self.max_workers,
+                "debounce_seconds": self.debounce_seconds,
+                "coalesced_triggers": self._coalesced,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+                "avg_run_seconds": round(sum(durations) / len(durations), 3) if durations else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # -- internals ----------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._dispatcher is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="auto-forecast")
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="auto-forecast-dispatch", daemon=True)
+            self._dispatcher.start()
+
+    def _next_ready(self, now: float) -> tuple[AutoForecastJob | None, float | None]:
+        """The earliest due job that may start now, else how long to sleep."""
+        wait: float | None = None
+        if len(self._running) >= self.max_workers:
+            return None, None
+        for fy_id, job in sorted(self._pending.items(), key=lambda kv: kv[1].due_at):
+            if fy_id in self._running:
+                continue  # follow-up waits for the FY's current run
+            if job.due_at <= now:
+                return job, None
+            wait = job.due_at - now if wait is None else min(wait, job.due_at - now)
+        return None, wait
+
+    def _dispatch_loop(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                job, wait = self._next_ready(time.time())
+                if job is None:
+                    self._cond.wait(wait)
+                    continue
+                del self._pending[job.fiscal_year_id]
+                self._running[job.fiscal_year_id] = job
+                job.status = "running"
+                job.started_at = time.time()
+                self._executor.submit(self._execute, job)
+
+    def _execute(self, job: AutoForecastJob) -> None:
+        try:
+            run_id = self._run(job.user_id, job.fiscal_year_id)
+            error = None if run_id is not None else "forecast did not produce a run"
+        except Exception as exc:  # _run_db_forecast already logs; keep the worker alive
+            logger.exception("auto-forecast job %s failed", job.id)
+            run_id, error = None, f"{exc.__class__.__name__}: {exc}"
+        with self._cond:
+            job.finished_at = time.time()
+            job.run_id = run_id
+            job.error = error
+            job.status = "failed" if error else "succeeded"
+            if error:
+                self._failed += 1
+            else:
+                self._succeeded += 1
+            self._durations.append(job.finished_at - (job.started_at or job.finished_at))
+            del self._running[job.fiscal_year_id]
+            self._finished[job.id] = job
+            while len(self._finished) > MAX_FINISHED_JOBS:
+                self._finished.popitem(last=False)
+            self._cond.notify_all()
+
+
+def _run_db_forecast(user_id: str, fy_id: int) -> int | None:
+    from .forecast_pool import forecast_pool
+    from .server import _run_db_forecast as run
+
+    if os.environ.get("AUTO_FORECAST_IN_PROCESS", "0") == "1":
+        return run(user_id, fy_id)
+    return forecast_pool.call(run, user_id, fy_id)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, str(default)))
+    except ValueError:
+        return default
+
+
+auto_forecasts = ForecastScheduler(
+    _run_db_forecast,
+    debounce_seconds=_env_float("AUTO_FORECAST_DEBOUNCE_SECONDS", 5.0),
+    max_workers=int(_env_float("AUTO_FORECAST_WORKERS", 2)),
+)
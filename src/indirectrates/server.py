@@ -1,38 +1,48 @@
 from __future__ import annotations
 
-import io
 import logging
 import os
+import shutil
 import tempfile
 import time
 import uuid
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, BinaryIO, Iterator, Optional
 
+import pandas as pd
 import yaml
 from fastapi import FastAPI, File, Form, Request, UploadFile
 from fastapi import HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
-from .agents import AnalystAgent, PlannerAgent, ReporterAgent
+from .agents import AnalystAgent, PlannerAgent, ReporterAgent, ScenarioPlan
 from .api_crud import router as crud_router, get_current_user
 from .config import RateConfig, default_rate_config
+from .aggregate_store import aggregate_store
+from .config_cache import fy_config_cache
+from .forecast_pool import ForecastPoolBusy, ForecastTimeout, forecast_pool
+from .io import INPUT_FILES, inputs_from_frames, read_input_csv, read_zip_frames
+from .sql_aggregates import compute_actual_aggregates_sql
+from .types import ActualAggregates, Inputs
+from .zipstream import CHUNK_SIZE, iter_zip_dir
 from .db import (
-    build_account_map_df_from_db,
-    build_rate_config_from_db,
     build_scenario_events_df_from_db,
     get_connection,
     get_fiscal_year,
     get_latest_uploaded_file,
     init_db,
     list_reference_rates,
-    save_forecast_run,
+    read_direct_cost_entries_df,
+    read_gl_entries_df,
+    reserve_forecast_run_id,
+    save_forecast_run_chunks,
     get_user_storage_bytes,
     MAX_STORAGE_BYTES,
 )
@@ -191,12 +201,27 @@ def startup():
     """Initialize database tables on startup."""
     try:
         init_db()
+        _warm_db_pool()
     except Exception:
         logger.exception(
             "DB init failed during startup; DB-backed endpoints may fail until database is reachable"
         )
 
 
+@app.on_event("shutdown")
+def shutdown():
+    """Stop the auto-forecast scheduler and forecast pool, and close idle pooled database connections."""
+    from .db import _connect
+    from .db_pool import get_pool
+    from .scheduler import auto_forecasts
+
+    auto_forecasts.shutdown()
+    forecast_pool.shutdown()
+    pool = get_pool(_connect)
+    if pool is not None:
+        pool.close_all()
+
+
 # ALLOWED_ORIGINS: comma-separated list of allowed origins.
 # Add your Vercel deployment URL here, e.g.:
 #   ALLOWED_ORIGINS=https://your-app.vercel.app,http://localhost:3000
@@ -270,9 +295,14 @@ async def forecast(
     scenario_events: Optional[UploadFile] = File(default=None),
     config_yaml: Optional[UploadFile] = File(default=None),
     entity: Optional[str] = Form(default=None),
+    workers: int = Form(default=1),
+    async_job: bool = Form(default=False),
 ):
     scenario = (scenario or "").strip() or None
     entity = (entity or "").strip() or None
+    if workers < 1:
+        raise HTTPException(status_code=400, detail="workers must be >= 1")
+    workers = min(workers, os.cpu_count() or 1)
     user_id = get_current_user(request)
 
     # When fiscal_year_id is provided, load config from DB instead of uploads
@@ -285,9 +315,9 @@ async def forecast(
             fy = get_fiscal_year(conn, fiscal_year_id, user_id=user_id)
             if not fy:
                 raise HTTPException(status_code=404, detail=f"Fiscal year {fiscal_year_id} not found")
-            raw_cfg = build_rate_config_from_db(conn, fiscal_year_id)
-            cfg = RateConfig.from_mapping(raw_cfg)
-            account_map_df = build_account_map_df_from_db(conn, fiscal_year_id)
+            fy_config = fy_config_cache.get(conn, fy)
+            cfg = fy_config.rate_config
+            account_map_df = fy_config.account_map
         finally:
             conn.close()
         if account_map_df.empty:
@@ -297,182 +327,365 @@ async def forecast(
         cfg = await _load_config(config_yaml)
         account_map_df = None
 
+    # DB mode with no GL/direct-cost uploads: map, filter and sum the actuals
+    # in Postgres instead of pulling every entry row into pandas.
+    actuals = None
+    uploaded_actuals = inputs_zip is not None or gl_actuals is not None or direct_costs is not None
+    if fy and account_map_df is not None and not async_job and not uploaded_actuals:
+        conn = get_connection()
+        try:
+            actuals = compute_actual_aggregates_sql(conn, user_id or "", fiscal_year_id, cfg, entity=entity)
+        finally:
+            conn.close()
+
     disk_dir = Path(input_dir_path) if input_dir_path else None
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        input_dir = tmp_path / "inputs"
-        out_dir = tmp_path / "out"
-        input_dir.mkdir(parents=True, exist_ok=True)
+    # Inputs are assembled as DataFrames keyed by input file name; nothing is
+    # staged on disk except the output pack.
+    frames: dict = {}
 
-        if inputs_zip is not None:
-            data = await inputs_zip.read()
-            try:
-                with zipfile.ZipFile(io.BytesIO(data), "r") as zf:
-                    zf.extractall(input_dir)
-            except zipfile.BadZipFile as exc:
-                raise HTTPException(status_code=400, detail="inputs_zip is not a valid ZIP archive") from exc
+    def _from_disk(name: str) -> None:
+        if disk_dir and (disk_dir / name).exists():
+            frames[name] = read_input_csv(disk_dir / name)
+
+    if inputs_zip is not None:
+        # Parse members straight from the spooled upload (a temp file once it is
+        # large) instead of reading the whole archive into memory.
+        try:
+            frames.update(await run_in_threadpool(read_zip_frames, inputs_zip.file))
+        except zipfile.BadZipFile as exc:
+            raise HTTPException(status_code=400, detail="inputs_zip is not a valid ZIP archive") from exc
+    elif actuals is not None:
+        # Actuals are already aggregated; only scenario events are still needed.
+        if scenario_events is not None:
+            frames["Scenario_Events.csv"] = read_input_csv(await scenario_events.read())
         else:
-            # GL_Actuals: fresh upload > gl_entries > uploaded_files > disk
-            if gl_actuals is not None:
-                await _write_upload(gl_actuals, input_dir / "GL_Actuals.csv")
-            elif fiscal_year_id is not None:
-                from . import db as _db
-                conn = get_connection()
-                try:
-                    csv_str = _db.get_gl_entries_as_csv(conn, user_id or "", fiscal_year_id)
-                finally:
-                    conn.close()
-                if csv_str.strip():
-                    (input_dir / "GL_Actuals.csv").write_text(csv_str, encoding="utf-8")
-                else:
-                    conn = get_connection()
-                    try:
-                        uf = get_latest_uploaded_file(conn, fiscal_year_id, "gl_actuals")
-                    finally:
-                        conn.close()
-                    if uf:
-                        (input_dir / "GL_Actuals.csv").write_bytes(uf["content"])
-                    elif disk_dir and (disk_dir / "GL_Actuals.csv").exists():
-                        import shutil
-                        shutil.copy2(disk_dir / "GL_Actuals.csv", input_dir / "GL_Actuals.csv")
-            elif disk_dir and (disk_dir / "GL_Actuals.csv").exists():
-                import shutil
-                shutil.copy2(disk_dir / "GL_Actuals.csv", input_dir / "GL_Actuals.csv")
-
-            # Account_Map: DB-generated > fresh upload > uploaded blob > disk
-            if account_map_df is not None:
-                account_map_df.to_csv(input_dir / "Account_Map.csv", index=False)
-            elif account_map is not None:
-                await _write_upload(account_map, input_dir / "Account_Map.csv")
-            elif fiscal_year_id is not None:
-                conn = get_connection()
-                try:
-                    uf = get_latest_uploaded_file(conn, fiscal_year_id, "account_map")
-                finally:
-                    conn.close()
-                if uf:
-                    (input_dir / "Account_Map.csv").write_bytes(uf["content"])
-                elif disk_dir and (disk_dir / "Account_Map.csv").exists():
-                    import shutil
-                    shutil.copy2(disk_dir / "Account_Map.csv", input_dir / "Account_Map.csv")
-            elif disk_dir and (disk_dir / "Account_Map.csv").exists():
-                import shutil
-                shutil.copy2(disk_dir / "Account_Map.csv", input_dir / "Account_Map.csv")
-
-            # Direct_Costs: fresh upload > direct_cost_entries > uploaded_files > disk
-            if direct_costs is not None:
-                await _write_upload(direct_costs, input_dir / "Direct_Costs_By_Project.csv")
-            elif fiscal_year_id is not None:
-                conn = get_connection()
-                try:
-                    dc_csv = _db.get_direct_cost_entries_as_csv(conn, user_id or "", fiscal_year_id)
-                finally:
-                    conn.close()
-                if dc_csv.strip():
-                    (input_dir / "Direct_Costs_By_Project.csv").write_text(dc_csv, encoding="utf-8")
-                else:
-                    conn = get_connection()
-                    try:
-                        uf = get_latest_uploaded_file(conn, fiscal_year_id, "direct_costs")
-                    finally:
-                        conn.close()
-                    if uf:
-                        (input_dir / "Direct_Costs_By_Project.csv").write_bytes(uf["content"])
-                    elif disk_dir and (disk_dir / "Direct_Costs_By_Project.csv").exists():
-                        import shutil
-                        shutil.copy2(disk_dir / "Direct_Costs_By_Project.csv", input_dir / "Direct_Costs_By_Project.csv")
-            elif disk_dir and (disk_dir / "Direct_Costs_By_Project.csv").exists():
-                import shutil
-                shutil.copy2(disk_dir / "Direct_Costs_By_Project.csv", input_dir / "Direct_Costs_By_Project.csv")
-
-            # Scenario_Events: fresh upload > disk
-            if scenario_events is not None:
-                await _write_upload(scenario_events, input_dir / "Scenario_Events.csv")
-            elif disk_dir and (disk_dir / "Scenario_Events.csv").exists():
-                import shutil
-                shutil.copy2(disk_dir / "Scenario_Events.csv", input_dir / "Scenario_Events.csv")
-
-        # Try loading Scenario_Events from DB scenarios
-        if not (input_dir / "Scenario_Events.csv").exists() and fiscal_year_id is not None:
-            conn = get_connection()
-            try:
-                scenario_df = build_scenario_events_df_from_db(conn, fiscal_year_id)
-                if not scenario_df.empty:
-                    scenario_df.to_csv(input_dir / "Scenario_Events.csv", index=False)
-            finally:
-                conn.close()
+            _from_disk("Scenario_Events.csv")
+    else:
+        # GL_Actuals: fresh upload > gl_entries > uploaded_files > disk
+        if gl_actuals is not None:
+            frames["GL_Actuals.csv"] = read_input_csv(await gl_actuals.read())
+        elif fiscal_year_id is not None:
+            gl_df = _db_entries_frame(read_gl_entries_df, user_id or "", fiscal_year_id, "gl_actuals")
+            if gl_df is not None:
+                frames["GL_Actuals.csv"] = gl_df
+            else:
+                _from_disk("GL_Actuals.csv")
+        else:
+            _from_disk("GL_Actuals.csv")
+
+        # Account_Map: DB-generated > fresh upload > uploaded blob > disk
+        if account_map_df is not None:
+            frames["Account_Map.csv"] = account_map_df
+        elif account_map is not None:
+            frames["Account_Map.csv"] = read_input_csv(await account_map.read())
+        elif fiscal_year_id is not None:
+            map_df = _uploaded_file_frame(fiscal_year_id, "account_map")
+            if map_df is not None:
+                frames["Account_Map.csv"] = map_df
+            else:
+                _from_disk("Account_Map.csv")
+        else:
+            _from_disk("Account_Map.csv")
+
+        # Direct_Costs: fresh upload > direct_cost_entries > uploaded_files > disk
+        if direct_costs is not None:
+            frames["Direct_Costs_By_Project.csv"] = read_input_csv(await direct_costs.read())
+        elif fiscal_year_id is not None:
+            dc_df = _db_entries_frame(read_direct_cost_entries_df, user_id or "", fiscal_year_id, "direct_costs")
+            if dc_df is not None:
+                frames["Direct_Costs_By_Project.csv"] = dc_df
+            else:
+                _from_disk("Direct_Costs_By_Project.csv")
+        else:
+            _from_disk("Direct_Costs_By_Project.csv")
 
-        if not (input_dir / "Scenario_Events.csv").exists():
-            (input_dir / "Scenario_Events.csv").write_text(
-                "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
-                "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
-                "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
-            )
+        # Scenario_Events: fresh upload > disk
+        if scenario_events is not None:
+            frames["Scenario_Events.csv"] = read_input_csv(await scenario_events.read())
+        else:
+            _from_disk("Scenario_Events.csv")
 
-        _require_inputs(input_dir)
+    # Try loading Scenario_Events from DB scenarios
+    if "Scenario_Events.csv" not in frames and fiscal_year_id is not None:
+        conn = get_connection()
+        try:
+            scenario_df = build_scenario_events_df_from_db(conn, fiscal_year_id)
+        finally:
+            conn.close()
+        if not scenario_df.empty:
+            frames["Scenario_Events.csv"] = scenario_df
 
-        plan = PlannerAgent().plan(
+    if "Scenario_Events.csv" not in frames:
+        frames["Scenario_Events.csv"] = read_input_csv(_DEFAULT_SCENARIO_EVENTS)
+
+    if actuals is None:
+        try:
+            inputs = inputs_from_frames(frames)
+        except FileNotFoundError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    plan = PlannerAgent().plan(
+        scenario=scenario,
+        forecast_months=int(forecast_months),
+        run_rate_months=int(run_rate_months),
+        events=frames["Scenario_Events.csv"],
+    )
+
+    if fiscal_year_id is not None and fy:
+        import pandas as pd
+        from dataclasses import replace
+        plan = replace(plan, fy_start=pd.Period(fy["start_month"], freq="M"))
+
+    if async_job:
+        from .jobs import submit_forecast_job
+
+        job_id = submit_forecast_job(
+            user_id=user_id or "",
+            fiscal_year_id=fiscal_year_id,
+            inputs=inputs,
+            config=cfg,
             scenario=scenario,
             forecast_months=int(forecast_months),
             run_rate_months=int(run_rate_months),
-            events_path=input_dir / "Scenario_Events.csv",
+            fy_start=str(plan.fy_start) if plan.fy_start is not None else None,
+            entity=entity,
+        )
+        return JSONResponse(
+            status_code=202,
+            content={"job_id": job_id, "status": "queued", "status_url": f"/jobs/{job_id}"},
         )
 
-        if fiscal_year_id is not None and fy:
-            import pandas as pd
-            from dataclasses import replace
-            plan = replace(plan, fy_start=pd.Period(fy["start_month"], freq="M"))
+    # Projection, charts and workbook are CPU-bound: keep them off the event loop.
+    # The worker writes the pack files; they are zipped (and saved) before responding.
+    out_root = Path(tempfile.mkdtemp(prefix="rate-pack-"))
+    try:
+        run = await forecast_pool.run(
+            _forecast_pack,
+            inputs if actuals is None else actuals,
+            frames["Scenario_Events.csv"],
+            cfg,
+            plan,
+            entity,
+            workers,
+            fiscal_year_id,
+            scenario,
+            int(forecast_months),
+            int(run_rate_months),
+            str(out_root / "out"),
+        )
+    except BaseException as exc:
+        shutil.rmtree(out_root, ignore_errors=True)
+        if isinstance(exc, ForecastPoolBusy):
+            raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "5"}) from exc
+        if isinstance(exc, ForecastTimeout):
+            raise HTTPException(status_code=504, detail=str(exc)) from exc
+        raise
+    chunks = await run_in_threadpool(_finish_pack, out_root, run)
+    return StreamingResponse(
+        _stream_chunks(chunks),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="rate_pack_output.zip"'},
+    )
 
-        results = AnalystAgent().run(input_dir=input_dir, config=cfg, plan=plan, entity=entity)
 
-        if fiscal_year_id is not None:
-            conn = get_connection()
-            try:
-                ref_rates = list_reference_rates(conn, fiscal_year_id, rate_type="budget")
-                ref_thresholds = list_reference_rates(conn, fiscal_year_id, rate_type="threshold")
-            finally:
-                conn.close()
-            if ref_rates:
-                budget_map: dict = {}
-                for rr in ref_rates:
-                    budget_map.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
-                for res in results:
-                    res.assumptions["budget_rates"] = budget_map
-            if ref_thresholds:
-                threshold_map: dict = {}
-                for rr in ref_thresholds:
-                    threshold_map.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
-                for res in results:
-                    res.assumptions["rate_thresholds"] = threshold_map
-
-        ReporterAgent().package(out_dir=out_dir, results=results)
-
-        payload = _zip_dir_bytes(out_dir)
-
-        # Persist forecast run only for DB mode
-        if fiscal_year_id is not None:
-            import json as _json
-            assumptions_str = _json.dumps(results[0].assumptions, default=str) if results else "{}"
+def _forecast_pack(
+    source: Inputs | ActualAggregates,
+    scenario_events: pd.DataFrame,
+    cfg: RateConfig,
+    plan: ScenarioPlan,
+    entity: str | None,
+    workers: int,
+    fiscal_year_id: int | None,
+    scenario: str | None,
+    forecast_months: int,
+    run_rate_months: int,
+    out_dir: str,
+) -> dict | None:
+    """Forecast ``source`` and write the pack to ``out_dir``; runs in a ``forecast_pool`` worker.
+
+    Returns ``_render_pack``'s forecast run (``None`` outside DB mode).
+    """
+    if isinstance(source, ActualAggregates):
+        results = AnalystAgent().run_from_actuals(source, scenario_events, cfg, plan, entity=entity, workers=workers)
+    else:
+        results = AnalystAgent().run(input_dir=source, config=cfg, plan=plan, entity=entity, workers=workers)
+    return _render_pack(results, Path(out_dir), fiscal_year_id, scenario, forecast_months, run_rate_months)
+
+
+def _finish_pack(out_root: Path, run: dict | None) -> Iterator[bytes]:
+    """``_pack_chunks`` for ``out_root/out``; ``out_root`` is removed whatever happens."""
+    try:
+        return _pack_chunks(out_root / "out", run)
+    finally:
+        shutil.rmtree(out_root, ignore_errors=True)
+
+
+async def _stream_chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """Read ``chunks`` on the thread pool."""
+    try:
+        while (chunk := await run_in_threadpool(next, chunks, None)) is not None:
+            yield chunk
+    finally:
+        await run_in_threadpool(chunks.close)
+
+
+def _render_pack(
+    results: list,
+    out_dir: Path,
+    fiscal_year_id: int | None,
+    scenario: str | None,
+    forecast_months: int,
+    run_rate_months: int,
+    trigger: str = "manual",
+) -> dict | None:
+    """Write the management pack for ``results`` to ``out_dir``.
+
+    In DB mode also attach budget/threshold reference rates, reserve a forecast
+    run id, write the run's Parquet artifacts and return the ``forecast_runs``
+    row for ``_pack_chunks`` to persist; otherwise return ``None``.
+    """
+    import json as _json
+
+    if fiscal_year_id is not None:
+        conn = get_connection()
+        try:
+            ref_rates = list_reference_rates(conn, fiscal_year_id, rate_type="budget")
+            ref_thresholds = list_reference_rates(conn, fiscal_year_id, rate_type="threshold")
+        finally:
+            conn.close()
+        if ref_rates:
+            budget_map: dict = {}
+            for rr in ref_rates:
+                budget_map.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
+            for res in results:
+                res.assumptions["budget_rates"] = budget_map
+        if ref_thresholds:
+            threshold_map: dict = {}
+            for rr in ref_thresholds:
+                threshold_map.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
+            for res in results:
+                res.assumptions["rate_thresholds"] = threshold_map
+
+    ReporterAgent().package(out_dir=out_dir, results=results)
+    if fiscal_year_id is None:
+        return None
+
+    conn = get_connection()
+    try:
+        run_id = reserve_forecast_run_id(conn)
+    finally:
+        conn.close()
+    _store_run_artifacts(run_id, results)
+    return {
+        "id": run_id,
+        "fiscal_year_id": fiscal_year_id,
+        "scenario": scenario or "",
+        "forecast_months": forecast_months,
+        "run_rate_months": run_rate_months,
+        "assumptions_json": _json.dumps(results[0].assumptions, default=str) if results else "{}",
+        "trigger": trigger,
+    }
+
+
+def _pack_chunks(out_dir: Path, run: dict | None) -> Iterator[bytes]:
+    """Zip ``out_dir`` into an anonymous temp file and return its chunks; with ``run``, save it as that forecast run.
+
+    Everything is written before this returns, so ``out_dir`` may be deleted
+    straight away, and a slow consumer (or one that never reads) holds no DB
+    connection and cannot leave a run without its row.  The DB copy is sent in
+    ``CHUNK_SIZE`` pieces, so the pack is never held in memory whole.  The temp
+    file has no name on disk, so nothing is left behind if the chunks are never
+    read.
+    """
+    spool = tempfile.TemporaryFile()
+    try:
+        for chunk in iter_zip_dir(out_dir):
+            spool.write(chunk)
+        if run is not None:
+            spool.seek(0)
             conn = get_connection()
             try:
-                save_forecast_run(
-                    conn,
-                    fiscal_year_id=fiscal_year_id,
-                    scenario=scenario or "",
-                    forecast_months=int(forecast_months),
-                    run_rate_months=int(run_rate_months),
-                    assumptions_json=assumptions_str,
-                    output_zip=payload,
-                )
+                save_forecast_run_chunks(conn, chunks=iter(lambda: spool.read(CHUNK_SIZE), b""), **run)
             finally:
                 conn.close()
+    except BaseException:
+        spool.close()
+        if run is not None:
+            _delete_run_artifacts(run["id"])
+        raise
+    spool.seek(0)
+    return _iter_spool(spool)
+
+
+def _iter_spool(spool: BinaryIO) -> Iterator[bytes]:
+    with spool:
+        yield from iter(lambda: spool.read(CHUNK_SIZE), b"")
+
+
+def _package_results(
+    results: list,
+    fiscal_year_id: int | None,
+    scenario: str | None,
+    forecast_months: int,
+    run_rate_months: int,
+    trigger: str = "manual",
+) -> tuple[bytes, int | None]:
+    """Zip the management pack for ``results``; in DB mode also persist it as a forecast run.
+
+    Returns ``(zip_bytes, run_id)``; ``run_id`` is ``None`` outside DB mode.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp) / "out"
+        run = _render_pack(results, out_dir, fiscal_year_id, scenario, forecast_months, run_rate_months, trigger)
+        payload = b"".join(_pack_chunks(out_dir, run))
+    return payload, run["id"] if run else None
 
-        return Response(
-            content=payload,
-            media_type="application/zip",
-            headers={"Content-Disposition": 'attachment; filename="rate_pack_output.zip"'},
-        )
+
+def _get_job_for_request(request: Request, job_id: str) -> dict:
+    from .db import get_forecast_job
+
+    conn = get_connection()
+    try:
+        job = get_forecast_job(conn, job_id)
+    finally:
+        conn.close()
+    # Jobs submitted with a user are only visible to that user.
+    if not job or (job["user_id"] and job["user_id"] != get_current_user(request)):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@app.get("/jobs/{job_id}")
+def get_job(request: Request, job_id: str):
+    job = _get_job_for_request(request, job_id)
+    out = {k: v for k, v in job.items() if k not in ("params_json", "user_id", "result_size")}
+    for key in ("created_at", "started_at", "heartbeat_at", "finished_at"):
+        if out.get(key) is not None:
+            out[key] = out[key].isoformat()
+    out["result_url"] = f"/jobs/{job_id}/result" if job["status"] == "succeeded" else None
+    return out
+
+
+@app.get("/jobs/{job_id}/result")
+def get_job_result(request: Request, job_id: str):
+    from .db import get_forecast_job_result
+
+    job = _get_job_for_request(request, job_id)
+    if job["status"] != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job['status']}")
+    conn = get_connection()
+    try:
+        payload = get_forecast_job_result(conn, job_id)
+    finally:
+        conn.close()
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} has no result")
+    return Response(
+        content=payload,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="rate_pack_{job_id}.zip"'},
+    )
 
 
 def _run_db_forecast(
@@ -484,12 +697,9 @@ def _run_db_forecast(
     trigger: str = "auto",
 ) -> int | None:
     """Run forecast from DB sources and persist to forecast_runs. Returns run_id or None on failure."""
-    import json as _json
-    import tempfile
     import pandas as pd
     from dataclasses import replace as _replace
     from . import db as _db
-    from .config import RateConfig
 
     try:
         conn = get_connection()
@@ -497,169 +707,128 @@ def _run_db_forecast(
             fy = _db.get_fiscal_year(conn, fy_id, user_id=user_id)
             if not fy:
                 return None
-            raw_cfg = _db.build_rate_config_from_db(conn, fy_id)
-            cfg = RateConfig.from_mapping(raw_cfg)
-            account_map_df = _db.build_account_map_df_from_db(conn, fy_id)
+            fy_config = fy_config_cache.get(conn, fy)
+            cfg = fy_config.rate_config
+            account_map_df = fy_config.account_map
             if account_map_df.empty:
                 account_map_df = None
+
+            # Scenario_Events from DB scenarios
+            scenario_df = _db.build_scenario_events_df_from_db(conn, fy_id)
+            # Pools/bases maintained incrementally from gl_entries/direct_cost_entries
+            actuals = (
+                aggregate_store.get(conn, user_id, fy, cfg, account_map_df) if account_map_df is not None else None
+            )
         finally:
             conn.close()
+        if scenario_df.empty:
+            scenario_df = read_input_csv(_DEFAULT_SCENARIO_EVENTS)
 
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            input_dir = tmp_path / "inputs"
-            out_dir = tmp_path / "out"
-            input_dir.mkdir(parents=True, exist_ok=True)
+        plan = PlannerAgent().plan(
+            scenario=scenario if scenario and scenario != "Base" else None,
+            forecast_months=forecast_months,
+            run_rate_months=run_rate_months,
+            events=scenario_df,
+        )
+        plan = _replace(plan, fy_start=pd.Period(fy["start_month"], freq="M"))
+
+        if actuals is not None:
+            results = AnalystAgent().run_from_actuals(actuals, scenario_df, cfg, plan)
+        else:
+            frames: dict = {"Scenario_Events.csv": scenario_df}
 
             # GL_Actuals: gl_entries table → uploaded_files fallback
-            conn = get_connection()
-            try:
-                csv_str = _db.get_gl_entries_as_csv(conn, user_id, fy_id)
-            finally:
-                conn.close()
-            if csv_str.strip():
-                (input_dir / "GL_Actuals.csv").write_text(csv_str, encoding="utf-8")
-            else:
-                conn = get_connection()
-                try:
-                    uf = _db.get_latest_uploaded_file(conn, fy_id, "gl_actuals")
-                finally:
-                    conn.close()
-                if uf:
-                    (input_dir / "GL_Actuals.csv").write_bytes(uf["content"])
+            gl_df = _db_entries_frame(_db.read_gl_entries_df, user_id, fy_id, "gl_actuals")
+            if gl_df is not None:
+                frames["GL_Actuals.csv"] = gl_df
 
             # Account_Map: DB-generated → uploaded_files fallback
+            if account_map_df is None:
+                account_map_df = _uploaded_file_frame(fy_id, "account_map")
             if account_map_df is not None:
-                account_map_df.to_csv(input_dir / "Account_Map.csv", index=False)
-            else:
-                conn = get_connection()
-                try:
-                    uf = _db.get_latest_uploaded_file(conn, fy_id, "account_map")
-                finally:
-                    conn.close()
-                if uf:
-                    (input_dir / "Account_Map.csv").write_bytes(uf["content"])
+                frames["Account_Map.csv"] = account_map_df
 
             # Direct_Costs: direct_cost_entries table → uploaded_files fallback
-            conn = get_connection()
-            try:
-                dc_csv = _db.get_direct_cost_entries_as_csv(conn, user_id, fy_id)
-            finally:
-                conn.close()
-            if dc_csv.strip():
-                (input_dir / "Direct_Costs_By_Project.csv").write_text(dc_csv, encoding="utf-8")
-            else:
-                conn = get_connection()
-                try:
-                    uf = _db.get_latest_uploaded_file(conn, fy_id, "direct_costs")
-                finally:
-                    conn.close()
-                if uf:
-                    (input_dir / "Direct_Costs_By_Project.csv").write_bytes(uf["content"])
-
-            # Scenario_Events from DB scenarios
-            conn = get_connection()
-            try:
-                scenario_df = _db.build_scenario_events_df_from_db(conn, fy_id)
-                if not scenario_df.empty:
-                    scenario_df.to_csv(input_dir / "Scenario_Events.csv", index=False)
-            finally:
-                conn.close()
-
-            if not (input_dir / "Scenario_Events.csv").exists():
-                (input_dir / "Scenario_Events.csv").write_text(
-                    "Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
-                    "DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
-                    "Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
-                )
+            dc_df = _db_entries_frame(_db.read_direct_cost_entries_df, user_id, fy_id, "direct_costs")
+            if dc_df is not None:
+                frames["Direct_Costs_By_Project.csv"] = dc_df
 
-            required = ["GL_Actuals.csv", "Account_Map.csv", "Direct_Costs_By_Project.csv", "Scenario_Events.csv"]
-            missing = [n for n in required if not (input_dir / n).exists()]
+            missing = [n for n in INPUT_FILES if n not in frames]
             if missing:
                 logger.warning("_run_db_forecast: missing inputs %s for fy_id=%s trigger=%s", missing, fy_id, trigger)
                 return None
+            results = AnalystAgent().run(input_dir=inputs_from_frames(frames), config=cfg, plan=plan)
 
-            plan = PlannerAgent().plan(
-                scenario=scenario if scenario and scenario != "Base" else None,
-                forecast_months=forecast_months,
-                run_rate_months=run_rate_months,
-                events_path=input_dir / "Scenario_Events.csv",
-            )
-            plan = _replace(plan, fy_start=pd.Period(fy["start_month"], freq="M"))
-
-            results = AnalystAgent().run(input_dir=input_dir, config=cfg, plan=plan)
-
-            conn = get_connection()
-            try:
-                ref_rates = list_reference_rates(conn, fy_id, rate_type="budget")
-                ref_thresholds = list_reference_rates(conn, fy_id, rate_type="threshold")
-            finally:
-                conn.close()
-            if ref_rates:
-                budget_map: dict = {}
-                for rr in ref_rates:
-                    budget_map.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
-                for res in results:
-                    res.assumptions["budget_rates"] = budget_map
-            if ref_thresholds:
-                threshold_map: dict = {}
-                for rr in ref_thresholds:
-                    threshold_map.setdefault(rr["pool_group_name"], {})[rr["period"]] = rr["rate_value"]
-                for res in results:
-                    res.assumptions["rate_thresholds"] = threshold_map
-
-            ReporterAgent().package(out_dir=out_dir, results=results)
-            payload = _zip_dir_bytes(out_dir)
-
-            assumptions_str = _json.dumps(results[0].assumptions, default=str) if results else "{}"
-            conn = get_connection()
-            try:
-                run_id = save_forecast_run(
-                    conn,
-                    fiscal_year_id=fy_id,
-                    scenario=scenario or "",
-                    forecast_months=forecast_months,
-                    run_rate_months=run_rate_months,
-                    assumptions_json=assumptions_str,
-                    output_zip=payload,
-                    trigger=trigger,
-                )
-            finally:
-                conn.close()
-
-            logger.info("_run_db_forecast: saved run_id=%s fy_id=%s trigger=%s", run_id, fy_id, trigger)
-            return run_id
+        # Only the DB copy is needed: _pack_chunks saves the run before returning.
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp) / "out"
+            run = _render_pack(results, out_dir, fy_id, scenario, forecast_months, run_rate_months, trigger)
+            _pack_chunks(out_dir, run).close()
+        run_id = run["id"]
+        logger.info("_run_db_forecast: saved run_id=%s fy_id=%s trigger=%s", run_id, fy_id, trigger)
+        return run_id
 
     except Exception:
         logger.exception("_run_db_forecast: failed for fy_id=%s trigger=%s", fy_id, trigger)
         return None
 
 
-async def _write_upload(upload: Optional[UploadFile], path: Path) -> None:
-    if upload is None:
+_DEFAULT_SCENARIO_EVENTS = (
+    b"Scenario,EffectivePeriod,Type,Project,DeltaDirectLabor$,DeltaDirectLaborHrs,"
+    b"DeltaSubk,DeltaODC,DeltaTravel,DeltaPoolFringe,DeltaPoolOverhead,DeltaPoolGA,Notes\n"
+    b"Base,2025-01,ADJUST,,0,0,0,0,0,0,0,0,No changes\n"
+)
+
+
+def _uploaded_file_frame(fy_id: int, file_type: str):
+    """The latest uploaded CSV blob of ``file_type`` for the FY as a DataFrame, or ``None``."""
+    conn = get_connection()
+    try:
+        uf = get_latest_uploaded_file(conn, fy_id, file_type)
+    finally:
+        conn.close()
+    return read_input_csv(bytes(uf["content"])) if uf else None
+
+
+def _db_entries_frame(read_df, user_id: str, fy_id: int, file_type: str):
+    """Row-level entries for the FY via ``read_df``, falling back to the latest uploaded blob."""
+    conn = get_connection()
+    try:
+        df = read_df(conn, user_id, fy_id)
+    finally:
+        conn.close()
+    if not df.empty:
+        return df
+    return _uploaded_file_frame(fy_id, file_type)
+
+
+def _warm_db_pool() -> None:
+    """Open ``DB_POOL_MIN`` connections up front so the first requests skip the handshake."""
+    from .db import _connect
+    from .db_pool import get_pool
+
+    pool = get_pool(_connect)
+    if pool is not None:
+        pool.warm()
+
+
+def _store_run_artifacts(run_id: int, results: list) -> None:
+    """Write the run's frames to the Parquet artifact store; never fails the forecast."""
+    from .artifacts import artifacts_enabled, write_run_artifacts
+
+    if not artifacts_enabled():
         return
-    path.write_bytes(await upload.read())
-
-
-def _require_inputs(input_dir: Path) -> None:
-    required = [
-        "GL_Actuals.csv",
-        "Account_Map.csv",
-        "Direct_Costs_By_Project.csv",
-        "Scenario_Events.csv",
-    ]
-    missing = [n for n in required if not (input_dir / n).exists()]
-    if missing:
-        raise HTTPException(status_code=400, detail=f"Missing required inputs: {', '.join(missing)}")
-
-
-def _zip_dir_bytes(src_dir: Path) -> bytes:
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for path in src_dir.rglob("*"):
-            if path.is_file():
-                zf.write(path, arcname=str(path.relative_to(src_dir)))
-    return buf.getvalue()
+    try:
+        write_run_artifacts(run_id, results)
+    except Exception:
+        logger.exception("failed to write artifacts for run_id=%s", run_id)
+
+
+def _delete_run_artifacts(run_id: int) -> None:
+    from .artifacts import artifacts_enabled, delete_run_artifacts
+
+    if artifacts_enabled():
+        delete_run_artifacts(run_id)
 
 
 async def _load_config(config_yaml: Optional[UploadFile]) -> RateConfig:
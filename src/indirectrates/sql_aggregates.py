@@ -0,0 +1,69 @@
+"""SQL-backed equivalent of ``map_accounts_to_pools`` + ``compute_actual_aggregates``.
+
+When GL and direct costs live in ``gl_entries`` / ``direct_cost_entries`` and
+the account map is the FY's DB mapping, the account -> pool join, the
+unallowable and entity filters and the period sums all run in Postgres over
+the trigger-maintained period totals (``fy_account_map`` mirrors
+``db.build_account_map_df_from_db``).  Only period x pool, period x base and
+period x project rows come back, and pandas does nothing but pivot them.
+"""
+
+from __future__ import annotations
+
+import psycopg2.extensions
+
+from . import db
+from .config import RateConfig
+from .io import normalize_period_column
+from .mapping import unmapped_rows_warning
+from .model import actual_aggregate_warnings, actual_bases
+from .types import ActualAggregates
+
+
+def compute_actual_aggregates_sql(
+    conn: psycopg2.extensions.connection,
+    user_id: str,
+    fy_id: int,
+    config: RateConfig,
+    entity: str | None = None,
+) -> ActualAggregates | None:
+    """Actual pools, bases and direct costs for the FY, or ``None`` if it has no GL or direct-cost entries.
+
+    ``config`` must be the FY's DB-built rate configuration.
+    """
+    direct_by_project = db.read_direct_cost_totals_df(conn, user_id, fy_id)
+    if direct_by_project.empty or not db.entry_period_signatures(conn, "gl_entries", user_id, fy_id):
+        return None
+    direct_by_project = normalize_period_column(direct_by_project, "Period")
+
+    amounts = normalize_period_column(
+        db.read_period_pool_amounts(
+            conn, user_id, fy_id, exclude_pools=sorted(config.unallowable_pool_names), entity=entity
+        ),
+        "Period",
+    )
+    pools = (
+        amounts.groupby(["Period", "Pool"], as_index=False)["Amount"]
+        .sum()
+        .pivot(index="Period", columns="Pool", values="Amount")
+        .fillna(0.0)
+        .sort_index()
+    )
+
+    base_totals = None
+    if config.base_account_map:
+        base_amounts = normalize_period_column(
+            db.read_gl_base_amounts(conn, user_id, fy_id, config.base_account_map), "Period"
+        )
+        base_totals = {
+            base_key: base_amounts[base_amounts["BaseKey"] == base_key].groupby("Period")["Amount"].sum()
+            for base_key in config.base_account_map
+        }
+    bases = actual_bases(direct_by_project, pools.index, base_totals)
+
+    warnings: list[str] = []
+    missing = db.count_unmapped_gl_entries(conn, user_id, fy_id)
+    if missing:
+        warnings.append(unmapped_rows_warning(missing))
+    warnings.extend(actual_aggregate_warnings(pools, bases, direct_by_project, config, entity))
+    return ActualAggregates(pools, bases, direct_by_project, warnings)
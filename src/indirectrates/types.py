@@ -14,6 +14,16 @@ class Inputs:
     scenario_events: pd.DataFrame
 
 
+@dataclass(frozen=True)
+class ActualAggregates:
+    """Actual pools and bases by period plus direct costs by project (see ``model.compute_actual_aggregates``)."""
+
+    pools: pd.DataFrame  # Period x PoolName
+    bases: pd.DataFrame  # Period x BaseKey
+    direct_by_project: pd.DataFrame
+    warnings: list[str] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class ForecastResult:
     scenario: str
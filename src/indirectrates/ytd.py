@@ -40,33 +40,21 @@ def compute_ytd_rates(
     if len(all_periods) == 0:
         return pd.DataFrame()
 
-    fy_start_month = fy_start.month
-
-    records: list[dict[str, Any]] = []
-    for period in all_periods:
-        # Determine the fiscal year start for this period
-        if period.month >= fy_start_month:
-            fy_begin = pd.Period(year=period.year, month=fy_start_month, freq="M")
+    # Fiscal-year group key from the monthly ordinal: periods before the FY start
+    # month belong to the fiscal year that began in the previous calendar year.
+    fy_key = (all_periods.asi8 - (fy_start.month - 1)) // 12
+
+    df = pd.DataFrame(index=pd.PeriodIndex(all_periods, name="Period"))
+    for rate_name, rate_def in rate_definitions.items():
+        base_key = rate_def["base"]
+        pool_total = pools.reindex(index=all_periods, columns=rate_def["pool"], fill_value=0.0).sum(axis=1)
+        if base_key in bases.columns:
+            base_total = bases[base_key].reindex(all_periods).fillna(0.0)
         else:
-            fy_begin = pd.Period(year=period.year - 1, month=fy_start_month, freq="M")
-
-        # Cumulative window: from fy_begin through current period
-        window = all_periods[(all_periods >= fy_begin) & (all_periods <= period)]
-        if len(window) == 0:
-            continue
-
-        row: dict[str, Any] = {"Period": period}
-        for rate_name, rate_def in rate_definitions.items():
-            pool_names = rate_def["pool"]
-            base_key = rate_def["base"]
-            cum_pool = pools.reindex(window).reindex(columns=pool_names, fill_value=0.0).sum().sum()
-            cum_base = bases.reindex(window)[base_key].sum() if base_key in bases.columns else 0.0
-            row[rate_name] = float(_safe_div(cum_pool, cum_base))
-        records.append(row)
-
-    df = pd.DataFrame(records)
-    if "Period" in df.columns:
-        df = df.set_index("Period")
+            base_total = pd.Series(0.0, index=all_periods)
+        cum_pool = pool_total.groupby(fy_key).cumsum()
+        cum_base = base_total.groupby(fy_key).cumsum()
+        df[rate_name] = _safe_div(cum_pool, cum_base).to_numpy(dtype=float)
     return df
 
 
@@ -0,0 +1,56 @@
+"""Streaming ZIP writer for forecast packs.
+
+``iter_zip_dir`` yields a directory's ZIP archive in chunks of about
+``chunk_size`` bytes while it is being compressed, instead of building the
+whole archive in memory first.  ``zipfile`` writes to the unseekable sink
+using data descriptors, so the output is a standard archive that any unzip
+tool reads.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+CHUNK_SIZE = 1 << 20
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object that buffers until drained."""
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buf += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def drain(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+def iter_zip_dir(src_dir: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the deflated ZIP of every file under ``src_dir`` (paths relative to it)."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(src_dir.rglob("*")):
+            if not path.is_file():
+                continue
+            info = zipfile.ZipInfo.from_file(path, arcname=str(path.relative_to(src_dir)))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with path.open("rb") as src, zf.open(info, "w") as dest:
+                while block := src.read(chunk_size):
+                    dest.write(block)
+                    if len(sink) >= chunk_size:
+                        yield sink.drain()
+    if len(sink):
+        yield sink.drain()
@@ -0,0 +1,19 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from indirectrates import reporting
+
+
+@pytest.fixture(autouse=True)
+def chart_cache(tmp_path: Path, monkeypatch) -> reporting.ChartCache:
+    """Keep rendered charts out of the user's cache directory, including in spawned workers."""
+    root = tmp_path / "chart_cache"
+    monkeypatch.setenv("CHART_CACHE_DIR", str(root))
+    cache = reporting.ChartCache(root, max_bytes=reporting.chart_cache.max_bytes)
+    monkeypatch.setattr(reporting, "chart_cache", cache)
+    return cache
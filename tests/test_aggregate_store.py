@@ -0,0 +1,145 @@
+"""Tests for the incremental actual-aggregate store."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from indirectrates import aggregate_store as store_mod
+from indirectrates.agents import AnalystAgent, PlannerAgent
+from indirectrates.aggregate_store import AggregateStore
+from indirectrates.config import RateConfig
+from indirectrates.io import load_inputs
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+from indirectrates.types import Inputs
+
+
+class _FakeEntries:
+    """In-memory stand-in for the gl_entries / direct_cost_entries tables."""
+
+    def __init__(self, gl: pd.DataFrame, direct: pd.DataFrame) -> None:
+        self.tables = {"gl_entries": gl.assign(Entity=float("nan")), "direct_cost_entries": direct.copy()}
+        for df in self.tables.values():
+            df["_updated"] = 0
+        self.clock = 0
+
+    def touch(self, table: str, mask: pd.Series) -> None:
+        self.clock += 1
+        self.tables[table].loc[mask, "_updated"] = self.clock
+
+    def append(self, table: str, rows: pd.DataFrame) -> None:
+        self.clock += 1
+        self.tables[table] = pd.concat([self.tables[table], rows.assign(_updated=self.clock)], ignore_index=True)
+
+    def signatures(self, conn, table, user_id, fy_id):
+        df = self.tables[table]
+        grouped = df.groupby("Period")["_updated"].agg(["size", "max"])
+        return {p: (int(r["size"]), int(r["max"])) for p, r in grouped.iterrows()}
+
+    def reader(self, table: str):
+        def read(conn, user_id, fy_id, periods=None):
+            df = self.tables[table].drop(columns="_updated")
+            if periods is not None:
+                df = df[df["Period"].isin(periods)]
+            return df.sort_values(["Period", df.columns[1]], kind="stable", ignore_index=True)
+
+        return read
+
+    def totals_reader(self, table: str):
+        """Like the trigger-maintained totals tables: one row per key, with the raw row count."""
+        keys = {"gl_entries": ["Period", "Account", "Entity"], "direct_cost_entries": ["Period", "Project"]}[table]
+
+        def read(conn, user_id, fy_id, periods=None):
+            df = self.reader(table)(conn, user_id, fy_id, periods)
+            totals = df.groupby(keys, dropna=False, sort=True).agg(
+                **{c: (c, "sum") for c in df.columns if c not in keys}, RowCount=(keys[0], "size")
+            )
+            totals = totals.reset_index()
+            return totals if table == "gl_entries" else totals.drop(columns="RowCount")
+
+        return read
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    out = tmp_path / "data"
+    generate_synthetic_dataset(out, SynthSpec(start="2024-01", months=9, projects=3, seed=21))
+    return out
+
+
+def _install(monkeypatch, fake: _FakeEntries) -> None:
+    monkeypatch.setattr(store_mod.db, "entry_period_signatures", fake.signatures)
+    monkeypatch.setattr(store_mod.db, "read_gl_totals_df", fake.totals_reader("gl_entries"))
+    monkeypatch.setattr(store_mod.db, "read_direct_cost_totals_df", fake.totals_reader("direct_cost_entries"))
+
+
+def _full_run(fake: _FakeEntries, inputs: Inputs, cfg: RateConfig, plan):
+    read_gl, read_dc = fake.reader("gl_entries"), fake.reader("direct_cost_entries")
+    current = replace(inputs, gl_actuals=read_gl(None, "", 1), direct_costs=read_dc(None, "", 1))
+    return AnalystAgent().run(input_dir=current, config=cfg, plan=plan)
+
+
+def _assert_same(incremental, full) -> None:
+    for inc, ref in zip(incremental, full):
+        pd.testing.assert_frame_equal(inc.pools, ref.pools)
+        pd.testing.assert_frame_equal(inc.bases, ref.bases)
+        pd.testing.assert_frame_equal(inc.rates, ref.rates)
+        pd.testing.assert_frame_equal(inc.project_impacts, ref.project_impacts)
+        assert inc.warnings == ref.warnings
+
+
+@pytest.mark.parametrize("gl_primary", [False, True])
+def test_incremental_refresh_matches_full_rebuild(data_dir: Path, monkeypatch, gl_primary: bool) -> None:
+    inputs = load_inputs(data_dir)
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    if gl_primary:
+        cfg = replace(cfg, base_account_map={"DL": ["6000"], "TCI": ["6000", "6100"]})
+    gl = inputs.gl_actuals.assign(Account=inputs.gl_actuals["Account"].astype(str))
+    gl.loc[len(gl)] = {"Period": "2024-02", "Account": "9999", "Amount": 10.0}  # unmapped
+    fake = _FakeEntries(gl, inputs.direct_costs)
+    _install(monkeypatch, fake)
+
+    store = AggregateStore(max_entries=4)
+    fy = {"id": 1, "config_version": 3}
+    plan = PlannerAgent().plan(None, forecast_months=6, run_rate_months=3, events=inputs.scenario_events)
+
+    def check() -> None:
+        actuals = store.get(None, "u1", fy, cfg, inputs.account_map)
+        incremental = AnalystAgent().run_from_actuals(actuals, inputs.scenario_events, cfg, plan)
+        _assert_same(incremental, _full_run(fake, inputs, cfg, plan))
+
+    check()
+    assert store.stats()["full_builds"] == 1
+
+    # Monthly close: a new period arrives in both ledgers.
+    new_gl = fake.tables["gl_entries"].query("Period == '2024-09'").drop(columns="_updated").assign(Period="2024-10")
+    new_dc = fake.tables["direct_cost_entries"].query("Period == '2024-09'").drop(columns="_updated").assign(Period="2024-10")
+    fake.append("gl_entries", new_gl)
+    fake.append("direct_cost_entries", new_dc)
+    before = store.stats()["periods_recomputed"]
+    check()
+    assert store.stats()["periods_recomputed"] - before == 1
+
+    # A correction to an old period, a pool emptied out in one period, and a deleted period.
+    gl_tab = fake.tables["gl_entries"]
+    gl_tab.loc[gl_tab["Period"] == "2024-03", "Amount"] *= 1.5
+    fake.touch("gl_entries", gl_tab["Period"] == "2024-03")
+    fake.tables["gl_entries"] = gl_tab[~((gl_tab["Period"] == "2024-04") & (gl_tab["Account"] == "6200"))]
+    for table in fake.tables:
+        fake.tables[table] = fake.tables[table][fake.tables[table]["Period"] != "2024-01"]
+    check()
+
+    check()
+    assert store.stats()["hits"] == 1
+    assert store.stats()["partial_refreshes"] == 2
+
+
+def test_returns_none_without_entries(monkeypatch) -> None:
+    empty_gl = pd.DataFrame(columns=["Period", "Account", "Amount"])
+    fake = _FakeEntries(empty_gl, pd.DataFrame(columns=["Period", "Project"]))
+    _install(monkeypatch, fake)
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    assert AggregateStore(max_entries=2).get(None, "u1", {"id": 1}, cfg, pd.DataFrame(columns=["Account", "Pool"])) is None
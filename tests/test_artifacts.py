@@ -0,0 +1,102 @@
+"""Tests for the Parquet forecast run artifact store."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from indirectrates.agents import AnalystAgent, PlannerAgent
+from indirectrates.artifacts import delete_run_artifacts, load_run_results, read_run_frame, write_run_artifacts
+from indirectrates.config import default_rate_config
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+
+
+@pytest.fixture()
+def results(tmp_path: Path):
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=12, projects=3, seed=4))
+    plan = PlannerAgent().plan(None, forecast_months=6, run_rate_months=3, events_path=data_dir / "Scenario_Events.csv")
+    plan = replace(plan, fy_start=pd.Period("2025-01", freq="M"))
+    return AnalystAgent().run(input_dir=data_dir, config=default_rate_config(), plan=plan)
+
+
+def test_round_trip_restores_every_frame(tmp_path: Path, results) -> None:
+    root = tmp_path / "artifacts"
+    write_run_artifacts(7, results, root=root)
+
+    loaded = load_run_results(7, root=root)
+    assert loaded is not None
+    assert [r.scenario for r in loaded] == [r.scenario for r in results]
+    for got, exp in zip(loaded, results):
+        for name in ["rates", "ytd_rates", "pools", "bases"]:
+            pd.testing.assert_frame_equal(getattr(got, name), getattr(exp, name), check_names=False, check_freq=False)
+        pd.testing.assert_frame_equal(got.project_impacts, exp.project_impacts.reset_index(drop=True))
+        assert got.assumptions["scenario"] == exp.assumptions["scenario"]
+        assert got.warnings == exp.warnings
+
+
+def test_read_single_scenario_frame(tmp_path: Path, results) -> None:
+    root = tmp_path / "artifacts"
+    write_run_artifacts(3, results, root=root)
+    scenario = results[-1].scenario
+
+    rates = read_run_frame(3, "rates", scenario=scenario, root=root)
+
+    assert set(rates["Scenario"]) == {scenario}
+    assert len(rates) == len(results[-1].rates)
+    with pytest.raises(ValueError):
+        read_run_frame(3, "not_a_frame", root=root)
+
+
+def test_missing_and_deleted_runs_return_none(tmp_path: Path, results) -> None:
+    root = tmp_path / "artifacts"
+    assert load_run_results(1, root=root) is None
+
+    write_run_artifacts(1, results, root=root)
+    delete_run_artifacts(1, root=root)
+
+    assert load_run_results(1, root=root) is None
+    assert read_run_frame(1, "pools", root=root) is None
+
+
+def test_incomplete_runs_return_none(tmp_path: Path, results) -> None:
+    root = tmp_path / "artifacts"
+    write_run_artifacts(2, results, root=root)
+    (root / "2" / "pools.parquet").unlink()
+    assert load_run_results(2, root=root) is None
+
+    write_run_artifacts(5, results, root=root)
+    manifest = json.loads((root / "5" / "manifest.json").read_text())
+    manifest["frames"].remove("rates")
+    (root / "5" / "manifest.json").write_text(json.dumps(manifest))
+    assert load_run_results(5, root=root) is None
+
+
+class _Conn:
+    def close(self) -> None:
+        pass
+
+
+def test_report_endpoints_read_stored_runs(tmp_path: Path, results, monkeypatch) -> None:
+    from fastapi import HTTPException
+
+    from indirectrates import api_crud
+
+    monkeypatch.setenv("FORECAST_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setattr(api_crud, "_conn", _Conn)
+    monkeypatch.setattr(api_crud, "_resource_fy_id", lambda conn, query, params, item: 11)
+    write_run_artifacts(9, results)
+
+    loaded = api_crud._stored_run_results(11, 9)
+    pd.testing.assert_frame_equal(loaded[0].rates, results[0].rates, check_names=False, check_freq=False)
+    with pytest.raises(HTTPException) as exc:
+        api_crud._stored_run_results(12, 9)  # a run of another fiscal year
+    assert exc.value.status_code == 404
+    with pytest.raises(HTTPException):
+        api_crud._stored_run_results(11, 10)  # no artifacts
@@ -0,0 +1,92 @@
+"""Batched rate-config loading and the versioned per-FY config cache (no database needed)."""
+
+from __future__ import annotations
+
+from indirectrates import db
+from indirectrates.config_cache import FYConfigCache
+
+_GROUP_ROWS = [
+    {"id": 1, "name": "Fringe", "base": "TL", "cascade_order": 0, "pool_name": "Fringe Benefits"},
+    {"id": 1, "name": "Fringe", "base": "TL", "cascade_order": 0, "pool_name": "Payroll Taxes"},
+    {"id": 2, "name": "Overhead", "base": "DL", "cascade_order": 1, "pool_name": "Facilities"},
+    {"id": 3, "name": "G&A", "base": "TCI", "cascade_order": 2, "pool_name": None},
+]
+_BASE_ROWS = [
+    {"base": "DL", "account": "5000", "notes": ""},
+    {"base": "DL", "account": "5010", "notes": ""},
+    {"base": "TCI", "account": "5000", "notes": ""},
+]
+
+
+class _Cursor:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+        self._rows: list[dict] = []
+
+    def __enter__(self) -> "_Cursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple | None = None) -> None:
+        self.log.append(sql)
+        if "gl_account_mappings" in sql:
+            self._rows = []
+        elif "pool_group_base_accounts" in sql:
+            self._rows = _BASE_ROWS
+        elif "FROM pool_groups" in sql:
+            self._rows = _GROUP_ROWS
+        else:
+            self._rows = []
+
+    def fetchall(self) -> list[dict]:
+        return [dict(r) for r in self._rows]
+
+
+class _Conn:
+    def __init__(self) -> None:
+        self.log: list[str] = []
+
+    def cursor(self) -> _Cursor:
+        return _Cursor(self.log)
+
+
+def test_rate_config_is_built_from_two_queries() -> None:
+    conn = _Conn()
+
+    raw = db.build_rate_config_from_db(conn, 7)
+
+    assert len(conn.log) == 2
+    assert raw["rates"] == {
+        "Fringe": {"pool": ["Fringe Benefits", "Payroll Taxes"], "base": "TL", "cascade_order": 0},
+        "Overhead": {"pool": ["Facilities"], "base": "DL", "cascade_order": 1},
+        "G&A": {"pool": ["G&A"], "base": "TCI", "cascade_order": 2},
+    }
+    assert raw["base_account_map"] == {"DL": ["5000", "5010"], "TCI": ["5000"]}
+
+
+def test_fy_config_is_cached_per_config_version() -> None:
+    cache = FYConfigCache(max_entries=8)
+    conn = _Conn()
+    fy = {"id": 7, "config_version": 3}
+
+    first = cache.get(conn, fy)
+    queries = len(conn.log)
+    assert cache.get(conn, dict(fy)) is first
+    assert len(conn.log) == queries
+    assert first.rate_config.rates["Fringe"].pool == ["Fringe Benefits", "Payroll Taxes"]
+
+    bumped = cache.get(conn, {"id": 7, "config_version": 4})
+    assert bumped is not first
+    assert len(conn.log) == 2 * queries
+    assert cache.stats() == {"entries": 1, "max_entries": 8, "hits": 1, "misses": 2}
+
+
+def test_fy_config_cache_is_bounded() -> None:
+    cache = FYConfigCache(max_entries=2)
+    conn = _Conn()
+    for fy_id in range(3):
+        cache.get(conn, {"id": fy_id, "config_version": 0})
+
+    assert cache.stats()["entries"] == 2
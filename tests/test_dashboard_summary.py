@@ -0,0 +1,78 @@
+"""Round-trip regression test for db.get_dashboard_summary (no database needed)."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from indirectrates import db
+
+
+class _RecordingCursor:
+    def __init__(self, results: list[list[dict]]) -> None:
+        self.results = results
+        self.executed: list[tuple[str, tuple | None]] = []
+
+    def __enter__(self) -> "_RecordingCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple | None = None) -> None:
+        self.executed.append((sql, params))
+
+    def fetchall(self) -> list[dict]:
+        return self.results[len(self.executed) - 1]
+
+
+class _Conn:
+    def __init__(self, cursor: _RecordingCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _RecordingCursor:
+        return self._cursor
+
+
+def _fy_row(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"FY{i}",
+        "start_month": "2025-01",
+        "end_month": "2025-12",
+        "rate_groups": 1,
+        "pool_groups": 3,
+        "gl_mappings": 12,
+        "chart_accounts": 40,
+        "scenarios": 2,
+        "forecast_runs": i % 2,
+        "latest_run": dt.datetime(2025, 3, 1) if i % 2 else None,
+        "budget": 36,
+        "provisional": 0,
+        "threshold": 12,
+        "revenue_entries": 5,
+    }
+
+
+def test_dashboard_summary_is_two_queries_for_fifty_fiscal_years() -> None:
+    cursor = _RecordingCursor([[_fy_row(i) for i in range(50)], [{"id": 9, "scenario": "Base"}]])
+
+    summary = db.get_dashboard_summary(_Conn(cursor), user_id="u1")
+
+    assert len(cursor.executed) == 2
+    assert cursor.executed[0][1] == ("u1",)
+    assert len(summary["fiscal_years"]) == 50
+    first, second = summary["fiscal_years"][:2]
+    assert first["latest_run"] is None
+    assert second["latest_run"] == "2025-03-01 00:00:00"
+    assert second["reference_rates"] == {"budget": 36, "provisional": 0, "threshold": 12}
+    assert summary["recent_runs"] == [{"id": 9, "scenario": "Base"}]
+
+
+def test_dashboard_summary_demo_filter_is_parameterized() -> None:
+    cursor = _RecordingCursor([[], []])
+
+    db.get_dashboard_summary(_Conn(cursor), demo_only=True)
+
+    sql, params = cursor.executed[0]
+    assert "LIKE %s" in sql
+    assert params == ("DEMO-%",)
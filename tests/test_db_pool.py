@@ -0,0 +1,134 @@
+"""Tests for the connection pool behind db.get_connection (no database needed)."""
+
+from __future__ import annotations
+
+import threading
+
+import psycopg2.extensions
+import pytest
+
+from indirectrates.db_pool import ConnectionPool, PoolTimeout
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self.conn = conn
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def execute(self, sql: str) -> None:
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.conn.status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = 0
+        self.broken = False
+        self.autocommit = False
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        self.rollbacks = 0
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def get_transaction_status(self) -> int:
+        return self.status
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+        self.status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.made: list[_FakeConnection] = []
+
+    def __call__(self) -> _FakeConnection:
+        conn = _FakeConnection()
+        self.made.append(conn)
+        return conn
+
+
+def test_close_returns_connection_for_reuse() -> None:
+    factory = _Factory()
+    pool = ConnectionPool(factory, minconn=0, maxconn=2)
+
+    conn = pool.acquire()
+    raw = conn.raw
+    conn.close()
+    conn.close()  # idempotent
+    assert conn.closed
+
+    again = pool.acquire()
+    assert again.raw is raw
+    assert len(factory.made) == 1
+    again.close()
+    assert pool.stats()["in_use"] == 0
+
+
+def test_release_rolls_back_and_resets_autocommit() -> None:
+    pool = ConnectionPool(_Factory(), minconn=0, maxconn=1)
+    conn = pool.acquire()
+    raw = conn.raw
+    with conn.cursor() as cur:
+        cur.execute("UPDATE t SET x = 1")
+    conn.close()
+    assert raw.rollbacks == 1
+
+    conn = pool.acquire()
+    conn.autocommit = True
+    conn.close()
+    assert raw.autocommit is False
+
+
+def test_checkout_waits_then_times_out_at_max() -> None:
+    pool = ConnectionPool(_Factory(), minconn=0, maxconn=1, timeout=0.05)
+    held = pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+
+    released = threading.Timer(0.02, held.close)
+    pool.timeout = 2.0
+    released.start()
+    conn = pool.acquire()
+    conn.close()
+
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["waits"] == 1
+    assert stats["max_wait_ms"] > 0
+    assert stats["open"] == 1
+
+
+def test_stale_connection_is_replaced_after_failed_health_check() -> None:
+    factory = _Factory()
+    pool = ConnectionPool(factory, minconn=1, maxconn=1, health_check_after=0.0)
+    pool.warm()
+    factory.made[0].broken = True
+
+    conn = pool.acquire()
+    assert conn.raw is factory.made[1]
+    assert factory.made[0].closed
+    conn.close()
+    assert pool.stats()["health_check_failures"] == 1
+
+
+def test_broken_connection_is_discarded_on_release() -> None:
+    factory = _Factory()
+    pool = ConnectionPool(factory, minconn=0, maxconn=1)
+    conn = pool.acquire()
+    conn.raw.status = psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+    conn.close()
+
+    stats = pool.stats()
+    assert stats["open"] == 0 and stats["idle"] == 0
+    assert factory.made[0].closed
@@ -0,0 +1,134 @@
+"""Tests for streaming GL / direct-cost CSV validation."""
+
+from __future__ import annotations
+
+import io
+import re
+
+from indirectrates import db
+from indirectrates.entry_import import (
+    MAX_REPORTED_ERRORS,
+    ImportReport,
+    iter_direct_cost_chunks,
+    iter_gl_chunks,
+    run_import,
+)
+
+
+def _collect(chunks) -> list[list[tuple]]:
+    return [list(chunk) for chunk in chunks]
+
+
+def test_gl_rows_are_validated_and_chunked() -> None:
+    csv_bytes = (
+        "Period,Account,Amount,Entity\n"
+        "2025-01,5000,100.5,East\n"
+        "2025-13,5000,1,\n"
+        "2025-02,,3,\n"
+        "2025-02,6000,abc,\n"
+        "2025-02,6000,inf,\n"
+        "2025-03,7000,-25,\n"
+        "2025-04,7000,2e3,West\n"
+    ).encode()
+    loaded: list[list[tuple]] = []
+
+    def _load(chunks) -> int:
+        loaded.extend(_collect(chunks))
+        return sum(len(chunk) for chunk in loaded)
+
+    report = run_import(io.BytesIO(csv_bytes), lambda text, rep: iter_gl_chunks(text, rep, chunk_rows=2), _load)
+
+    assert loaded == [
+        [("2025-01", "5000", 100.5, "East"), ("2025-03", "7000", -25.0, "")],
+        [("2025-04", "7000", 2000.0, "West")],
+    ]
+    assert report.imported == 3
+    assert report.error_count == 4
+    assert report.errors[0] == "Line 3: invalid period '2025-13' (expected YYYY-MM)"
+    assert report.as_dict()["rows_per_sec"] >= 0
+
+
+def test_direct_cost_non_numeric_values_default_to_zero() -> None:
+    text = io.StringIO(
+        "Period,Project,DirectLabor$,DirectLaborHrs,Subk,ODC,Travel\n"
+        "2025-01,P1,100,10,x,,5\n"
+        ",P2,1,1,1,1,1\n"
+    )
+    report = ImportReport()
+    chunks = _collect(iter_direct_cost_chunks(text, report))
+
+    assert chunks == [[("2025-01", "P1", 100.0, 10.0, 0.0, 0.0, 5.0)]]
+    assert report.errors == ["Line 3: missing Period"]
+
+
+def test_invalid_utf8_is_replayed_as_latin1() -> None:
+    csv_bytes = "Period,Account,Amount,Entity\n2025-01,5000,1,Café\n".encode("latin-1")
+    attempts: list[list[tuple]] = []
+
+    def _load(chunks) -> int:
+        rows = [row for chunk in chunks for row in chunk]
+        attempts.append(rows)
+        return len(rows)
+
+    report = run_import(io.BytesIO(csv_bytes), iter_gl_chunks, _load)
+
+    assert report.imported == 1
+    assert attempts[-1] == [("2025-01", "5000", 1.0, "Café")]
+
+
+def test_reported_errors_are_capped() -> None:
+    body = "Period,Account,Amount,Entity\n" + "bad,5000,1,\n" * (MAX_REPORTED_ERRORS + 10)
+
+    report = run_import(io.BytesIO(body.encode()), iter_gl_chunks, lambda chunks: sum(len(c) for c in chunks))
+
+    assert report.error_count == MAX_REPORTED_ERRORS + 10
+    assert len(report.errors) == MAX_REPORTED_ERRORS
+
+
+class _CopyCursor:
+    """Applies Postgres CSV COPY's NULL rule: an unquoted empty field is NULL unless FORCE_NOT_NULL."""
+
+    def __init__(self) -> None:
+        self.staged: list[dict] = []
+
+    def __enter__(self) -> "_CopyCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple | None = None) -> None:
+        pass
+
+    def copy_expert(self, sql: str, buf) -> None:
+        columns = [c.strip() for c in re.search(r"\((.*?)\) FROM STDIN", sql).group(1).split(",")]
+        forced = re.search(r"FORCE_NOT_NULL \((.*?)\)", sql)
+        not_null = {c.strip() for c in forced.group(1).split(",")} if forced else set()
+        for line in buf.read().splitlines():
+            fields = dict(zip(columns, line.split(",")))
+            self.staged.append({c: (None if v == "" and c not in not_null else v) for c, v in fields.items()})
+
+
+class _CopyConn:
+    def __init__(self) -> None:
+        self.cur = _CopyCursor()
+
+    def cursor(self) -> _CopyCursor:
+        return self.cur
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+def test_blank_entity_and_project_are_not_copied_as_null() -> None:
+    gl_conn, dc_conn = _CopyConn(), _CopyConn()
+
+    db.copy_gl_entries(gl_conn, "u1", 1, [[("2025-03", "7000", -25.0, "")]])
+    db.copy_direct_cost_entries(dc_conn, "u1", 1, [[("2025-03", "", 10.0, 1.0, 0.0, 0.0, 0.0)]])
+
+    # gl_entries.entity and direct_cost_entries.project are NOT NULL DEFAULT ''.
+    assert gl_conn.cur.staged[0]["entity"] == ""
+    assert dc_conn.cur.staged[0]["project"] == ""
@@ -0,0 +1,67 @@
+"""Tests for the materialized entry totals helpers (no database needed)."""
+
+from __future__ import annotations
+
+from indirectrates import db
+
+
+class _RecordingCursor:
+    def __init__(self, results: list[list[dict]] | None = None) -> None:
+        self.results = results or []
+        self.executed: list[tuple[str, tuple | None]] = []
+
+    def __enter__(self) -> "_RecordingCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple | None = None) -> None:
+        self.executed.append((sql, params))
+
+    def fetchone(self) -> dict | None:
+        return None
+
+    def fetchall(self) -> list[dict]:
+        return self.results[len(self.executed) - 1]
+
+
+class _Conn:
+    def __init__(self, cursor: _RecordingCursor) -> None:
+        self._cursor = cursor
+
+    def cursor(self) -> _RecordingCursor:
+        return self._cursor
+
+
+def test_triggers_are_statement_level_with_one_event_each() -> None:
+    cur = _RecordingCursor()
+    db._create_entry_totals_triggers(cur)
+
+    creates = [sql for sql, _ in cur.executed if sql.startswith("CREATE TRIGGER")]
+    assert len(creates) == 6
+    for sql in creates:
+        assert "FOR EACH STATEMENT" in sql
+        assert sum(event in sql for event in ("AFTER INSERT", "AFTER UPDATE", "AFTER DELETE")) == 1
+    assert any("AFTER UPDATE ON gl_entries REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows" in s for s in creates)
+
+
+def test_check_entry_totals_scopes_both_sides_and_sorts() -> None:
+    gl_row = {"source": "gl_entries", "user_id": "u1", "fiscal_year_id": 3, "period": "2025-02", "key": "6000/"}
+    dc_row = {"source": "direct_cost_entries", "user_id": "u1", "fiscal_year_id": 3, "period": "2025-01", "key": "P1"}
+    cur = _RecordingCursor([[gl_row], [dc_row]])
+
+    mismatches = db.check_entry_totals(_Conn(cur), user_id="u1", fy_id=3)
+
+    assert [m["source"] for m in mismatches] == ["direct_cost_entries", "gl_entries"]
+    for sql, params in cur.executed:
+        assert sql.count("user_id = %s AND fiscal_year_id = %s") == 2
+        assert params == ("u1", 3, "u1", 3)
+
+
+def test_unscoped_check_covers_every_fiscal_year() -> None:
+    cur = _RecordingCursor([[], []])
+    assert db.check_entry_totals(_Conn(cur)) == []
+    for sql, params in cur.executed:
+        assert "WHERE TRUE" in sql
+        assert params == ()
@@ -0,0 +1,71 @@
+"""Tests for the fingerprint-keyed ForecastResult cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from indirectrates.agents import PlannerAgent
+from indirectrates.config import default_rate_config
+from indirectrates.forecast_cache import ForecastCache, _result_nbytes, cached_run, forecast_cache, input_fingerprint
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+
+
+@pytest.fixture()
+def synth_dir(tmp_path: Path) -> Path:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=12, projects=3, seed=9))
+    return data_dir
+
+
+def _plan(data_dir: Path):
+    return PlannerAgent().plan("Base", forecast_months=6, run_rate_months=3, events_path=data_dir / "Scenario_Events.csv")
+
+
+def test_cached_run_reuses_results_until_inputs_change(synth_dir: Path) -> None:
+    forecast_cache.clear()
+    cfg = default_rate_config()
+    before = forecast_cache.stats()
+
+    first = cached_run(synth_dir, cfg, _plan(synth_dir))
+    second = cached_run(synth_dir, cfg, _plan(synth_dir))
+    assert second is first
+
+    gl = synth_dir / "GL_Actuals.csv"
+    gl.write_text(gl.read_text() + gl.read_text().splitlines()[-1] + "\n")
+    third = cached_run(synth_dir, cfg, _plan(synth_dir))
+    assert third is not first
+
+    stats = forecast_cache.stats()
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 2
+
+
+def test_fingerprint_covers_config_and_plan(synth_dir: Path) -> None:
+    cfg = default_rate_config()
+    plan = _plan(synth_dir)
+    key = input_fingerprint(synth_dir, cfg, plan)
+
+    assert input_fingerprint(synth_dir, cfg, plan) == key
+    assert input_fingerprint(synth_dir, cfg, replace(plan, forecast_months=9)) != key
+    assert input_fingerprint(synth_dir, replace(cfg, unallowable_pool_names={"Other"}), plan) != key
+    assert input_fingerprint(synth_dir, cfg, plan, entity="East") != key
+
+
+def test_lru_evicts_least_recently_used_by_size(synth_dir: Path) -> None:
+    results = cached_run(synth_dir, default_rate_config(), _plan(synth_dir))
+    cache = ForecastCache(max_bytes=1)
+    cache.put("too-big", results)
+    assert cache.stats()["entries"] == 0
+
+    cache = ForecastCache(max_bytes=2 * _result_nbytes(results))
+    cache.put("a", results)
+    cache.put("b", results)
+    assert cache.get("a") is results  # "a" is now most recently used
+    cache.put("c", results)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is results and cache.get("c") is results
+    assert cache.stats()["evictions"] == 1
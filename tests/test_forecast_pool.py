@@ -0,0 +1,92 @@
+"""Tests for the bounded /forecast process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from indirectrates.forecast_pool import ForecastPool, ForecastPoolBusy, ForecastTimeout
+
+
+def test_runs_jobs_in_worker_processes() -> None:
+    pool = ForecastPool(max_workers=1, max_queue=2, timeout_seconds=60)
+    try:
+        assert asyncio.run(pool.run(pow, 2, 10)) == 1024
+        stats = pool.stats()
+        assert stats["completed"] == 1 and stats["in_flight"] == 0
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_rejects_when_workers_and_queue_are_full() -> None:
+    pool = ForecastPool(max_workers=0, max_queue=1, timeout_seconds=5)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(ForecastPoolBusy):
+            await pool.run(release.wait)
+        release.set()
+        assert await running and await queued
+
+    try:
+        asyncio.run(scenario())
+        assert pool.stats()["rejected"] == 1
+        assert pool.stats()["in_flight"] == 0
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_timeout_frees_the_slot_once_the_job_ends() -> None:
+    pool = ForecastPool(max_workers=0, max_queue=0, timeout_seconds=0.05)
+    try:
+        with pytest.raises(ForecastTimeout):
+            asyncio.run(pool.run(time.sleep, 0.3))
+        assert pool.stats()["timed_out"] == 1
+        time.sleep(0.4)
+        assert pool.stats()["in_flight"] == 0
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_event_loop_stays_responsive_while_a_job_runs() -> None:
+    pool = ForecastPool(max_workers=0, max_queue=0, timeout_seconds=5)
+
+    async def scenario() -> int:
+        job = asyncio.ensure_future(pool.run(time.sleep, 0.3))
+        ticks = 0
+        while not job.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        await job
+        return ticks
+
+    try:
+        assert asyncio.run(scenario()) > 10
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_call_blocks_the_thread_while_the_job_runs_in_a_worker_process() -> None:
+    pool = ForecastPool(max_workers=1, max_queue=0, timeout_seconds=60)
+    try:
+        assert pool.call(os.getpid) != os.getpid()
+        assert pool.stats()["completed"] == 1
+    finally:
+        pool.shutdown(wait=True)
+
+
+def test_call_times_out() -> None:
+    pool = ForecastPool(max_workers=0, max_queue=0, timeout_seconds=0.05)
+    try:
+        with pytest.raises(ForecastTimeout):
+            pool.call(time.sleep, 0.3)
+        assert pool.stats()["timed_out"] == 1
+    finally:
+        pool.shutdown(wait=True)
@@ -0,0 +1,117 @@
+"""Tests for the durable forecast job queue's worker side."""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+
+from indirectrates import jobs
+from indirectrates.config import RateConfig
+from indirectrates.io import load_inputs
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.rollbacks = 0
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        pass
+
+
+def _job(data_dir: Path, cfg: RateConfig, **params) -> dict:
+    return {
+        "id": "job1",
+        "worker": "w1",
+        "fiscal_year_id": None,
+        "params_json": json.dumps({"scenario": None, "forecast_months": 6, "run_rate_months": 3, **params}),
+        "config_json": json.dumps(cfg.to_mapping()),
+        "inputs_zip": jobs.pack_inputs(load_inputs(data_dir)),
+    }
+
+
+def _record_db_calls(monkeypatch, owner: str = "w1") -> list[tuple]:
+    calls: list[tuple] = []
+
+    def record(kind: str, value: object, worker: str) -> bool:
+        calls.append((kind, value))
+        return worker == owner
+
+    monkeypatch.setattr(
+        jobs.db, "update_forecast_job_progress", lambda conn, job_id, worker, p: record("progress", p, worker)
+    )
+    monkeypatch.setattr(
+        jobs.db,
+        "finish_forecast_job",
+        lambda conn, job_id, worker, payload, run_id=None: record("finish", payload, worker),
+    )
+    monkeypatch.setattr(jobs.db, "fail_forecast_job", lambda conn, job_id, worker, error: record("fail", error, worker))
+    return calls
+
+
+def test_rate_config_mapping_round_trip() -> None:
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    assert RateConfig.from_mapping(json.loads(json.dumps(cfg.to_mapping()))) == cfg
+
+
+def test_execute_job_packages_result(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=12, projects=3, seed=5))
+    unpacked = jobs.unpack_inputs(jobs.pack_inputs(load_inputs(data_dir)))
+    pd.testing.assert_frame_equal(unpacked.gl_actuals, load_inputs(data_dir).gl_actuals)
+
+    calls = _record_db_calls(monkeypatch)
+    jobs.execute_job(_FakeConn(), _job(data_dir, RateConfig.from_yaml(Path("configs/default_rates.yaml"))))
+
+    assert [c[1] for c in calls[:-1]] == ["loading inputs", "computing", "packaging"]
+    kind, payload = calls[-1]
+    assert kind == "finish"
+    with zipfile.ZipFile(io.BytesIO(payload)) as zf:
+        assert any(name.endswith(".xlsx") or name.endswith(".csv") for name in zf.namelist())
+
+
+def test_execute_job_records_failure(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=6, projects=2, seed=5))
+    calls = _record_db_calls(monkeypatch)
+    conn = _FakeConn()
+    job = _job(data_dir, RateConfig.from_yaml(Path("configs/default_rates.yaml")))
+    job["params_json"] = json.dumps({"scenario": None})  # missing forecast_months
+
+    jobs.execute_job(conn, job)
+
+    assert calls[-1][0] == "fail"
+    assert "KeyError" in calls[-1][1]
+    assert conn.rollbacks == 1
+
+
+def test_execute_job_stops_once_the_claim_is_lost(tmp_path: Path, monkeypatch) -> None:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=6, projects=2, seed=5))
+    calls = _record_db_calls(monkeypatch, owner="w2")  # requeued and re-claimed by another worker
+
+    jobs.execute_job(_FakeConn(), _job(data_dir, RateConfig.from_yaml(Path("configs/default_rates.yaml"))))
+
+    assert calls == [("progress", "loading inputs")]
+
+
+def test_heartbeat_runs_for_the_whole_job(monkeypatch) -> None:
+    beats = []
+    monkeypatch.setattr(jobs.db, "get_connection", _FakeConn)
+    monkeypatch.setattr(jobs.db, "heartbeat_forecast_job", lambda conn, job_id, worker: beats.append(job_id) or True)
+
+    with jobs._heartbeat("job1", "w1", interval=0.01):
+        time.sleep(0.2)
+    count = len(beats)
+    time.sleep(0.05)
+
+    assert count >= 3
+    assert len(beats) == count  # stopped with the job
@@ -177,3 +177,13 @@ class TestCascadingRates:
             assert rates_flat[rate_name].iloc[0] == pytest.approx(
                 rates_cascade[rate_name].iloc[0], rel=1e-6
             ), f"Rate {rate_name} should be identical for flat and cascaded"
+
+    def test_ytd_allocation_cascades_like_monthly(self):
+        """In the first FY month YTD rates equal monthly rates, so both cascades must agree."""
+        proj = _make_projection(dl=100_000, subk=50_000, fringe_pool=25_000, oh_pool=12_500, ga_pool=28_125)
+        _, impacts, ytd = compute_rates_and_impacts(proj, _cascaded_config(), fy_start=pd.Period("2025-01", freq="M"))
+
+        assert ytd is not None
+        for rate_name in ["Fringe", "Overhead", "G&A"]:
+            assert impacts[f"{rate_name}$_ytd"].iloc[0] == pytest.approx(impacts[f"{rate_name}$"].iloc[0], rel=1e-9)
+        assert impacts["LoadedCost$_ytd"].iloc[0] == pytest.approx(impacts["LoadedCost$"].iloc[0], rel=1e-9)
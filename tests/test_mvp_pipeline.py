@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import io
+import zipfile
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from indirectrates.agents import AnalystAgent, PlannerAgent, ReporterAgent
 from indirectrates.config import RateConfig
+from indirectrates.io import INPUT_FILES, inputs_from_frames, load_inputs, read_input_csv, read_zip_frames
 from indirectrates.synth import SynthSpec, generate_synthetic_dataset
 
 
@@ -51,3 +55,68 @@ def test_scenario_win_vs_lose_direction(tmp_path: Path) -> None:
     mask = win.index >= eff
     assert float(lose.loc[mask, "Overhead"].mean()) >= float(win.loc[mask, "Overhead"].mean())
     assert float(lose.loc[mask, "G&A"].mean()) >= float(win.loc[mask, "G&A"].mean())
+
+
+def test_parallel_scenarios_match_sequential(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=12, projects=3, seed=5))
+
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    plan = PlannerAgent().plan(None, forecast_months=6, run_rate_months=3, events_path=data_dir / "Scenario_Events.csv")
+    sequential = AnalystAgent().run(input_dir=data_dir, config=cfg, plan=plan)
+    parallel = AnalystAgent().run(input_dir=data_dir, config=cfg, plan=plan, workers=2)
+
+    assert [r.scenario for r in parallel] == plan.scenarios
+    for seq, par in zip(sequential, parallel):
+        pd.testing.assert_frame_equal(par.rates, seq.rates)
+        pd.testing.assert_frame_equal(par.project_impacts, seq.project_impacts)
+        assert par.assumptions == seq.assumptions
+
+
+def test_in_memory_inputs_match_input_dir(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=12, projects=3, seed=11))
+
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    frames = {name: read_input_csv((data_dir / name).read_bytes()) for name in INPUT_FILES}
+    inputs = inputs_from_frames(frames)
+
+    plan = PlannerAgent().plan(None, forecast_months=6, run_rate_months=3, events=inputs.scenario_events)
+    assert plan == PlannerAgent().plan(
+        None, forecast_months=6, run_rate_months=3, events_path=data_dir / "Scenario_Events.csv"
+    )
+
+    from_dir = AnalystAgent().run(input_dir=data_dir, config=cfg, plan=plan)
+    from_frames = AnalystAgent().run(input_dir=inputs, config=cfg, plan=plan)
+    for disk, mem in zip(from_dir, from_frames):
+        pd.testing.assert_frame_equal(mem.rates, disk.rates)
+        pd.testing.assert_frame_equal(mem.project_impacts, disk.project_impacts)
+
+
+def test_load_inputs_from_zip_matches_input_dir(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=6, projects=2, seed=3))
+    archive = tmp_path / "inputs.zip"
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name in INPUT_FILES:
+            zf.write(data_dir / name, arcname=name)
+
+    from_dir = load_inputs(data_dir)
+    for source in (archive, io.BytesIO(archive.read_bytes())):
+        from_zip = load_inputs(source)
+        for field in ("gl_actuals", "account_map", "direct_costs", "scenario_events"):
+            pd.testing.assert_frame_equal(getattr(from_zip, field), getattr(from_dir, field))
+
+
+def test_read_zip_frames_returns_only_present_members(tmp_path: Path) -> None:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("Account_Map.csv", "Account,Pool\n7100.10,Fringe\n")
+        zf.writestr("notes.txt", "ignored")
+    buf.seek(0)
+
+    frames = read_zip_frames(buf)
+    assert list(frames) == ["Account_Map.csv"]
+    assert frames["Account_Map.csv"]["Account"].tolist() == ["7100.10"]
+    with pytest.raises(FileNotFoundError):
+        load_inputs(io.BytesIO(buf.getvalue()))
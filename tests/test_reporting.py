@@ -0,0 +1,156 @@
+"""Tests for rate chart rendering."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from indirectrates import reporting
+from indirectrates.agents import AnalystAgent, PlannerAgent
+from indirectrates.config import RateConfig
+from indirectrates.reporting import save_rate_charts
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("data")
+    generate_synthetic_dataset(data_dir, SynthSpec(start="2025-01", months=12, projects=3, seed=7))
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    plan = PlannerAgent().plan(None, 6, 3, events_path=data_dir / "Scenario_Events.csv")
+    return AnalystAgent().run(input_dir=data_dir, config=cfg, plan=plan)
+
+
+@pytest.fixture(autouse=True)
+def no_chart_cache(monkeypatch) -> None:
+    monkeypatch.setattr(reporting, "chart_cache", reporting.ChartCache("unused", max_bytes=0))
+
+
+def test_one_chart_per_rate(tmp_path: Path, results) -> None:
+    paths = save_rate_charts(tmp_path, results, workers=1)
+    assert [p.name for p in paths] == ["rate_Fringe.png", "rate_Overhead.png", "rate_G_A.png"]
+    assert all(p.read_bytes().startswith(b"\x89PNG") for p in paths)
+
+
+def test_reused_figure_renders_like_a_fresh_one(tmp_path: Path, results) -> None:
+    first = save_rate_charts(tmp_path / "a", results, workers=1)
+    # Redraw only the first rate: the template figure last drew the final one.
+    first_only = [replace(r, rates=r.rates.iloc[:, :1]) for r in results]
+    again = save_rate_charts(tmp_path / "b", first_only, workers=1)
+    assert again[0].read_bytes() == first[0].read_bytes()
+
+
+def _save_charts(out_dir: Path, results) -> None:
+    save_rate_charts(out_dir, results, workers=2)
+
+
+def test_daemon_processes_render_in_process(tmp_path: Path, results, monkeypatch) -> None:
+    # Forecast job workers are daemonic and may not start a chart pool of their own.
+    monkeypatch.setenv("CHART_CACHE_MAX_BYTES", "0")
+    proc = multiprocessing.get_context("spawn").Process(target=_save_charts, args=(tmp_path, results), daemon=True)
+    proc.start()
+    proc.join(120)
+
+    assert proc.exitcode == 0
+    assert sorted(p.name for p in tmp_path.glob("*.png")) == ["rate_Fringe.png", "rate_G_A.png", "rate_Overhead.png"]
+
+
+def test_pool_start_failure_falls_back_to_in_process(tmp_path: Path, results, monkeypatch) -> None:
+    def no_pool(workers):
+        raise OSError("cannot spawn")
+
+    monkeypatch.setattr(reporting, "_get_chart_pool", no_pool)
+    paths = save_rate_charts(tmp_path, results, workers=2)
+    assert all(p.read_bytes().startswith(b"\x89PNG") for p in paths)
+
+
+def test_parallel_rendering_matches_sequential(tmp_path: Path, results) -> None:
+    sequential = save_rate_charts(tmp_path / "seq", results, workers=1)
+    parallel = save_rate_charts(tmp_path / "par", results, workers=2)
+    assert [p.name for p in parallel] == [p.name for p in sequential]
+    for seq, par in zip(sequential, parallel):
+        assert par.read_bytes() == seq.read_bytes()
+
+
+@pytest.fixture
+def cache(tmp_path: Path, monkeypatch) -> reporting.ChartCache:
+    cache = reporting.ChartCache(tmp_path / "cache", max_bytes=1 << 30)
+    monkeypatch.setattr(reporting, "chart_cache", cache)
+    return cache
+
+
+def test_unchanged_charts_come_from_the_cache(tmp_path: Path, results, cache, monkeypatch) -> None:
+    first = save_rate_charts(tmp_path / "a", results, workers=1)
+    assert cache.stats()["entries"] == 3
+
+    def no_render(spec, path):
+        raise AssertionError(f"re-rendered {spec.rate_name}")
+
+    monkeypatch.setattr(reporting, "_render_chart", no_render)
+    again = save_rate_charts(tmp_path / "b", results, workers=1)
+    assert [p.read_bytes() for p in again] == [p.read_bytes() for p in first]
+    assert cache.hits == 3
+
+
+def test_changed_series_is_redrawn(tmp_path: Path, results, cache, monkeypatch) -> None:
+    save_rate_charts(tmp_path / "a", results, workers=1)
+    changed = [replace(results[0], rates=results[0].rates.assign(Fringe=results[0].rates["Fringe"] + 0.01))]
+    changed += results[1:]
+
+    rendered = []
+    render = reporting._render_chart
+
+    def tracking_render(spec, path):
+        rendered.append(spec.rate_name)
+        return render(spec, path)
+
+    monkeypatch.setattr(reporting, "_render_chart", tracking_render)
+    save_rate_charts(tmp_path / "b", changed, workers=1)
+    assert rendered == ["Fringe"]
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = reporting.ChartCache(tmp_path / "cache", max_bytes=250)
+    src = tmp_path / "chart.png"
+    src.write_bytes(b"x" * 100)
+    for i, key in enumerate(["aa01", "bb02", "cc03"]):
+        cache.store(key, src)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    assert cache.fetch("aa01", tmp_path / "hit.png")  # now the most recently used
+
+    cache.prune()
+    assert sorted(p.stem for p in (tmp_path / "cache").glob("*/*.png")) == ["aa01", "cc03"]
+
+
+def test_unusable_cache_directory_still_renders(tmp_path: Path, results, monkeypatch) -> None:
+    blocker = tmp_path / "cache"
+    blocker.write_text("not a directory")  # every cache path now fails with NotADirectoryError
+    cache = reporting.ChartCache(blocker, max_bytes=1 << 30)
+    monkeypatch.setattr(reporting, "chart_cache", cache)
+
+    paths = save_rate_charts(tmp_path / "out", results, workers=1)
+    assert len(paths) == 3 and all(p.read_bytes().startswith(b"\x89PNG") for p in paths)
+    assert cache.misses == 3 and cache.stats()["entries"] == 0
+
+
+def test_prune_skips_files_it_cannot_delete(tmp_path: Path, monkeypatch) -> None:
+    cache = reporting.ChartCache(tmp_path / "cache", max_bytes=200)
+    src = tmp_path / "chart.png"
+    src.write_bytes(b"x" * 100)
+    for i, key in enumerate(["aa01", "bb02", "cc03"]):
+        cache.store(key, src)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    unlink = Path.unlink
+
+    def stuck(self, missing_ok=False):
+        if self.stem == "aa01":
+            raise PermissionError(13, "Permission denied", str(self))
+        return unlink(self, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", stuck)
+    cache.prune()
+    assert sorted(p.stem for p in (tmp_path / "cache").glob("*/*.png")) == ["aa01", "cc03"]
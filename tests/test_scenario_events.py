@@ -0,0 +1,230 @@
+"""Tests for vectorized scenario event application in apply_scenario_events."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indirectrates.config import RateConfig
+from indirectrates.model import Projection, apply_scenario_events, build_baseline_projection
+
+_DIRECT_COLS = [
+    ("DirectLabor$", "DeltaDirectLabor$"),
+    ("DirectLaborHrs", "DeltaDirectLaborHrs"),
+    ("Subk", "DeltaSubk"),
+    ("ODC", "DeltaODC"),
+    ("Travel", "DeltaTravel"),
+]
+
+
+def _make_baseline(months: int = 12, projects: int = 5, forecast_months: int = 6) -> Projection:
+    rng = np.random.default_rng(3)
+    periods = pd.period_range("2025-01", periods=months, freq="M")
+    pools = pd.DataFrame(
+        {
+            "Fringe": rng.uniform(40_000, 60_000, months),
+            "Overhead": rng.uniform(80_000, 120_000, months),
+            "G&A": rng.uniform(90_000, 110_000, months),
+        },
+        index=periods,
+    )
+    direct = pd.DataFrame(
+        [
+            {
+                "Period": p,
+                "Project": f"P{j:03d}",
+                "DirectLabor$": rng.uniform(50_000, 150_000),
+                "DirectLaborHrs": rng.uniform(500, 1500),
+                "Subk": rng.uniform(0, 40_000),
+                "ODC": rng.uniform(0, 10_000),
+                "Travel": rng.uniform(0, 5_000),
+            }
+            for p in periods
+            for j in range(projects)
+        ]
+    )
+    by_period = direct.groupby("Period")[["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]].sum()
+    bases = pd.DataFrame(
+        {
+            "DL": by_period["DirectLabor$"],
+            "DLH": by_period["DirectLaborHrs"],
+            "TL": by_period["DirectLabor$"],
+            "TCI": by_period[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1),
+        }
+    )
+    return build_baseline_projection(pools, bases, direct, forecast_months=forecast_months, run_rate_months=3)
+
+
+def _make_events(n: int, periods: pd.PeriodIndex, projects: list[str], seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Include effective periods before, inside, and after the projection horizon.
+    candidates = pd.period_range(periods.min() - 2, periods.max() + 2, freq="M")
+    events = pd.DataFrame(
+        {
+            "Scenario": "Test",
+            "EffectivePeriod": candidates[rng.integers(0, len(candidates), n)],
+            "Type": "ADJUST",
+            "Project": [projects[i] if i < len(projects) else "" for i in rng.integers(0, len(projects) + 2, n)],
+            "DeltaPoolFringe": rng.normal(0, 1_000, n),
+            "DeltaPoolGA": rng.normal(0, 1_000, n),
+            "DeltaPoolNew Pool": rng.normal(0, 500, n),
+        }
+    )
+    for _, delta_col in _DIRECT_COLS:
+        events[delta_col] = rng.normal(0, 2_000, n)
+    return events
+
+
+def _loop_apply(projection: Projection, events: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Reference per-event implementation (the original row-by-row loop)."""
+    pools = projection.pools.copy()
+    direct = projection.direct_by_project.copy()
+    pool_delta_map = {
+        c: ("G&A" if c[len("DeltaPool"):] == "GA" else c[len("DeltaPool"):])
+        for c in events.columns
+        if c.startswith("DeltaPool")
+    }
+    for _, event in events.iterrows():
+        eff = event["EffectivePeriod"]
+        applicable_periods = pools.index[pools.index >= eff]
+        if len(applicable_periods) == 0:
+            continue
+        for delta_col, pool_name in pool_delta_map.items():
+            if pool_name not in pools.columns:
+                pools[pool_name] = 0.0
+            pools.loc[applicable_periods, pool_name] += float(event[delta_col])
+        project = str(event["Project"] or "").strip()
+        if project:
+            mask = (direct["Project"] == project) & (direct["Period"] >= eff)
+            for col, delta_col in _DIRECT_COLS:
+                direct.loc[mask, col] = direct.loc[mask, col].fillna(0.0) + float(event[delta_col])
+    return pools.fillna(0.0), direct
+
+
+@pytest.mark.parametrize("n_events", [1, 25, 400])
+def test_vectorized_events_match_loop(n_events: int) -> None:
+    baseline = _make_baseline()
+    projects = sorted(baseline.direct_by_project["Project"].unique())
+    events = _make_events(n_events, baseline.pools.index, projects)
+
+    proj = apply_scenario_events(baseline, events, scenario="Test")
+    exp_pools, exp_direct = _loop_apply(baseline, events)
+
+    pd.testing.assert_frame_equal(proj.pools, exp_pools, check_exact=False, rtol=1e-9, atol=1e-6)
+    pd.testing.assert_frame_equal(proj.direct_by_project, exp_direct, check_exact=False, rtol=1e-9, atol=1e-6)
+    assert proj.assumptions["events_applied"] == n_events
+
+
+def test_events_after_horizon_are_ignored() -> None:
+    baseline = _make_baseline()
+    events = pd.DataFrame(
+        [
+            {
+                "Scenario": "Late",
+                "EffectivePeriod": baseline.pools.index.max() + 1,
+                "Project": "P000",
+                "DeltaDirectLabor$": 5_000,
+                "DeltaPoolBrand New": 1_000,
+            }
+        ]
+    )
+    proj = apply_scenario_events(baseline, events, scenario="Late")
+
+    assert "Brand New" not in proj.pools.columns
+    pd.testing.assert_frame_equal(proj.direct_by_project, baseline.direct_by_project)
+
+
+def test_project_events_only_touch_their_project() -> None:
+    baseline = _make_baseline()
+    eff = pd.Period("2025-06", freq="M")
+    events = pd.DataFrame(
+        [
+            {"Scenario": "Hire", "EffectivePeriod": eff, "Project": "P001", "DeltaDirectLabor$": 1_000},
+            {"Scenario": "Hire", "EffectivePeriod": eff + 2, "Project": " P001 ", "DeltaDirectLabor$": 500},
+        ]
+    )
+    proj = apply_scenario_events(baseline, events, scenario="Hire")
+
+    before = baseline.direct_by_project.set_index(["Period", "Project"])["DirectLabor$"]
+    after = proj.direct_by_project.set_index(["Period", "Project"])["DirectLabor$"]
+    diff = (after - before).unstack("Project")
+
+    assert (diff.drop(columns="P001") == 0).all().all()
+    assert (diff.loc[diff.index < eff, "P001"] == 0).all()
+    assert diff.loc[eff, "P001"] == pytest.approx(1_000)
+    assert diff.loc[eff + 2, "P001"] == pytest.approx(1_500)
+
+
+def _by_period(direct: pd.DataFrame) -> pd.DataFrame:
+    return direct.groupby("Period")[["DirectLabor$", "DirectLaborHrs", "Subk", "ODC", "Travel"]].sum()
+
+
+def test_fallback_bases_reconcile_to_direct_costs() -> None:
+    baseline = _make_baseline()
+    projects = sorted(baseline.direct_by_project["Project"].unique())
+    events = _make_events(50, baseline.pools.index, projects)
+
+    proj = apply_scenario_events(baseline, events, scenario="Test")
+    by_period = _by_period(proj.direct_by_project)
+
+    pd.testing.assert_frame_equal(proj.direct_by_period, by_period, check_exact=False, rtol=1e-9)
+    pd.testing.assert_series_equal(proj.bases["DL"], by_period["DirectLabor$"], check_names=False, rtol=1e-9)
+    pd.testing.assert_series_equal(proj.bases["TL"], by_period["DirectLabor$"], check_names=False, rtol=1e-9)
+    pd.testing.assert_series_equal(proj.bases["DLH"], by_period["DirectLaborHrs"], check_names=False, rtol=1e-9)
+    expected_tci = by_period[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1)
+    pd.testing.assert_series_equal(proj.bases["TCI"], expected_tci, check_names=False, rtol=1e-9)
+
+
+def test_gl_primary_bases_shift_by_direct_cost_deltas() -> None:
+    config = RateConfig.from_mapping(
+        {
+            "rates": {"Fringe": {"pool": ["Fringe"], "base": "TL"}},
+            "base_account_map": {"DL": ["5000"], "TCI": ["5000", "5100"]},
+        }
+    )
+    baseline = _make_baseline()
+    projects = sorted(baseline.direct_by_project["Project"].unique())
+    events = _make_events(50, baseline.pools.index, projects)
+
+    proj = apply_scenario_events(baseline, events, scenario="Test", config=config)
+    delta = _by_period(proj.direct_by_project) - _by_period(baseline.direct_by_project)
+
+    pd.testing.assert_series_equal(
+        proj.bases["DL"] - baseline.bases["DL"], delta["DirectLabor$"], check_names=False, rtol=1e-6, atol=1e-6
+    )
+    pd.testing.assert_series_equal(
+        proj.bases["DLH"] - baseline.bases["DLH"], delta["DirectLaborHrs"], check_names=False, rtol=1e-6, atol=1e-6
+    )
+    expected_tci = delta[["DirectLabor$", "Subk", "ODC", "Travel"]].sum(axis=1)
+    pd.testing.assert_series_equal(
+        proj.bases["TCI"] - baseline.bases["TCI"], expected_tci, check_names=False, rtol=1e-6, atol=1e-6
+    )
+
+
+def test_scenarios_do_not_mutate_shared_baseline() -> None:
+    baseline = _make_baseline()
+    projects = sorted(baseline.direct_by_project["Project"].unique())
+    before_pools = baseline.pools.copy()
+    before_bases = baseline.bases.copy()
+    before_direct = baseline.direct_by_project.copy()
+
+    for seed in range(3):
+        apply_scenario_events(baseline, _make_events(40, baseline.pools.index, projects, seed=seed), scenario="Test")
+
+    pd.testing.assert_frame_equal(baseline.pools, before_pools)
+    pd.testing.assert_frame_equal(baseline.bases, before_bases)
+    pd.testing.assert_frame_equal(baseline.direct_by_project, before_direct)
+
+
+def test_untouched_columns_share_baseline_memory() -> None:
+    baseline = _make_baseline()
+    events = pd.DataFrame(
+        [{"Scenario": "Hire", "EffectivePeriod": pd.Period("2025-06", freq="M"), "Project": "", "DeltaPoolFringe": 100.0}]
+    )
+    proj = apply_scenario_events(baseline, events, scenario="Hire")
+
+    assert not np.shares_memory(proj.pools["Fringe"].to_numpy(), baseline.pools["Fringe"].to_numpy())
+    assert np.shares_memory(proj.pools["Overhead"].to_numpy(), baseline.pools["Overhead"].to_numpy())
+    # No project-level events in the scenario, so the project frame is shared outright.
+    assert proj.direct_by_project is baseline.direct_by_project
@@ -0,0 +1,107 @@
+"""Tests for the debounced auto-forecast scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from indirectrates.scheduler import ForecastScheduler
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.0, fail_fy: int | None = None) -> None:
+        self.calls: list[tuple[str, int]] = []
+        self.delay = delay
+        self.fail_fy = fail_fy
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __call__(self, user_id: str, fy_id: int) -> int | None:
+        with self.lock:
+            self.calls.append((user_id, fy_id))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if fy_id == self.fail_fy:
+            raise RuntimeError("boom")
+        return 100 + fy_id
+
+
+def _wait_idle(scheduler: ForecastScheduler, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        stats = scheduler.stats()
+        if stats["queue_depth"] == 0 and stats["running"] == 0:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"scheduler did not drain: {scheduler.stats()}")
+
+
+def test_burst_of_triggers_runs_one_forecast() -> None:
+    run = _Recorder()
+    scheduler = ForecastScheduler(run, debounce_seconds=0.1, max_workers=2)
+    try:
+        job_ids = {scheduler.trigger("u1", 7) for _ in range(10)}
+        assert len(job_ids) == 1
+        assert scheduler.stats()["queue_depth"] == 1
+        _wait_idle(scheduler)
+
+        assert run.calls == [("u1", 7)]
+        job = scheduler.get(job_ids.pop())
+        assert job.status == "succeeded" and job.run_id == 107 and job.triggers == 10
+        assert scheduler.stats()["coalesced_triggers"] == 9
+    finally:
+        scheduler.shutdown(wait=True)
+
+
+def test_trigger_during_run_queues_single_follow_up() -> None:
+    run = _Recorder(delay=0.2)
+    scheduler = ForecastScheduler(run, debounce_seconds=0.01, max_workers=2)
+    try:
+        first = scheduler.trigger("u1", 7)
+        while scheduler.get(first).status != "running":
+            time.sleep(0.005)
+        follow_ups = {scheduler.trigger("u1", 7) for _ in range(3)}
+        assert len(follow_ups) == 1 and first not in follow_ups
+        _wait_idle(scheduler)
+
+        assert run.calls == [("u1", 7), ("u1", 7)]
+        assert run.peak == 1  # never two forecasts for the same FY at once
+    finally:
+        scheduler.shutdown(wait=True)
+
+
+def test_worker_pool_bounds_concurrency_and_records_failures() -> None:
+    run = _Recorder(delay=0.05, fail_fy=3)
+    scheduler = ForecastScheduler(run, debounce_seconds=0.0, max_workers=2)
+    try:
+        jobs = {fy: scheduler.trigger("u1", fy) for fy in range(6)}
+        _wait_idle(scheduler)
+
+        assert sorted(fy for _, fy in run.calls) == list(range(6))
+        assert run.peak <= 2
+        failed = scheduler.get(jobs[3])
+        assert failed.status == "failed" and "boom" in failed.error
+        stats = scheduler.stats()
+        assert stats["succeeded"] == 5 and stats["failed"] == 1
+    finally:
+        scheduler.shutdown(wait=True)
+
+
+def test_auto_forecasts_run_in_the_forecast_pool_unless_in_process(monkeypatch) -> None:
+    from indirectrates import scheduler, server
+    from indirectrates.forecast_pool import forecast_pool
+
+    calls = []
+    monkeypatch.setattr(forecast_pool, "call", lambda fn, *args: calls.append(("pool", fn, args)) or 11)
+    monkeypatch.setattr(server, "_run_db_forecast", lambda *args: calls.append(("thread", None, args)) or 12)
+
+    monkeypatch.delenv("AUTO_FORECAST_IN_PROCESS", raising=False)
+    assert scheduler._run_db_forecast("u1", 7) == 11
+    monkeypatch.setenv("AUTO_FORECAST_IN_PROCESS", "1")
+    assert scheduler._run_db_forecast("u1", 7) == 12
+
+    assert [(kind, args) for kind, _, args in calls] == [("pool", ("u1", 7)), ("thread", ("u1", 7))]
@@ -0,0 +1,139 @@
+"""Equivalence of the SQL-backed actual aggregates with the pandas path and the aggregate store."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from indirectrates import sql_aggregates
+from indirectrates.aggregate_store import AggregateStore
+from indirectrates.config import RateConfig
+from indirectrates.io import load_inputs, normalize_period_column
+from indirectrates.mapping import map_accounts_to_pools
+from indirectrates.model import compute_actual_aggregates
+from indirectrates.sql_aggregates import compute_actual_aggregates_sql
+from indirectrates.synth import SynthSpec, generate_synthetic_dataset
+
+
+class _FakeTotals:
+    """Emulates the gl_period_totals / fy_account_map queries over in-memory frames."""
+
+    def __init__(self, gl: pd.DataFrame, direct: pd.DataFrame, account_map: pd.DataFrame) -> None:
+        self.gl = gl.assign(Account=gl["Account"].astype(str), Entity=gl["Entity"].fillna(""))
+        self.direct = direct
+        self.account_map = account_map.assign(Account=account_map["Account"].astype(str))
+
+    def signatures(self, conn, table, user_id, fy_id):
+        df = self.gl if table == "gl_entries" else self.direct
+        return {p: (int(n), 0) for p, n in df.groupby("Period").size().items()}
+
+    def direct_totals(self, conn, user_id, fy_id, periods=None):
+        return self.direct.groupby(["Period", "Project"], as_index=False).sum(numeric_only=True)
+
+    def gl_totals(self, conn, user_id, fy_id, periods=None):
+        totals = self.gl.groupby(["Period", "Account", "Entity"], as_index=False).agg(
+            Amount=("Amount", "sum"), RowCount=("Amount", "size")
+        )
+        return totals.assign(Entity=totals["Entity"].replace("", float("nan")))
+
+    def pool_amounts(self, conn, user_id, fy_id, exclude_pools=(), entity=None):
+        rows = self.gl.merge(self.account_map[["Account", "Pool", "IsUnallowable"]], on="Account", how="inner")
+        rows = rows[~rows["IsUnallowable"].astype(bool) & ~rows["Pool"].isin(list(exclude_pools))]
+        if entity is not None:
+            rows = rows[rows["Entity"] == entity]
+        return rows.groupby(["Period", "Pool"], as_index=False)["Amount"].sum()
+
+    def base_amounts(self, conn, user_id, fy_id, base_account_map):
+        parts = [
+            self.gl[self.gl["Account"].isin([str(a) for a in accounts])].assign(BaseKey=key)
+            for key, accounts in base_account_map.items()
+        ]
+        return pd.concat(parts).groupby(["BaseKey", "Period"], as_index=False)["Amount"].sum()
+
+    def unmapped(self, conn, user_id, fy_id):
+        return int((~self.gl["Account"].isin(self.account_map["Account"])).sum())
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    out = tmp_path / "data"
+    generate_synthetic_dataset(out, SynthSpec(start="2024-01", months=8, projects=3, seed=5))
+    return out
+
+
+def _scenario(data_dir: Path, monkeypatch, gl_primary: bool):
+    inputs = load_inputs(data_dir)
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    if gl_primary:
+        cfg = replace(cfg, base_account_map={"DL": ["6000"], "TCI": ["6000", "6100", "7000"]})
+
+    gl = inputs.gl_actuals.assign(Account=inputs.gl_actuals["Account"].astype(str))
+    gl["Entity"] = ["East" if i % 3 else "West" for i in range(len(gl))]
+    gl.loc[len(gl)] = {"Period": "2024-02", "Account": "9999", "Amount": 10.0, "Entity": None}  # unmapped
+    gl.loc[len(gl)] = {"Period": "2024-03", "Account": "7000", "Amount": 25.0, "Entity": "East"}
+    # An allowable mapping into a pool the config treats as unallowable by name.
+    account_map = pd.concat(
+        [inputs.account_map, pd.DataFrame([{"Account": "7000", "Pool": "Unallowable", "IsUnallowable": False}])],
+        ignore_index=True,
+    )
+
+    fake = _FakeTotals(gl, inputs.direct_costs, account_map)
+    monkeypatch.setattr(sql_aggregates.db, "entry_period_signatures", fake.signatures)
+    monkeypatch.setattr(sql_aggregates.db, "read_direct_cost_totals_df", fake.direct_totals)
+    monkeypatch.setattr(sql_aggregates.db, "read_gl_totals_df", fake.gl_totals)
+    monkeypatch.setattr(sql_aggregates.db, "read_period_pool_amounts", fake.pool_amounts)
+    monkeypatch.setattr(sql_aggregates.db, "read_gl_base_amounts", fake.base_amounts)
+    monkeypatch.setattr(sql_aggregates.db, "count_unmapped_gl_entries", fake.unmapped)
+    return inputs, cfg, gl, account_map
+
+
+def _assert_same_actuals(got, exp) -> None:
+    pd.testing.assert_frame_equal(got.pools, exp.pools, check_names=False)
+    pd.testing.assert_frame_equal(got.bases, exp.bases, check_names=False)
+    pd.testing.assert_frame_equal(
+        got.direct_by_project.sort_values(["Period", "Project"], ignore_index=True),
+        exp.direct_by_project.sort_values(["Period", "Project"], ignore_index=True),
+    )
+    assert got.warnings == exp.warnings
+
+
+@pytest.mark.parametrize("gl_primary", [False, True])
+@pytest.mark.parametrize("entity", [None, "East"])
+def test_sql_path_matches_pandas_path(data_dir: Path, monkeypatch, gl_primary: bool, entity: str | None) -> None:
+    inputs, cfg, gl, account_map = _scenario(data_dir, monkeypatch, gl_primary)
+
+    actuals = compute_actual_aggregates_sql(None, "u1", 1, cfg, entity=entity)
+
+    gl_mapped, map_warnings = map_accounts_to_pools(normalize_period_column(gl), account_map)
+    pools, bases, direct_by_project, warnings = compute_actual_aggregates(
+        gl_mapped, normalize_period_column(inputs.direct_costs), cfg, entity
+    )
+    pd.testing.assert_frame_equal(actuals.pools, pools, check_names=False)
+    pd.testing.assert_frame_equal(actuals.bases, bases)
+    pd.testing.assert_frame_equal(
+        actuals.direct_by_project.sort_values(["Period", "Project"], ignore_index=True),
+        direct_by_project.sort_values(["Period", "Project"], ignore_index=True),
+    )
+    assert actuals.warnings == map_warnings + warnings
+
+
+@pytest.mark.parametrize("gl_primary", [False, True])
+@pytest.mark.parametrize("entity", [None, "East"])
+def test_sql_path_matches_aggregate_store(data_dir: Path, monkeypatch, gl_primary: bool, entity: str | None) -> None:
+    # /forecast aggregates in SQL while auto-forecasts use the in-memory store; both must agree.
+    _, cfg, _, account_map = _scenario(data_dir, monkeypatch, gl_primary)
+
+    stored = AggregateStore(max_entries=1).get(None, "u1", {"id": 1, "config_version": 0}, cfg, account_map, entity)
+
+    _assert_same_actuals(compute_actual_aggregates_sql(None, "u1", 1, cfg, entity=entity), stored)
+
+
+def test_returns_none_without_gl_entries(monkeypatch) -> None:
+    direct = pd.DataFrame({"Period": ["2024-01"], "Project": ["P1"], "DirectLabor$": [1.0]})
+    monkeypatch.setattr(sql_aggregates.db, "read_direct_cost_totals_df", lambda *a, **k: direct)
+    monkeypatch.setattr(sql_aggregates.db, "entry_period_signatures", lambda *a, **k: {})
+    cfg = RateConfig.from_yaml(Path("configs/default_rates.yaml"))
+    assert compute_actual_aggregates_sql(None, "u1", 1, cfg) is None
@@ -0,0 +1,90 @@
+"""Tests for the grouped-cumsum YTD rate engine in ytd.compute_ytd_rates."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indirectrates.ytd import compute_ytd_rates
+
+
+def _loop_ytd(
+    pools: pd.DataFrame,
+    bases: pd.DataFrame,
+    rate_definitions: dict[str, dict[str, Any]],
+    fy_start: pd.Period,
+) -> pd.DataFrame:
+    """Reference per-period implementation (the original windowed loop)."""
+    all_periods = pools.index.sort_values()
+    records: list[dict[str, Any]] = []
+    for period in all_periods:
+        if period.month >= fy_start.month:
+            fy_begin = pd.Period(year=period.year, month=fy_start.month, freq="M")
+        else:
+            fy_begin = pd.Period(year=period.year - 1, month=fy_start.month, freq="M")
+        window = all_periods[(all_periods >= fy_begin) & (all_periods <= period)]
+        row: dict[str, Any] = {"Period": period}
+        for rate_name, rate_def in rate_definitions.items():
+            cum_pool = pools.reindex(window).reindex(columns=rate_def["pool"], fill_value=0.0).sum().sum()
+            base_key = rate_def["base"]
+            cum_base = bases.reindex(window)[base_key].sum() if base_key in bases.columns else 0.0
+            row[rate_name] = float(cum_pool / cum_base) if cum_base != 0 else 0.0
+        records.append(row)
+    return pd.DataFrame(records).set_index("Period")
+
+
+def _random_inputs(seed: int) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, dict[str, Any]], pd.Period]:
+    rng = np.random.default_rng(seed)
+    months = int(rng.integers(1, 60))
+    periods = pd.period_range(f"{rng.integers(2019, 2026)}-{rng.integers(1, 13):02d}", periods=months, freq="M")
+    # Shuffle so the engine has to sort, and leave holes/NaNs/zeros in the bases.
+    order = rng.permutation(months)
+    pools = pd.DataFrame(
+        {name: rng.uniform(0, 100_000, months) for name in ["Fringe", "Overhead", "G&A"]},
+        index=periods[order],
+    )
+    pools.iloc[rng.random(months) < 0.1, 0] = np.nan
+    bases = pd.DataFrame(
+        {
+            "TL": rng.uniform(-1_000, 200_000, months),
+            "DL": np.where(rng.random(months) < 0.3, 0.0, rng.uniform(0, 150_000, months)),
+        },
+        index=periods,
+    )
+    bases = bases.drop(index=periods[rng.random(months) < 0.15])
+    rate_definitions = {
+        "Fringe": {"pool": ["Fringe"], "base": "TL"},
+        "Overhead": {"pool": ["Overhead", "Fringe"], "base": "DL"},
+        "G&A": {"pool": ["G&A", "Missing Pool"], "base": "TL"},
+        "NoBase": {"pool": ["G&A"], "base": "TCI"},
+    }
+    fy_start = pd.Period(f"2024-{rng.integers(1, 13):02d}", freq="M")
+    return pools, bases, rate_definitions, fy_start
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_grouped_cumsum_matches_windowed_loop(seed: int) -> None:
+    pools, bases, rate_definitions, fy_start = _random_inputs(seed)
+
+    got = compute_ytd_rates(pools, bases, rate_definitions, fy_start)
+    expected = _loop_ytd(pools, bases, rate_definitions, fy_start)
+
+    pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-9, atol=1e-12)
+
+
+def test_ytd_resets_at_fiscal_year_start() -> None:
+    periods = pd.period_range("2024-08", periods=4, freq="M")
+    pools = pd.DataFrame({"Fringe": [10.0, 20.0, 30.0, 40.0]}, index=periods)
+    bases = pd.DataFrame({"TL": [100.0, 100.0, 100.0, 100.0]}, index=periods)
+
+    ytd = compute_ytd_rates(pools, bases, {"Fringe": {"pool": ["Fringe"], "base": "TL"}}, pd.Period("2024-10", freq="M"))
+
+    assert list(ytd["Fringe"]) == pytest.approx([0.10, 0.15, 0.30, 0.35])
+
+
+def test_empty_pools_return_empty_frame() -> None:
+    empty = pd.DataFrame(index=pd.PeriodIndex([], freq="M"))
+    assert compute_ytd_rates(empty, empty, {}, pd.Period("2024-01", freq="M")).empty
@@ -0,0 +1,166 @@
+"""Tests for the streaming pack writer and forecast-run persistence."""
+
+from __future__ import annotations
+
+import io
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from indirectrates import db, server
+from indirectrates.zipstream import iter_zip_dir
+
+
+@pytest.fixture
+def pack_dir(tmp_path: Path) -> Path:
+    out = tmp_path / "out"
+    (out / "charts").mkdir(parents=True)
+    (out / "charts" / "rates.png").write_bytes(os.urandom(300_000))
+    (out / "narrative.md").write_text("# Base\n" * 2000)
+    return out
+
+
+def test_chunks_form_a_valid_archive_and_stay_bounded(pack_dir: Path) -> None:
+    chunks = list(iter_zip_dir(pack_dir, chunk_size=64 * 1024))
+
+    assert len(chunks) > 3
+    assert max(len(c) for c in chunks) < 2 * 64 * 1024
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert sorted(zf.namelist()) == ["charts/rates.png", "narrative.md"]
+        assert zf.read("charts/rates.png") == (pack_dir / "charts" / "rates.png").read_bytes()
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_runs(monkeypatch) -> dict:
+    state: dict = {"conn": _FakeConn(), "rows": {}, "deleted": []}
+
+    def save(conn, id, chunks, **fields):
+        assert not conn.closed and not isinstance(chunks, bytes)
+        pieces = list(chunks)
+        state["max_chunk"] = max(len(p) for p in pieces)
+        state["rows"][id] = {**fields, "output_zip": b"".join(pieces)}
+        return id
+
+    monkeypatch.setattr(server, "get_connection", lambda: state["conn"])
+    monkeypatch.setattr(server, "save_forecast_run_chunks", save)
+    monkeypatch.setattr(server, "_delete_run_artifacts", state["deleted"].append)
+    return state
+
+
+_RUN = {
+    "id": 42,
+    "fiscal_year_id": 7,
+    "scenario": "",
+    "forecast_months": 12,
+    "run_rate_months": 3,
+    "assumptions_json": "{}",
+    "trigger": "manual",
+}
+
+
+def test_saved_pack_is_exactly_what_was_streamed(pack_dir: Path, fake_runs: dict, monkeypatch) -> None:
+    monkeypatch.setattr(server, "CHUNK_SIZE", 64 * 1024)
+    streamed = b"".join(server._pack_chunks(pack_dir, dict(_RUN)))
+
+    assert fake_runs["rows"][42]["output_zip"] == streamed
+    assert fake_runs["max_chunk"] <= 64 * 1024 < len(streamed)
+    assert fake_runs["conn"].closed
+
+
+def test_pack_is_saved_before_the_client_reads_anything(pack_dir: Path, fake_runs: dict) -> None:
+    chunks = server._pack_chunks(pack_dir, dict(_RUN))
+
+    # Saved and the connection released before the first chunk is consumed.
+    assert fake_runs["conn"].closed
+    with zipfile.ZipFile(io.BytesIO(fake_runs["rows"][42]["output_zip"])) as zf:
+        assert zf.testzip() is None
+    next(chunks)
+    chunks.close()  # what _stream_pack does when the client goes away
+
+
+def test_failed_save_removes_the_run_artifacts(pack_dir: Path, fake_runs: dict, monkeypatch) -> None:
+    def broken(conn, **fields):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(server, "save_forecast_run_chunks", broken)
+    with pytest.raises(RuntimeError):
+        server._pack_chunks(pack_dir, dict(_RUN))
+    assert fake_runs["deleted"] == [42]
+    assert fake_runs["conn"].closed
+
+
+def test_finish_pack_saves_and_cleans_up_before_the_response(pack_dir: Path, fake_runs: dict) -> None:
+    out_root = pack_dir.parent  # _finish_pack reads out_root / "out"
+
+    chunks = server._finish_pack(out_root, dict(_RUN))
+
+    assert 42 in fake_runs["rows"]
+    assert not out_root.exists()
+    assert b"".join(chunks) == fake_runs["rows"][42]["output_zip"]
+
+
+def test_finish_pack_cleans_up_when_saving_fails(pack_dir: Path, fake_runs: dict, monkeypatch) -> None:
+    def broken(conn, **fields):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(server, "save_forecast_run_chunks", broken)
+    with pytest.raises(RuntimeError):
+        server._finish_pack(pack_dir.parent, dict(_RUN))
+    assert not pack_dir.parent.exists()
+    assert fake_runs["deleted"] == [42]
+
+
+class _RecordingCursor:
+    def __init__(self, log: list) -> None:
+        self.log = log
+
+    def __enter__(self) -> "_RecordingCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        self.log.append((" ".join(sql.split()), params))
+
+    def fetchone(self) -> dict:
+        return {"id": 42}
+
+
+class _RecordingConn:
+    def __init__(self) -> None:
+        self.log: list = []
+        self.committed = False
+
+    def cursor(self) -> _RecordingCursor:
+        return _RecordingCursor(self.log)
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        pass
+
+
+def test_save_forecast_run_chunks_sends_one_chunk_per_statement() -> None:
+    conn = _RecordingConn()
+    fields = {k: v for k, v in _RUN.items() if k != "id"}
+
+    assert db.save_forecast_run_chunks(conn, chunks=iter([b"PK", b"abc", b"d"]), id=42, **fields) == 42
+
+    staged = [params[1].adapted for sql, params in conn.log if sql.startswith("INSERT INTO forecast_run_chunks")]
+    assert staged == [b"PK", b"abc", b"d"]
+    final_sql, final_params = conn.log[-1]
+    assert "string_agg(data, ''::bytea ORDER BY seq)" in final_sql and final_params[0] == 42
+    assert conn.committed